@@ -0,0 +1,101 @@
+"""
+Benchmark of the vectorized eye tracking metrics, of the cGOM loader and of the dropdown lists extraction
+against their former row-by-row implementations.
+
+Run it from the root directory of the repository:
+    python Tests/benchmark.py [number of fixations]
+"""
+import importlib.util
+import os
+import sys
+import tempfile
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from docx import Document
+
+import reference_implementations as reference
+from docx_package.dropdown_lists import DropDownLists
+from docx_package.input_form import InputForm
+from eye_tracking_package.cGOM_data import cGOM
+from eye_tracking_package.eye_tracking import EyeTracking
+from test_eye_tracking import synthetic_dataframe
+
+# text input form whose dropdown lists are extracted
+TEXT_INPUT_PATH = 'Inputs/Text_input_form.docx'
+
+
+def best_time(function, repeat: int = 3) -> float:
+    """
+    Args:
+        function: Function without arguments that is timed.
+        repeat (optional): Number of times the function is called.
+
+    Returns:
+        Shortest duration of a call in seconds.
+    """
+
+    return min(timeit.repeat(function, number=1, repeat=repeat))
+
+
+def compare(name: str, former, vectorized):
+    """
+    Print the durations of the former and of the vectorized implementation of a function and the speedup.
+    """
+
+    former_time = best_time(former)
+    vectorized_time = best_time(vectorized)
+    print('{:<22}{:>12.4f} s{:>12.4f} s{:>10.1f}x'.format(name, former_time, vectorized_time,
+                                                          former_time / vectorized_time))
+
+
+def main(fixations_number: int = 100000):
+    aois = ['Bottle', 'Cap', 'Background', 'Hand', 'Table', 'Screen']
+    dataframe = synthetic_dataframe(fixations_number, aois)
+
+    print('{} fixations on {} AOIs'.format(fixations_number, len(aois)))
+    print('{:<22}{:>14}{:>14}{:>11}'.format('', 'former', 'vectorized', 'speedup'))
+
+    compare('Dwell times',
+            lambda: reference.dwell_times(aois, dataframe),
+            lambda: EyeTracking.dwell_times(aois, dataframe))
+    compare('Transitions',
+            lambda: reference.transitions(aois, dataframe),
+            lambda: EyeTracking.transitions(aois, dataframe))
+    compare('Revisits',
+            lambda: reference.revisits(aois, dataframe),
+            lambda: EyeTracking.revisits(aois, dataframe))
+
+    # write the fixations in a cGOM .txt file
+    with tempfile.TemporaryDirectory() as directory:
+        txt_file_path = os.path.join(directory, 'Participant1.txt')
+        with open(txt_file_path, 'w') as txt_file:
+            txt_file.write('start_time\tend_time\tlabel\n')
+            for label, start_time, end_time in zip(dataframe.index, dataframe[EyeTracking.START_TIME],
+                                                   dataframe[EyeTracking.END_TIME]):
+                txt_file.write('{}\t{}\t{}\n'.format(start_time, end_time, label))
+
+        compare('cGOM loader',
+                lambda: reference.cGOM_dataframe(txt_file_path),
+                lambda: cGOM().make_dataframe(txt_file_path))
+
+    # the former extraction parsed the form a second time with BeautifulSoup and searched all its tables
+    # on every call, the values of all tables are now read in one pass over the tree that python-docx loaded
+    if os.path.exists(TEXT_INPUT_PATH):
+        if importlib.util.find_spec('bs4') is None:
+            print('Dropdown lists: BeautifulSoup (bs4) is needed to run the former extraction')
+            return
+
+        def former_dropdown_lists():
+            text_input_soup = reference.dropdown_soup(TEXT_INPUT_PATH)
+            return [reference.dropdown_values_from_soup(text_input_soup, table_index)
+                    for table_index in range(len(InputForm.TABLE_NAMES))]
+
+        text_input_document = Document(TEXT_INPUT_PATH)
+        compare('Dropdown lists',
+                former_dropdown_lists,
+                lambda: DropDownLists.get_from_all_tables(text_input_document))
+
+if __name__ == '__main__':
+    main(*[int(argument) for argument in sys.argv[1:]])
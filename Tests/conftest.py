@@ -0,0 +1,5 @@
+import os
+import sys
+
+# the tests import the packages of the repository from its root directory
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
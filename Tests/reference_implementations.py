@@ -0,0 +1,131 @@
+"""
+Former row-by-row implementations of the eye tracking metrics, of the cGOM loader and of the dropdown lists extraction.
+
+They are kept as references for the regression tests and the benchmark of the vectorized implementations.
+"""
+from itertools import islice
+from zipfile import ZipFile
+from typing import List
+import numpy as np
+import pandas as pd
+from lxml import etree
+
+# namespace of the main part of a .docx document
+W = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+
+
+def dwell_times(aois: List[str], dataframe: pd.DataFrame) -> pd.DataFrame:
+    """Row-by-row computation of EyeTracking.dwell_times."""
+
+    dwell_times_frames = []
+
+    previous_aoi = dataframe.index[0]
+    previous_start = dataframe.iloc[0]['Start time']
+    previous_end = dataframe.iloc[0]['End time']
+
+    for aoi, row in dataframe.iterrows():
+        if aoi == previous_aoi:
+            previous_end = row['End time']
+        else:
+            dwell_times_frames.append(pd.DataFrame(data=previous_end - previous_start,
+                                                   index=[previous_aoi],
+                                                   columns=['Dwell times']
+                                                   ))
+            previous_start = row['Start time']
+            previous_end = row['End time']
+        previous_aoi = aoi
+
+    dwell_times_df = pd.concat(dwell_times_frames) if dwell_times_frames else pd.DataFrame(columns=['Dwell times'])
+
+    statistics_frames = []
+    for aoi in aois:
+        data_of_aoi = dwell_times_df[dwell_times_df.index == aoi]['Dwell times'].astype(float)
+        statistics_frames.append(pd.DataFrame(data=data_of_aoi.sum(), index=[aoi], columns=['Sum']))
+        statistics_frames.append(pd.DataFrame(data=data_of_aoi.mean(), index=[aoi], columns=['Mean']))
+        statistics_frames.append(pd.DataFrame(data=data_of_aoi.max(), index=[aoi], columns=['Max']))
+        statistics_frames.append(pd.DataFrame(data=data_of_aoi.min(), index=[aoi], columns=['Min']))
+
+    return pd.concat([dwell_times_df] + statistics_frames, sort=False)
+
+
+def transitions(aois: List[str], dataframe: pd.DataFrame) -> pd.DataFrame:
+    """Row-by-row computation of EyeTracking.transitions, the fixations of AOIs that are not in the list are skipped."""
+
+    transitions_table = pd.DataFrame(index=aois, columns=aois, data=np.zeros((len(aois), len(aois))))
+
+    all_fixations_aoi = dataframe.index.values.tolist()
+    last_fixation_aoi = all_fixations_aoi[0]
+    for fixation_aoi in all_fixations_aoi[1:]:
+        if last_fixation_aoi in aois and fixation_aoi in aois:
+            transitions_table.loc[last_fixation_aoi, fixation_aoi] += 1
+        last_fixation_aoi = fixation_aoi
+
+    return transitions_table
+
+
+def revisits(aois: List[str], dataframe: pd.DataFrame) -> List[int]:
+    """Row-by-row computation of EyeTracking.revisits."""
+
+    return [len(dataframe[dataframe.index == aoi]) - 1 for aoi in aois]
+
+
+def cGOM_dataframe(txt_file_path: str) -> pd.DataFrame:
+    """Line-by-line parsing of a cGOM .txt file, as cGOM.make_dataframe did."""
+
+    start_times_list = []
+    end_times_list = []
+    labels_list = []
+
+    with open(txt_file_path, 'r') as file:
+        for line in islice(file, 1, None):
+            start_times_list.append(float(line.split()[0]))
+            end_times_list.append(float(line.split()[1]))
+            labels_list.append(line.split()[2])
+
+    # rename BG in Background
+    labels_list = ['Background' if label == 'BG' else label for label in labels_list]
+
+    dataframe = pd.DataFrame(index=pd.Index(labels_list, dtype=object),
+                             data={'Start time': start_times_list, 'End time': end_times_list}
+                             )
+    dataframe['Fixation time'] = np.array(end_times_list) - np.array(start_times_list)
+
+    return dataframe
+
+
+def document_tree(text_input_path: str) -> etree.ElementBase:
+    """XML tree of the main part of a .docx document."""
+
+    with ZipFile(text_input_path) as zip_file:
+        return etree.fromstring(zip_file.read('word/document.xml'))
+
+
+def dropdown_values(document: etree.ElementBase, table_index: int) -> List[str]:
+    """
+    Extraction of the values of the dropdown lists of a table with a search over the whole document per call,
+    equivalent to the former BeautifulSoup extraction without needing BeautifulSoup.
+    """
+
+    table = document.findall('.//{{{}}}tbl'.format(W))[table_index]
+
+    return [content.find('.//{{{}}}t'.format(W)).text for content in table.iterfind('.//{{{}}}sdtContent'.format(W))]
+
+
+def dropdown_soup(text_input_path: str):
+    """BeautifulSoup object of the main part of a .docx document, as DropDownLists.get_soup made it."""
+
+    # BeautifulSoup is not a dependency of the repository anymore, it is only needed to run the former extraction
+    from bs4 import BeautifulSoup
+
+    with ZipFile(text_input_path) as zip_file:
+        xml_data = zip_file.read('word/document.xml')
+
+    return BeautifulSoup(xml_data, 'xml')
+
+
+def dropdown_values_from_soup(text_input_soup, table_index: int) -> List[str]:
+    """Former DropDownLists.get_from_table, which searched all tables of the document on every call."""
+
+    tables = text_input_soup.find_all('tbl')
+
+    return [content.find('t').string for content in tables[table_index].find_all('sdtContent')]
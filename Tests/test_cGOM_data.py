@@ -0,0 +1,30 @@
+import os
+import pandas as pd
+import pytest
+
+import reference_implementations as reference
+from eye_tracking_package.cGOM_data import cGOM
+
+cGOM_DIRECTORY_PATH = os.path.join(os.path.dirname(__file__), 'cGOM_data')
+
+
+@pytest.mark.parametrize('file_name', sorted(os.listdir(cGOM_DIRECTORY_PATH)))
+def test_make_dataframe(file_name):
+    txt_file_path = os.path.join(cGOM_DIRECTORY_PATH, file_name)
+
+    dataframe = cGOM().make_dataframe(txt_file_path)
+
+    pd.testing.assert_frame_equal(dataframe, reference.cGOM_dataframe(txt_file_path))
+    assert dataframe.index.dtype == object
+    assert dataframe.index.name is None
+    assert 'BG' not in dataframe.index
+
+
+def test_make_dataframe_of_an_empty_file(tmp_path):
+    txt_file_path = tmp_path / 'Participant1.txt'
+    txt_file_path.write_text('')
+
+    dataframe = cGOM().make_dataframe(str(txt_file_path))
+
+    assert dataframe.empty
+    assert list(dataframe.columns) == [cGOM.START_TIME, cGOM.END_TIME, cGOM.FIXATION_TIME]
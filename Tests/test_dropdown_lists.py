@@ -0,0 +1,24 @@
+import os
+import pytest
+
+import reference_implementations as reference
+from docx_package.input_form import InputForm
+
+INPUTS_DIRECTORY_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'Inputs')
+
+
+@pytest.fixture(scope='module', params=['Text_input_form.docx', 'Text_input_test1.docx'])
+def text_input_path(request):
+    return os.path.join(INPUTS_DIRECTORY_PATH, request.param)
+
+
+def test_dropdown_values(text_input_path):
+    input_form = InputForm(text_input_path)
+    document = reference.document_tree(text_input_path)
+
+    for table_index, table_name in enumerate(InputForm.TABLE_NAMES):
+        assert input_form.dropdown_values(table_name) == reference.dropdown_values(document, table_index)
+
+
+def test_participant_plots_dropdown(text_input_path):
+    assert InputForm(text_input_path).dropdown_values('Study table') == ['No']
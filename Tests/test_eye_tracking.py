@@ -0,0 +1,57 @@
+import os
+import numpy as np
+import pandas as pd
+import pytest
+
+import reference_implementations as reference
+from eye_tracking_package.cGOM_data import cGOM
+from eye_tracking_package.eye_tracking import EyeTracking
+
+cGOM_DIRECTORY_PATH = os.path.join(os.path.dirname(__file__), 'cGOM_data')
+cGOM_FILES = sorted(os.listdir(cGOM_DIRECTORY_PATH))
+
+
+def synthetic_dataframe(fixations_number: int, labels: list, seed: int = 0) -> pd.DataFrame:
+    """Random fixations on the labels, with runs of consecutive fixations on the same label."""
+
+    rng = np.random.default_rng(seed)
+    index = pd.Index(np.array(labels, dtype=object)[rng.integers(0, 3, fixations_number).cumsum() % len(labels)],
+                     dtype=object)
+    start_times = np.cumsum(rng.random(fixations_number))
+    end_times = start_times + rng.random(fixations_number) / 2
+
+    return pd.DataFrame(index=index,
+                        data={EyeTracking.START_TIME: start_times,
+                              EyeTracking.END_TIME: end_times,
+                              EyeTracking.FIXATION_TIME: end_times - start_times}
+                        )
+
+
+def datasets():
+    for file_name in cGOM_FILES:
+        dataframe = cGOM().make_dataframe(os.path.join(cGOM_DIRECTORY_PATH, file_name))
+        yield pytest.param(EyeTracking.areas_of_interest(dataframe), dataframe, id=file_name)
+
+    # the AOIs of the list that are never looked at and the labels that are not in the list must be handled
+    dataframe = synthetic_dataframe(2000, ['Bottle', 'Cap', 'Background', 'Hand', 'Table'])
+    yield pytest.param(['Table', 'Bottle', 'Cap', 'Screen', 'Background'], dataframe, id='synthetic')
+
+
+@pytest.mark.parametrize('aois, dataframe', datasets())
+def test_dwell_times(aois, dataframe):
+    pd.testing.assert_frame_equal(EyeTracking.dwell_times(aois, dataframe),
+                                  reference.dwell_times(aois, dataframe),
+                                  check_index_type=False)
+
+
+@pytest.mark.parametrize('aois, dataframe', datasets())
+def test_transitions(aois, dataframe):
+    expected = reference.transitions(aois, dataframe)
+
+    pd.testing.assert_frame_equal(EyeTracking.transitions(aois, dataframe), expected)
+    pd.testing.assert_frame_equal(EyeTracking.transitions(aois, dataframe, sparse=True).sparse.to_dense(), expected)
+
+
+@pytest.mark.parametrize('aois, dataframe', datasets())
+def test_revisits(aois, dataframe):
+    assert EyeTracking.revisits(aois, dataframe) == reference.revisits(aois, dataframe)
@@ -0,0 +1,66 @@
+import os
+import numpy as np
+import pandas as pd
+import matplotlib
+
+from eye_tracking_package.figure_cache import FigureCache
+
+
+def test_key_hashes_the_whole_series():
+    series = pd.Series(np.arange(2000.0))
+    changed_series = series.copy()
+    changed_series[1000] = -1.0
+
+    # both series have the same shortened representation
+    assert repr(series) == repr(changed_series)
+
+    key = FigureCache().key('pieplot', {'data_vector': series})
+    assert FigureCache().key('pieplot', {'data_vector': changed_series}) != key
+
+
+def test_key_hashes_lists_element_by_element():
+    labels = ['Label {}'.format(index) for index in range(2000)]
+    changed_labels = labels[:1000] + ['Other label'] + labels[1001:]
+
+    key = FigureCache().key('pieplot', {'labels_list': labels})
+
+    assert FigureCache().key('pieplot', {'labels_list': list(labels)}) == key
+    assert FigureCache().key('pieplot', {'labels_list': changed_labels}) != key
+    assert FigureCache().key('pieplot', {'labels_list': tuple(labels)}) != key
+
+
+def test_key_depends_on_the_parameters_of_matplotlib():
+    plot_arguments = {'data_frame': pd.DataFrame({'A': [1.0, 2.0]}), 'figure_save_path': 'Plot.png'}
+    key = FigureCache().key('barplot', plot_arguments)
+
+    with matplotlib.rc_context({'figure.figsize': (10, 2)}):
+        assert FigureCache().key('barplot', plot_arguments) != key
+
+    assert FigureCache().key('barplot', dict(plot_arguments, figure_save_path='Other plot.png')) == key
+
+
+def test_store_lists_the_cache_only_to_evict(tmp_path, monkeypatch):
+    figure_cache = FigureCache(str(tmp_path), max_size=250)
+
+    # count how many times the cache directory is listed
+    listed = []
+    cached_figures = figure_cache.cached_figures
+
+    def count_listing():
+        listed.append(True)
+        return cached_figures()
+
+    monkeypatch.setattr(figure_cache, 'cached_figures', count_listing)
+
+    for index in range(2):
+        figure_cache.store('figure{}'.format(index), bytes(100))
+    assert figure_cache.size == 200
+    assert len(listed) == 1
+
+    # the oldest figure is deleted when the cache is bigger than its maximum size
+    os.utime(figure_cache.cache_file_path('figure0'), (0, 0))
+    figure_cache.store('figure2', bytes(100))
+    assert len(listed) == 2
+    assert figure_cache.size == 200
+    assert figure_cache.load('figure0') is None
+    assert figure_cache.load('figure1') == bytes(100)
@@ -0,0 +1,34 @@
+import os
+import pytest
+from docx import Document
+
+from docx_package.input_form import InputForm
+from docx_package.participants_characteristics import ParticipantsCharacteristics
+from docx_package.cached_properties import clear_cached_properties
+
+INPUTS_DIRECTORY_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'Inputs')
+
+
+@pytest.fixture(scope='module')
+def input_form():
+    return InputForm(os.path.join(INPUTS_DIRECTORY_PATH, 'Text_input_test1.docx'))
+
+
+def test_described_rows_are_cached(input_form):
+    characteristics = ParticipantsCharacteristics(Document(), input_form, {})
+    table_scans = input_form.table_scans
+
+    participants_number, described_rows = characteristics.described_rows
+    assert characteristics.described_rows == (participants_number, described_rows)
+    assert participants_number == len(described_rows)
+    assert input_form.table_scans == table_scans + 1
+
+    # the rows are found again once the cached value is forgotten
+    clear_cached_properties(characteristics)
+    assert characteristics.described_rows == (participants_number, described_rows)
+    assert input_form.table_scans == table_scans + 2
+
+
+def test_table_scans_is_read_only(input_form):
+    with pytest.raises(AttributeError):
+        input_form.table_scans += 1
@@ -0,0 +1,23 @@
+from docx import Document
+
+from docx_package.figure_captions import FigureCaptions
+from docx_package.picture import Picture
+
+
+def add_caption(report_document, figure_captions, caption_text):
+    Picture(report_document, figure_captions, None, 'Figure', None, caption_text, None, None, None, None).add_caption()
+
+
+def test_captions_are_numbered_in_each_report():
+    report_document, figure_captions = Document(), FigureCaptions()
+    other_report_document, other_figure_captions = Document(), FigureCaptions()
+
+    add_caption(report_document, figure_captions, 'First figure.')
+    add_caption(other_report_document, other_figure_captions, 'Other figure.')
+    add_caption(report_document, figure_captions, 'Second figure: with a colon.')
+
+    captions = ['Figure 1: First figure.', 'Figure 2: Second figure: with a colon.']
+    assert [paragraph.text for paragraph in report_document.paragraphs] == captions
+    assert [paragraph.text for paragraph in figure_captions.paragraphs] == captions
+    assert figure_captions.captions == {1: 'First figure.', 2: 'Second figure: with a colon.'}
+    assert other_figure_captions.captions == {1: 'Other figure.'}
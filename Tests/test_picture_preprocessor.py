@@ -0,0 +1,41 @@
+import os
+import numpy as np
+from PIL import Image
+
+from docx_package import picture_preprocessor
+from docx_package.picture_preprocessor import PicturePreprocessor
+
+
+def write_noisy_jpeg(picture_path, width):
+    # a strongly compressed noisy picture gets bigger when it is recompressed with a better quality
+    pixels = np.random.default_rng(0).integers(0, 256, (width // 2, width, 3), dtype=np.uint8)
+    Image.fromarray(pixels).save(picture_path, 'JPEG', quality=5)
+
+
+def test_kept_pictures_are_not_preprocessed_again(tmp_path, monkeypatch):
+    cache_directory_path = str(tmp_path / 'Cache')
+    preprocessor = PicturePreprocessor(cache_directory_path=cache_directory_path)
+    picture_path = str(tmp_path / 'Picture.jpg')
+    write_noisy_jpeg(picture_path, preprocessor.max_pixel_width + 100)
+
+    assert preprocessor.prepare_picture(picture_path) == picture_path
+
+    # the second run finds in the cache that the input picture is kept, without resizing it again
+    def fail(*args, **kwargs):
+        raise AssertionError('the picture is preprocessed again')
+
+    monkeypatch.setattr(picture_preprocessor.Image.Image, 'resize', fail)
+    assert PicturePreprocessor(cache_directory_path=cache_directory_path).prepare_picture(picture_path) == picture_path
+
+
+def test_big_pictures_are_downsampled(tmp_path):
+    preprocessor = PicturePreprocessor(cache_directory_path=str(tmp_path / 'Cache'))
+    picture_path = str(tmp_path / 'Picture.png')
+    Image.new('RGB', (2 * preprocessor.max_pixel_width, 100), 'white').save(picture_path)
+
+    prepared_path = preprocessor.prepare_picture(picture_path)
+
+    assert prepared_path != picture_path
+    assert os.path.basename(prepared_path) == 'Picture.png'
+    with Image.open(prepared_path) as prepared_picture:
+        assert prepared_picture.width == preprocessor.max_pixel_width
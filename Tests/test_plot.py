@@ -0,0 +1,87 @@
+import sys
+import numpy as np
+import pandas as pd
+import matplotlib.pyplot as plt
+import pytest
+
+# the peak memory of the process is only measured where the resource module exists, i.e. not on Windows
+try:
+    import resource
+except ImportError:
+    resource = None
+
+from eye_tracking_package.plot import Plot
+
+# number of consecutive plots rendered, as for the participant plots of a large study
+PLOT_COUNT = 200
+
+# number of plots rendered before the memory is measured, so that the caches of matplotlib and seaborn are filled
+WARM_UP_COUNT = 40
+
+# largest growth of the peak memory of the process after the warm-up, a figure that is not freed takes about 1.8 MB
+MAX_MEMORY_GROWTH = 32 * 1024 * 1024
+
+
+@pytest.fixture(autouse=True)
+def batch_backend():
+    Plot.use_batch_backend()
+    plt.close('all')
+    yield
+    Plot.set_headless(False)
+    plt.close('all')
+
+
+def make_plot(index):
+    data_frame = pd.DataFrame(np.random.default_rng(index).random((10, 4)), columns=['A', 'B', 'C', 'D'])
+
+    plot_type = index % 4
+    if plot_type == 0:
+        return Plot.make_barplot(data_frame, None, title='Plot {}'.format(index))
+    if plot_type == 1:
+        return Plot.make_boxplot(data_frame, None, title='Plot {}'.format(index))
+    if plot_type == 2:
+        return Plot.make_heatmap(data_frame, None, title='Plot {}'.format(index))
+    return Plot.make_pieplot(data_frame['A'].to_numpy(), list('ABCDEFGHIJ'), None, title='Plot {}'.format(index))
+
+
+def peak_memory() -> int:
+    """Peak resident memory of the process in bytes, or 0 if it cannot be measured."""
+
+    if resource is None:
+        return 0
+
+    # the peak is given in kilobytes on Linux and in bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def test_figures_are_freed_in_headless_mode():
+    Plot.set_headless()
+
+    for index in range(WARM_UP_COUNT):
+        make_plot(index)
+    warm_memory = peak_memory()
+
+    for index in range(WARM_UP_COUNT, PLOT_COUNT):
+        assert make_plot(index).startswith(b'\x89PNG')
+        assert plt.get_fignums() == []
+
+    assert peak_memory() - warm_memory < MAX_MEMORY_GROWTH
+
+
+def test_figures_are_closed_when_shown():
+    Plot.set_headless(False)
+
+    for index in range(8):
+        assert make_plot(index).startswith(b'\x89PNG')
+        assert plt.get_fignums() == []
+
+
+def test_figure_is_saved(tmp_path):
+    Plot.set_headless()
+    figure_save_path = tmp_path / 'Plot.png'
+
+    figure_bytes = Plot.make_barplot(pd.DataFrame({'A': [1.0, 2.0], 'B': [3.0, 4.0]}), str(figure_save_path))
+
+    assert figure_save_path.read_bytes() == figure_bytes
+    assert plt.get_fignums() == []
@@ -1,14 +1,16 @@
 from docx.document import Document
 from docx.shared import Cm
-from bs4 import BeautifulSoup
 from typing import List, Dict, Union
 import pandas as pd
 
 from docx_package.results import ResultsChapter
 from docx_package.picture import Picture
-from docx_package.dropdown_lists import DropDownLists
-from eye_tracking_package.eye_tracking import EyeTracking
-from eye_tracking_package.plot import Plot
+from docx_package.input_form import InputForm
+from docx_package.parameters import Parameters
+from docx_package.figure_captions import FigureCaptions
+from docx_package.picture_index import PictureIndex
+from eye_tracking_package.participant_metrics import ParticipantMetrics
+from eye_tracking_package.plot_scheduler import PlotScheduler
 
 
 class AverageFixation:
@@ -37,31 +39,32 @@ class AverageFixation:
 
     def __init__(self,
                  report_document: Document,
-                 text_input_document: Document,
-                 text_input_soup: BeautifulSoup,
-                 list_of_tables: List[str],
-                 picture_paths_list: List[str],
+                 input_form: InputForm,
+                 picture_index: PictureIndex,
+                 figure_captions: FigureCaptions,
                  parameters_dictionary: Dict[str, Union[str, int]],
-                 list_of_dataframes: List[pd.DataFrame]
+                 list_of_metrics: List[ParticipantMetrics],
+                 plot_scheduler: PlotScheduler = None
                  ):
         """
         Args:
             report_document: .docx file where the report is written.
-            text_input_document: .docx file where all inputs are written.
-            text_input_soup: BeautifulSoup of the xml of the input .docx file.
-            list_of_tables: List of all table names.
-            picture_paths_list: List of the path of all input pictures.
+            input_form: Text input form where all inputs are written.
+            picture_index: Index of all input pictures.
+            figure_captions: Captions of the figures of the report.
             parameters_dictionary: Dictionary of all input parameters (key = parameter name, value = parameter value)
-            list_of_dataframes: List of data frames containing the cGOM data of each participant
+            list_of_metrics: List of the metrics of the cGOM data of each participant
+            plot_scheduler (optional): Scheduler that renders the plots of the chapter.
+                                       The plots are rendered directly if it is None.
         """
 
         self.report = report_document
-        self.text_input = text_input_document
-        self.text_input_soup = text_input_soup
-        self.tables = list_of_tables
-        self.picture_paths = picture_paths_list
+        self.input_form = input_form
+        self.picture_index = picture_index
+        self.figure_captions = figure_captions
         self.parameters = parameters_dictionary
-        self.cGOM_dataframes = list_of_dataframes
+        self.participants_metrics = list_of_metrics
+        self.plot_scheduler = plot_scheduler if plot_scheduler is not None else PlotScheduler()
 
     @ property
     def plot_type(self) -> str:
@@ -71,53 +74,77 @@ class AverageFixation:
             i.e. 'Bar plot' or 'Box plot'.
         """
 
-        plot_type_list = DropDownLists.get_from_table(self.text_input_soup,
-                                                      self.tables.index(self.PLOT_TYPE_TABLE)
-                                                      )
+        plot_type_list = self.input_form.dropdown_values(self.PLOT_TYPE_TABLE)
         return plot_type_list[0]
 
-    def make_plots(self):
+    @ property
+    def embedded_figures(self) -> List[str]:
         """
-        Create plots to visualize the fixation durations.
-
-        One box plot for each participant is created.
-        One bar plot showing a confidence interval of 95% and one box plot with the data of
-        all participants are created.
+        Returns:
+            List of paths of the figures that are added to the report, i.e. the plot of the chosen plot type.
         """
 
-        # main fixation times data frame
-        average_fixation_df = pd.DataFrame()
+        if self.plot_type == 'Bar plot':
+            return [self.BAR_PLOT_FIGURE_PATH]
+        if self.plot_type == 'Box plot':
+            return [self.BOX_PLOT_FIGURE_PATH]
+        return []
 
-        # create a data frame with the fixation times for each participant, create a box plot with it,
-        # and append it to the main data frame
-        for idx, dataframe in enumerate(self.cGOM_dataframes):
-            aois = EyeTracking.areas_of_interest(dataframe)
-            participant_fixations = EyeTracking.fixations(aois, dataframe)
-
-            Plot.make_boxplot(data_frame=participant_fixations,
-                              figure_save_path=self.PARTICIPANT_FIGURE_PATH.format(idx + 1),
-                              title='Average fixation duration: participant {}'.format(idx + 1),
-                              ylabel='Fixation duration [s]',
-                              xlabel='Area of interest'
-                              )
+    def make_plots(self):
+        """
+        Create plots to visualize the fixation durations.
 
-            average_fixation_df = average_fixation_df.append(participant_fixations, ignore_index=True)
+        One box plot for each participant is created if it is asked in the text input form.
+        One bar plot showing a confidence interval of 95% or one box plot with the data of
+        all participants is created, depending on the plot that is added to the report.
+        """
 
-        # create a bar plot and a box plot with the fixations of all participants or
-        # do nothing if no cGOM data is provided
+        # list of the data frames with the fixation times of each participant
+        participants_fixations = []
+
+        # get the data frame with the fixation times for each participant, create a box plot with it
+        # if the plots of the participants are asked, and add it to the list
+        participant_plots = Parameters.participant_plots(self.parameters)
+        for idx, metrics in enumerate(self.participants_metrics):
+            participant_fixations = metrics.fixations
+
+            if participant_plots:
+                self.plot_scheduler.submit('boxplot',
+                                           data_frame=participant_fixations,
+                                           figure_save_path=self.PARTICIPANT_FIGURE_PATH.format(idx + 1),
+                                           title='Average fixation duration: participant {}'.format(idx + 1),
+                                           ylabel='Fixation duration [s]',
+                                           xlabel='Area of interest'
+                                           )
+
+            participants_fixations.append(participant_fixations)
+
+        # main fixation times data frame, the data frames of the participants are concatenated at once
+        if participants_fixations:
+            average_fixation_df = pd.concat(participants_fixations, ignore_index=True, sort=False)
+        else:
+            average_fixation_df = pd.DataFrame()
+
+        # create the bar plot or the box plot with the fixations of all participants that is added to the report
+        # or do nothing if no cGOM data is provided
+        embedded_figures = self.embedded_figures
         try:
-            Plot.make_boxplot(data_frame=average_fixation_df,
-                              figure_save_path=self.BOX_PLOT_FIGURE_PATH,
-                              title='Average fixation duration',
-                              ylabel='Fixation duration [s]',
-                              xlabel='Area of interest'
-                              )
-            Plot.make_barplot(data_frame=average_fixation_df,
-                              figure_save_path=self.BAR_PLOT_FIGURE_PATH,
-                              title='Average fixation duration',
-                              ylabel='Fixation duration [s]',
-                              xlabel='Area of interest'
-                              )
+            if self.BOX_PLOT_FIGURE_PATH in embedded_figures:
+                self.plot_scheduler.submit('boxplot',
+                                           data_frame=average_fixation_df,
+                                           figure_save_path=self.BOX_PLOT_FIGURE_PATH,
+                                           title='Average fixation duration',
+                                           ylabel='Fixation duration [s]',
+                                           xlabel='Area of interest'
+                                           )
+            if self.BAR_PLOT_FIGURE_PATH in embedded_figures:
+                self.plot_scheduler.submit('barplot',
+                                           data_frame=average_fixation_df,
+                                           figure_save_path=self.BAR_PLOT_FIGURE_PATH,
+                                           title='Average fixation duration',
+                                           ylabel='Fixation duration [s]',
+                                           xlabel='Area of interest'
+                                           )
         except ValueError:
             pass
 
@@ -126,34 +153,33 @@ class AverageFixation:
         Write the whole chapter 'Average fixation', including the chosen plot.
         """
 
-        decision_table_index = self.tables.index(self.DECISION_TABLE)
-        decision = DropDownLists.get_from_table(self.text_input_soup, decision_table_index)
+        decision = self.input_form.dropdown_values(self.DECISION_TABLE)
 
         if decision[0] == 'Yes':
             self.make_plots()
 
-            time_on_tasks = ResultsChapter(self.report, self.text_input, self.text_input_soup, self.TITLE,
-                                           self.tables, self.picture_paths, self.parameters)
+            time_on_tasks = ResultsChapter(self.report, self.input_form, self.TITLE,
+                                           self.picture_index, self.figure_captions, self.parameters)
 
             self.report.add_paragraph(self.TITLE, self.TITLE_STYLE)
 
             # add bar plot or box plot depending on the choice of plot type or do nothing if no cGOM data is provided
             try:
                 if self.plot_type == 'Bar plot':
-                    Picture.add_picture_and_caption(self.report,
-                                                    [self.BAR_PLOT_FIGURE_PATH],
-                                                    self.BAR_PLOT_FIGURE_PATH,
-                                                    self.BAR_PLOT_CAPTION,
-                                                    width=Cm(12)
-                                                    )
+                    Picture.add_figure_and_caption(self.report,
+                                                   self.figure_captions,
+                                                   self.plot_scheduler.wait(self.BAR_PLOT_FIGURE_PATH),
+                                                   self.BAR_PLOT_CAPTION,
+                                                   width=Cm(12)
+                                                   )
                 if self.plot_type == 'Box plot':
-                    Picture.add_picture_and_caption(self.report,
-                                                    [self.BOX_PLOT_FIGURE_PATH],
-                                                    self.BOX_PLOT_FIGURE_PATH,
-                                                    self.BOX_PLOT_CAPTION,
-                                                    width=Cm(12)
-                                                    )
-            except FileNotFoundError:
+                    Picture.add_figure_and_caption(self.report,
+                                                   self.figure_captions,
+                                                   self.plot_scheduler.wait(self.BOX_PLOT_FIGURE_PATH),
+                                                   self.BOX_PLOT_CAPTION,
+                                                   width=Cm(12)
+                                                   )
+            except ValueError:
                 pass
 
             self.report.add_paragraph(self.DISCUSSION_TITLE, self.DISCUSSION_STYLE)
@@ -0,0 +1,16 @@
+from functools import cached_property
+
+
+def clear_cached_properties(instance):
+    """
+    Forget the values of the cached properties of an object, e.g. after the input table they are computed from
+    was changed, so that they are computed again the next time they are read.
+
+    Args:
+        instance: Object whose class defines properties with functools.cached_property.
+    """
+
+    for cls in type(instance).__mro__:
+        for name, attribute in vars(cls).items():
+            if isinstance(attribute, cached_property):
+                instance.__dict__.pop(name, None)
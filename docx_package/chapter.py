@@ -2,10 +2,11 @@ from docx.document import Document
 from docx.table import Table
 from docx.shared import Cm
 from typing import List, Dict, Union
-from bs4 import BeautifulSoup
 
-from docx_package.dropdown_lists import DropDownLists
+from docx_package.input_form import InputForm
 from docx_package.picture import Picture
+from docx_package.figure_captions import FigureCaptions
+from docx_package.picture_index import PictureIndex
 
 
 class Chapter:
@@ -18,42 +19,29 @@ class Chapter:
 
     def __init__(self,
                  report_document: Document,
-                 text_input_document: Document,
-                 text_input_soup: BeautifulSoup,
+                 input_form: InputForm,
                  title: str,
-                 list_of_tables: List[str],
-                 picture_paths_list: List[str],
+                 picture_index: PictureIndex,
+                 figure_captions: FigureCaptions,
                  parameters_dictionary: Dict[str, Union[str, int]]
                  ):
         """
         Args:
             report_document: .docx file where the report is written.
-            text_input_document: .docx file where all inputs are written.
-            text_input_soup: BeautifulSoup of the xml of the input .docx file.
+            input_form: Text input form where all inputs are written.
             title: Title of the chapter.
-            list_of_tables: List of all table names.
-            picture_paths_list: List of the path of all input pictures.
+            picture_index: Index of all input pictures.
+            figure_captions: Captions of the figures of the report.
             parameters_dictionary: Dictionary of all input parameters (key = parameter name, value = parameter value).
         """
 
         self.report = report_document
-        self.text_input = text_input_document
-        self.text_input_soup = text_input_soup
+        self.input_form = input_form
         self.title = title
-        self.tables = list_of_tables
-        self.picture_paths = picture_paths_list
+        self.picture_index = picture_index
+        self.figure_captions = figure_captions
         self.parameters_dictionary = parameters_dictionary
 
-    def heading_index(self) -> int:
-        """
-        Returns:
-            Paragraph index of the chapter heading in the text input document.
-        """
-
-        for paragraph_index, paragraph in enumerate(self.text_input.paragraphs):
-            if paragraph.text == self.title and 'Heading' in paragraph.style.name:
-                return paragraph_index
-
     @ property
     def paragraph_table(self) -> Table:
         """
@@ -61,8 +49,7 @@ class Chapter:
             Table of the input .docx file where the paragraphs of the chapter are written.
         """
 
-        problem_table_index = self.tables.index('{} text table'.format(self.title))
-        return self.text_input.tables[problem_table_index]
+        return self.input_form.table('{} text table'.format(self.title))
 
     def paragraphs_from_table(self) -> List[str]:
         """
@@ -86,9 +73,7 @@ class Chapter:
             List of parameters needed to be writen in the chapter.
         """
 
-        return DropDownLists.get_from_table(self.text_input_soup,
-                                            self.tables.index('{} parameter table'.format(self.title))
-                                            )
+        return self.input_form.dropdown_values('{} parameter table'.format(self.title))
 
     @ property
     def picture_name(self) -> str:
@@ -108,8 +93,7 @@ class Chapter:
 
         # read the caption text from the corresponding table in text input and append it to a list
         captions_list = []
-        table_index = self.tables.index('{} caption table'.format(self.title))
-        table = self.text_input.tables[table_index]
+        table = self.input_form.table('{} caption table'.format(self.title))
         for i in range(1, 4):
             cell = table.cell(i, 1)
             captions_list.append(cell.text)
@@ -124,12 +108,14 @@ class Chapter:
         captions = self.picture_captions
         picture_name = self.picture_name
 
-        # add pictures that correspond to the given picture file names with the corresponding captions
+        # add pictures that correspond to the picture name and slots 1 to 3 with the corresponding captions
         for i in range(0, 3):
             Picture.add_picture_and_caption(self.report,
-                                            self.picture_paths,
-                                            picture_name + str(i+1),
+                                            self.figure_captions,
+                                            self.picture_index,
+                                            picture_name,
                                             captions[i],
+                                            slot=i+1,
                                             width=Cm(10)
                                             )
 
@@ -141,7 +127,7 @@ class Chapter:
         """
 
         # write heading with the corresponding style
-        heading_style = self.text_input.paragraphs[self.heading_index()].style.name
+        heading_style = self.input_form.heading(self.title).style.name
         self.report.add_paragraph(self.title, heading_style)
 
         # stores values of corresponding parameter keys in a list
@@ -2,12 +2,14 @@ from docx.document import Document
 from docx.text.paragraph import Paragraph
 from docx.enum.table import WD_ALIGN_VERTICAL, WD_TABLE_ALIGNMENT
 from docx.shared import Cm
-from typing import List, Dict, Union
+from typing import Dict, Union
 import numpy as np
-from PIL import Image, UnidentifiedImageError
 
 from docx_package.layout import Layout
+from docx_package.input_form import InputForm
 from docx_package.picture import Picture
+from docx_package.figure_captions import FigureCaptions
+from docx_package.picture_index import PictureIndex
 
 
 class CoverPage:
@@ -44,23 +46,23 @@ class CoverPage:
 
     def __init__(self,
                  report_document: Document,
-                 text_input_document: Document,
-                 list_of_tables: List[str],
-                 picture_paths_list: List[str],
+                 input_form: InputForm,
+                 picture_index: PictureIndex,
+                 figure_captions: FigureCaptions,
                  parameters_dictionary: Dict[str, Union[str, int]]):
         """
         Args:
             report_document: .docx file where the report is written.
-            text_input_document: .docx file where all inputs are written.
-            list_of_tables: List of all table names.
-            picture_paths_list: List of the path of all input pictures.
+            input_form: Text input form where all inputs are written.
+            picture_index: Index of all input pictures.
+            figure_captions: Captions of the figures of the report.
             parameters_dictionary: Dictionary of all input parameters (key = parameter name, value = parameter value).
         """
 
         self.report = report_document
-        self.text_input = text_input_document
-        self.tables = list_of_tables
-        self.picture_paths = picture_paths_list
+        self.input_form = input_form
+        self.picture_index = picture_index
+        self.figure_captions = figure_captions
         self.parameters = parameters_dictionary
 
     def write_title(self):
@@ -148,8 +150,7 @@ class CoverPage:
         """
 
         # find the text in the corresponding table in the text input document
-        table_index = self.tables.index(self.COVER_PAGE_TABLE)
-        table = self.text_input.tables[table_index]
+        table = self.input_form.table(self.COVER_PAGE_TABLE)
         caption = table.cell(1, 1).text
 
         return caption
@@ -166,59 +167,53 @@ class CoverPage:
             True if a picture was added, and False if not.
         """
 
-        # find the files that correspond to the picture file name
-        for picture_path in self.picture_paths:
-            if self.PICTURE_NAME in picture_path:
-
-                try:
-                    picture = Image.open(picture_path)
-
-                    # find the longest side and set it to 14 cm when adding the picture
-                    # case where the width is the longest side
-                    if picture.width >= picture.height:
-
-                        # set the spacing before and after the picture according the height/width ratio
-                        if picture.height / picture.width * 14 < 5:
-                            space = Cm(5)
-                        elif picture.height / picture.width * 14 < 10:
-                            space = Cm(3)
-                        elif picture.height / picture.width * 14 < 14:
-                            space = Cm(1)
-
-                        # add the picture and its caption
-                        Picture.add_picture_and_caption(self.report,
-                                                        self.picture_paths,
-                                                        self.PICTURE_NAME,
-                                                        self.picture_caption,
-                                                        width=self.PICTURE_WIDTH,
-                                                        space_before=space,
-                                                        space_after=space
-                                                        )
-
-                    # case where the height is the longest side
-                    else:
-                        # spacing before and after the picture is always 1 cm because height is always 14 cm
-                        space = Cm(1)
-
-                        # add the picture and its caption
-                        Picture.add_picture_and_caption(self.report,
-                                                        self.picture_paths,
-                                                        self.PICTURE_NAME,
-                                                        self.picture_caption,
-                                                        width=self.PICTURE_WIDTH,
-                                                        space_before=space,
-                                                        space_after=space
-                                                        )
-
-                    # terminate because a picture was added and return True
-                    return True
-
-                # do nothing if the file is not an image
-                except UnidentifiedImageError:
-                    pass
-
-        # return False because no picture was added
-        return False
+        # find the image that corresponds to the picture name, its size was read from the header of its file
+        picture = self.picture_index.get(self.PICTURE_NAME)
+        if picture is None:
+            return False
+        metadata = picture.metadata
+
+        # find the longest side and set it to 14 cm when adding the picture
+        # case where the width is the longest side
+        if metadata.width >= metadata.height:
+
+            # set the spacing before and after the picture according the height/width ratio
+            if metadata.height / metadata.width * 14 < 5:
+                space = Cm(5)
+            elif metadata.height / metadata.width * 14 < 10:
+                space = Cm(3)
+            elif metadata.height / metadata.width * 14 < 14:
+                space = Cm(1)
+
+            # add the picture and its caption
+            Picture.add_picture_and_caption(self.report,
+                                            self.figure_captions,
+                                            self.picture_index,
+                                            self.PICTURE_NAME,
+                                            self.picture_caption,
+                                            width=self.PICTURE_WIDTH,
+                                            space_before=space,
+                                            space_after=space
+                                            )
+
+        # case where the height is the longest side
+        else:
+            # spacing before and after the picture is always 1 cm because height is always 14 cm
+            space = Cm(1)
+
+            # add the picture and its caption
+            Picture.add_picture_and_caption(self.report,
+                                            self.figure_captions,
+                                            self.picture_index,
+                                            self.PICTURE_NAME,
+                                            self.picture_caption,
+                                            width=self.PICTURE_WIDTH,
+                                            space_before=space,
+                                            space_after=space
+                                            )
+
+        # return True because a picture was added
+        return True
 
     def create(self):
         """
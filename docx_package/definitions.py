@@ -1,8 +1,7 @@
 from docx import Document
 from typing import List
-from bs4 import BeautifulSoup
 
-from docx_package.dropdown_lists import DropDownLists
+from docx_package.input_form import InputForm
 
 
 class Definitions:
@@ -28,25 +27,19 @@ class Definitions:
 
     def __init__(self,
                  report_document: Document,
-                 text_input_document: Document,
-                 text_input_soup: BeautifulSoup,
-                 definitions_document: Document,
-                 list_of_tables: List[str],
+                 input_form: InputForm,
+                 definitions_document: Document
                  ):
         """
         Args:
             report_document: .docx file where the report is written.
-            text_input_document: .docx file where all inputs are written.
-            text_input_soup: BeautifulSoup of the xml of the input .docx file.
+            input_form: Text input form where all inputs are written.
             definitions_document: .docx file where all definitions are written.
-            list_of_tables: List of all table names.
         """
 
         self.report = report_document
-        self.text_input = text_input_document
-        self.text_input_soup = text_input_soup
+        self.input_form = input_form
         self.definitions = definitions_document
-        self.list_of_tables = list_of_tables
 
     def standard_heading_index(self, standard_name: str) -> int:
         """
@@ -76,26 +69,25 @@ class Definitions:
         """
 
         # select the table that have the information for this standard
-        for table_index, table in enumerate(self.list_of_tables):
-            if standard_name in table:
+        table_name = '{} definitions table'.format(standard_name)
 
-                # create a list of 'Yes' or 'No' stored in dropdown lists in the table of this standard
-                list_of_yes_no = DropDownLists.get_from_table(self.text_input_soup, table_index)
+        # create a list of 'Yes' or 'No' stored in dropdown lists in the table of this standard
+        list_of_yes_no = self.input_form.dropdown_values(table_name)
 
-                # create a list of all possible terms that can be defined in this standard
-                list_of_terms = []
-                for row in self.text_input.tables[table_index].rows:
-                    for cell in row.cells:
-                        if cell.text:
-                            list_of_terms.append(cell.text)
+        # create a list of all possible terms that can be defined in this standard
+        list_of_terms = []
+        for row in self.input_form.table(table_name).rows:
+            for cell in row.cells:
+                if cell.text:
+                    list_of_terms.append(cell.text)
 
-                # create a list of all terms that have to be defined for this standard
-                list_of_defined_terms = []
-                for index, term in enumerate(list_of_terms):
-                    if list_of_yes_no[index] == 'Yes':
-                        list_of_defined_terms.append(term)
+        # create a list of all terms that have to be defined for this standard
+        list_of_defined_terms = []
+        for index, term in enumerate(list_of_terms):
+            if list_of_yes_no[index] == 'Yes':
+                list_of_defined_terms.append(term)
 
-                return list_of_defined_terms
+        return list_of_defined_terms
 
     def store_definitions(self, standard_name: str, reference_number: int):
         """
@@ -193,23 +185,19 @@ class Definitions:
     @ classmethod
     def write_references(cls,
                          report_document: Document,
-                         text_input_document: Document,
-                         text_input_soup: BeautifulSoup,
-                         definitions_document: Document,
-                         list_of_tables: List[str]
+                         input_form: InputForm,
+                         definitions_document: Document
                          ):
         """
         Write the 'References' chapter
 
         Args:
             report_document: .docx file where the report is written.
-            text_input_document: .docx file where all inputs are written.
-            text_input_soup: BeautifulSoup of the xml of the input .docx file.
+            input_form: Text input form where all inputs are written.
             definitions_document: .docx file where all definitions are written.
-            list_of_tables: List of all table names.
         """
 
-        definitions = cls(report_document, text_input_document, text_input_soup, definitions_document, list_of_tables)
+        definitions = cls(report_document, input_form, definitions_document)
 
         report_document.add_paragraph(definitions.REFERENCES_TITLE, definitions.REFERENCES_TITLE_STYLE)
 
@@ -221,23 +209,19 @@ class Definitions:
     @ classmethod
     def write_all_definitions(cls,
                               report_document: Document,
-                              text_input_document: Document,
-                              text_input_soup: BeautifulSoup,
-                              definitions_document: Document,
-                              list_of_tables: List[str]
+                              input_form: InputForm,
+                              definitions_document: Document
                               ):
         """
         Write the whole chapter 'Terms definitions'.
 
         Args:
             report_document: .docx file where the report is written.
-            text_input_document: .docx file where all inputs are written.
-            text_input_soup: BeautifulSoup of the xml of the input .docx file.
+            input_form: Text input form where all inputs are written.
             definitions_document: .docx file where all definitions are written.
-            list_of_tables: List of all table names.
         """
 
-        definitions = cls(report_document, text_input_document, text_input_soup, definitions_document, list_of_tables)
+        definitions = cls(report_document, input_form, definitions_document)
 
         report_document.add_paragraph(definitions.TITLE, definitions.TITLE_STYLE)
         definitions.write_definitions()
@@ -1,49 +1,49 @@
-from zipfile import ZipFile
-from bs4 import BeautifulSoup
+from docx.document import Document
+from docx.oxml.ns import qn
+from lxml import etree
 from typing import List
 
 
 class DropDownLists:
 
-    @ staticmethod
-    def get_soup(text_input_path) -> BeautifulSoup:
-        """
-        Opens a .docx file as a .zip file and stores the XML data containing the infos about the .docx document
-        in a BeautifulSoup object.
+    # tags of the tables, of the content of the dropdown lists and of the texts in the XML data of a .docx document
+    TABLE_TAG = qn('w:tbl')
+    CONTENT_TAG = qn('w:sdtContent')
+    TEXT_TAG = qn('w:t')
 
+    # return a list of the value of all dropdown lists in a table
+    @ classmethod
+    def get_from_table(cls, table_element: etree.ElementBase) -> List[str]:
+        """
         Args:
-            text_input_path: Path of the text input form.
+            table_element: XML element of the table in the text input form.
 
         Returns:
-            BeautifulSoup object that contains the XML data of the .docx document.
+            List of values of all dropdown lists in a table.
         """
 
-        # open docx file as a zip file and store its relevant xml data
-        zip_file = ZipFile(text_input_path)
-        xml_data = zip_file.read('word/document.xml')
-        zip_file.close()
+        list_of_value = []
 
-        # parse the xml data with BeautifulSoup
-        return BeautifulSoup(xml_data, 'xml')
+        # the value of a dropdown list is the first text of its content
+        for dd_list_content in table_element.iter(cls.CONTENT_TAG):
+            text = next(dd_list_content.iter(cls.TEXT_TAG), None)
+            list_of_value.append(text.text if text is not None else None)
 
-    # return a list of the value of all dropdown lists in a table
-    @ staticmethod
-    def get_from_table(text_input_soup: BeautifulSoup, table_index: int) -> List[str]:
+        return list_of_value
+
+    @ classmethod
+    def get_from_all_tables(cls, text_input_document: Document) -> List[List[str]]:
         """
+        Read the values of the dropdown lists of all tables from the XML tree that python-docx already loaded,
+        so that the .docx file is not opened and parsed a second time.
+
         Args:
-            text_input_soup: BeautifulSoup object that contains the XML data of the .docx document.
-            table_index: Index of the table in the text input form.
+            text_input_document: .docx file where all inputs are written.
 
         Returns:
-            List of values of all dropdown lists in a table.
+            List of the values of all dropdown lists of each table, in the order of the tables in the text input form,
+            nested tables included.
         """
 
-        list_of_value = []
-
-        # look for all values of dropdown lists in the data and store them
-        tables = text_input_soup.find_all('tbl')
-        dd_lists_content = tables[table_index].find_all('sdtContent')
-        for i in dd_lists_content:
-            list_of_value.append(i.find('t').string)
-
-        return list_of_value
+        return [cls.get_from_table(table_element)
+                for table_element in text_input_document.element.body.iter(cls.TABLE_TAG)]
@@ -2,7 +2,6 @@ from docx.document import Document
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.enum.table import WD_ALIGN_VERTICAL, WD_TABLE_ALIGNMENT
 from docx.shared import Cm
-from bs4 import BeautifulSoup
 from typing import List, Dict, Union
 import numpy as np
 import pandas as pd
@@ -10,9 +9,13 @@ import pandas as pd
 from docx_package.layout import Layout
 from docx_package.results import ResultsChapter
 from docx_package.picture import Picture
-from docx_package.dropdown_lists import DropDownLists
+from docx_package.input_form import InputForm
+from docx_package.parameters import Parameters
+from docx_package.figure_captions import FigureCaptions
+from docx_package.picture_index import PictureIndex
 from eye_tracking_package.eye_tracking import EyeTracking
-from eye_tracking_package.plot import Plot
+from eye_tracking_package.participant_metrics import ParticipantMetrics
+from eye_tracking_package.plot_scheduler import PlotScheduler
 
 
 class DwellTimesAndRevisits:
@@ -53,37 +56,38 @@ class DwellTimesAndRevisits:
 
     def __init__(self,
                  report_document: Document,
-                 text_input_document: Document,
-                 text_input_soup: BeautifulSoup,
-                 list_of_tables: List[str],
-                 picture_paths_list: List[str],
+                 input_form: InputForm,
+                 picture_index: PictureIndex,
+                 figure_captions: FigureCaptions,
                  parameters_dictionary: Dict[str, Union[str, int]],
-                 list_of_dataframes: List[pd.DataFrame]
+                 list_of_metrics: List[ParticipantMetrics],
+                 plot_scheduler: PlotScheduler = None
                  ):
         """
         Args:
             report_document: .docx file where the report is written.
-            text_input_document: .docx file where all inputs are written.
-            text_input_soup: BeautifulSoup of the xml of the input .docx file.
-            list_of_tables: List of all table names.
-            picture_paths_list: List of the path of all input pictures.
+            input_form: Text input form where all inputs are written.
+            picture_index: Index of all input pictures.
+            figure_captions: Captions of the figures of the report.
             parameters_dictionary: Dictionary of all input parameters (key = parameter name, value = parameter value)
-            list_of_dataframes: List of data frames containing the cGOM data of each participant
+            list_of_metrics: List of the metrics of the cGOM data of each participant
+            plot_scheduler (optional): Scheduler that renders the plots of the chapter.
+                                       The plots are rendered directly if it is None.
         """
 
         self.report = report_document
-        self.text_input = text_input_document
-        self.text_input_soup = text_input_soup
-        self.tables = list_of_tables
-        self.picture_paths = picture_paths_list
+        self.input_form = input_form
+        self.picture_index = picture_index
+        self.figure_captions = figure_captions
         self.parameters = parameters_dictionary
-        self.cGOM_dataframes = list_of_dataframes
+        self.participants_metrics = list_of_metrics
+        self.plot_scheduler = plot_scheduler if plot_scheduler is not None else PlotScheduler()
 
     def make_dwell_times_plot_and_dataframe(self) -> pd.DataFrame:
         """
         Create pie plots of the total sums of dwell times.
 
-        One pie plot for each participant is created.
+        One pie plot for each participant is created if it is asked in the text input form.
         One pie plot with the data of all participants is created.
 
         Returns:
@@ -93,49 +97,53 @@ class DwellTimesAndRevisits:
             i.e. 'Sum', 'Mean', 'Max', 'Min'.
         """
 
-        # main dwell times data frame that contains the dwell times of all participants
-        all_dwell_times_df = pd.DataFrame()
-
-        # create a data frame with the dwell times and statistics of each participants
-        # and append it to the main data frame
-        for idx, dataframe in enumerate(self.cGOM_dataframes):
-            aois = EyeTracking.areas_of_interest(dataframe)
-            participants_df = EyeTracking.dwell_times(aois, dataframe)
-            all_dwell_times_df = all_dwell_times_df.append(participants_df)
-
-            # plot the total sum of the dwell times for each participants
-            participant_sum = participants_df[self.SUM_INDEX].to_numpy()
-            participant_sum = participant_sum[~np.isnan(participant_sum)]
-            Plot.make_pieplot(data_vector=participant_sum,
-                              labels_list=aois,
-                              figure_save_path=self.PARTICIPANT_FIGURE_PATH.format(idx + 1),
-                              title='Dwell times: participant {}'.format(idx + 1)
-                              )
-
-        # create a data frame with the mean of the statistics for all participants for each AOI
+        # list of the data frames with the dwell times and statistics of each participant
+        participants_dwell_times = []
+
+        # get the data frame with the dwell times and statistics of each participants and add it to the list
+        participant_plots = Parameters.participant_plots(self.parameters)
+        for idx, metrics in enumerate(self.participants_metrics):
+            participants_df = metrics.dwell_times
+            participants_dwell_times.append(participants_df)
+
+            # plot the total sum of the dwell times for each participants if the plots of the participants are asked
+            if participant_plots:
+                participant_sum = participants_df[self.SUM_INDEX].to_numpy()
+                participant_sum = participant_sum[~np.isnan(participant_sum)]
+                self.plot_scheduler.submit('pieplot',
+                                           data_vector=participant_sum,
+                                           labels_list=metrics.aois,
+                                           figure_save_path=self.PARTICIPANT_FIGURE_PATH.format(idx + 1),
+                                           title='Dwell times: participant {}'.format(idx + 1)
+                                           )
+
+        # main dwell times data frame that contains the dwell times of all participants,
+        # the data frames of the participants are concatenated at once
+        if participants_dwell_times:
+            all_dwell_times_df = pd.concat(participants_dwell_times, sort=False)
+        else:
+            all_dwell_times_df = pd.DataFrame()
+
+        # create a data frame with the mean of the statistics for all participants for each AOI,
+        # computed for all AOIs in one pass and ordered as the AOIs first appear
+        statistics_labels = [self.SUM_INDEX, self.MEAN_INDEX, self.MAX_INDEX, self.MIN_INDEX]
         all_aois = EyeTracking.areas_of_interest(all_dwell_times_df)
-        dwell_times_table = pd.DataFrame(index=all_aois,
-                                         columns=[self.SUM_INDEX, self.MEAN_INDEX, self.MAX_INDEX, self.MIN_INDEX],
-                                         data=np.zeros((len(all_aois), 4))
-                                         )
-
-        # calculate the mean of all statistics and store it in the data frame
-        for aoi in all_aois:
-            data_of_aoi = all_dwell_times_df[all_dwell_times_df.index == aoi]
-            dwell_times_table.loc[aoi].at[self.SUM_INDEX] = data_of_aoi[self.SUM_INDEX].mean()
-            dwell_times_table.loc[aoi].at[self.MEAN_INDEX] = data_of_aoi[self.MEAN_INDEX].mean()
-            dwell_times_table.loc[aoi].at[self.MAX_INDEX] = data_of_aoi[self.MAX_INDEX].mean()
-            dwell_times_table.loc[aoi].at[self.MIN_INDEX] = data_of_aoi[self.MIN_INDEX].mean()
+        if all_aois:
+            dwell_times_table = all_dwell_times_df[statistics_labels].groupby(level=0, sort=False).mean()
+            dwell_times_table = dwell_times_table.reindex(all_aois).astype(float)
+        else:
+            dwell_times_table = pd.DataFrame(columns=statistics_labels, dtype=float)
 
         # create a pie plot with the average dwell times sum of all participants or
         # do nothing if no cGOM data is provided
         all_sums = dwell_times_table[self.SUM_INDEX].to_numpy()
         if not dwell_times_table.empty:
-            Plot.make_pieplot(data_vector=all_sums,
-                              labels_list=all_aois,
-                              figure_save_path=self.PIE_PLOT_FIGURE_PATH,
-                              title='Dwell times'
-                              )
+            self.plot_scheduler.submit('pieplot',
+                                       data_vector=all_sums,
+                                       labels_list=all_aois,
+                                       figure_save_path=self.PIE_PLOT_FIGURE_PATH,
+                                       title='Dwell times'
+                                       )
 
         return dwell_times_table
 
@@ -146,18 +154,24 @@ class DwellTimesAndRevisits:
             The last row contains the mean revisits for each task.
         """
 
-        # main revisits data frame
-        revisits_df = pd.DataFrame()
+        # list of the data frames with the revisits of each participant
+        participants_revisits = []
 
-        # create a data frame with the revisits for each participant and append it to the main data frame
-        for idx, dataframe in enumerate(self.cGOM_dataframes):
-            aois = EyeTracking.areas_of_interest(dataframe)
-            revisits = EyeTracking.revisits(aois, dataframe)
+        # create a data frame with the revisits for each participant and add it to the list
+        for idx, metrics in enumerate(self.participants_metrics):
+            aois = metrics.aois
+            revisits = metrics.revisits
             participant_revisits = pd.DataFrame(index=['Participant {}'.format(idx + 1)],
                                                 columns=aois,
                                                 data=[revisits]
                                                 )
-            revisits_df = revisits_df.append(participant_revisits)
+            participants_revisits.append(participant_revisits)
+
+        # main revisits data frame, the data frames of the participants are concatenated at once
+        if participants_revisits:
+            revisits_df = pd.concat(participants_revisits, sort=False)
+        else:
+            revisits_df = pd.DataFrame()
 
         # calculate the mean of revisits for each AOI and append it to the main data frame
         revisits_mean = revisits_df.mean().to_numpy()
@@ -165,7 +179,7 @@ class DwellTimesAndRevisits:
                                         columns=revisits_df.columns,
                                         data=[revisits_mean]
                                         )
-        revisits_df = revisits_df.append(revisits_mean_df)
+        revisits_df = pd.concat([revisits_df, revisits_mean_df], sort=False)
 
         return revisits_df
 
@@ -185,71 +199,59 @@ class DwellTimesAndRevisits:
             # areas of interests
             aois = dwell_times_df.index
 
-            # create table
-            table = self.report.add_table(len(aois) + 1, len(self.TABLE_FIRST_ROW))
-            table.style = 'Table Grid'
-            table.alignment = WD_TABLE_ALIGNMENT.CENTER
-            table.autofit = False
-
-            # write the first row
-            for index, label in enumerate(self.TABLE_FIRST_ROW):
-                cell = table.rows[0].cells[index]
-                cell.text = label
-                Layout.set_cell_shading(cell, self.LIGHT_GREY_10)  # color the cell in light_grey_10
-                cell.paragraphs[0].runs[0].font.bold = True
-
-            # write the first column with the name of the areas of interest
-            for idx, aoi in enumerate(aois):
-                cell = table.columns[0].cells[idx + 1]
-                cell.text = aoi
-
-            # write all the entries of the tables except the ones about revisits
+            # write the first row with the labels, the first column with the name of the areas of interest,
+            # and all the entries of the tables except the ones about revisits
             matrix = dwell_times_df.to_numpy()
-            for i in range(len(aois)):
-                for j in range(4):
-                    table.cell(i + 1, j + 1).text = str(round(matrix[i, j], 4))
+            values = [list(self.TABLE_FIRST_ROW)]
+            for i, aoi in enumerate(aois):
+                values.append([aoi] + [str(round(matrix[i, j], 4)) for j in range(4)] + [''])
 
             # write the third column with the mean of revisits of each AOI
             for idx, revisits in enumerate(revisits_df.loc[self.MEAN_INDEX].to_numpy()):
-                cell = table.columns[5].cells[idx + 1]
-                cell.text = str(round(revisits, 4))
-
-            # set the vertical and horizontal alignment of all cells
-            for row in table.rows:
-                for cell in row.cells:
-                    cell.vertical_alignment = WD_ALIGN_VERTICAL.CENTER
-            for i in range(len(table.rows)):
-                for j in range(1, len(table.columns)):
-                    table.cell(i, j).paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.CENTER
-
-            # set the widths of all columns
-            for idx, column in enumerate(table.columns):
-                Layout.set_column_width(column, self.WIDTHS[idx])
+                values[idx + 1][5] = str(round(revisits, 4))
+
+            # color the first row in light_grey_10 and set its font to bold
+            cols_number = len(self.TABLE_FIRST_ROW)
+            shading = [[self.LIGHT_GREY_10] * cols_number] + [[None] * cols_number] * len(aois)
+            bold = [[True] * cols_number] + [[False] * cols_number] * len(aois)
+
+            # center all cells except the ones of the first column
+            alignments = [[None] + [WD_ALIGN_PARAGRAPH.CENTER] * (cols_number - 1)] * (len(aois) + 1)
+
+            Layout.add_table(self.report,
+                             values,
+                             style='Table Grid',
+                             alignment=WD_TABLE_ALIGNMENT.CENTER,
+                             widths=self.WIDTHS,
+                             shading=shading,
+                             bold=bold,
+                             alignments=alignments,
+                             vertical_alignment=WD_ALIGN_VERTICAL.CENTER
+                             )
 
     def write_chapter(self):
         """
         Write the whole chapter 'Dwell times and revisits', including the table and the plot.
         """
 
-        decision_table_index = self.tables.index(self.DECISION_TABLE)
-        decision = DropDownLists.get_from_table(self.text_input_soup, decision_table_index)
+        decision = self.input_form.dropdown_values(self.DECISION_TABLE)
 
         if decision[0] == 'Yes':
-            time_on_tasks = ResultsChapter(self.report, self.text_input, self.text_input_soup, self.TITLE,
-                                           self.tables, self.picture_paths, self.parameters)
+            time_on_tasks = ResultsChapter(self.report, self.input_form, self.TITLE,
+                                           self.picture_index, self.figure_captions, self.parameters)
 
             self.report.add_paragraph(self.TITLE, self.TITLE_STYLE)
 
             self.add_table()
 
             try:
-                Picture.add_picture_and_caption(self.report,
-                                                [self.PIE_PLOT_FIGURE_PATH],
-                                                self.PIE_PLOT_FIGURE_PATH,
-                                                self.CAPTION,
-                                                width=Cm(12)
-                                                )
-            except FileNotFoundError:     # do nothing if no cGOM data is provided
+                Picture.add_figure_and_caption(self.report,
+                                               self.figure_captions,
+                                               self.plot_scheduler.wait(self.PIE_PLOT_FIGURE_PATH),
+                                               self.CAPTION,
+                                               width=Cm(12)
+                                               )
+            except ValueError:     # do nothing if no cGOM data is provided
                 pass
 
             self.report.add_paragraph(self.DISCUSSION_TITLE, self.DISCUSSION_STYLE)
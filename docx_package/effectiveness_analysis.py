@@ -3,12 +3,14 @@ from docx.table import Table
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.enum.table import WD_ALIGN_VERTICAL, WD_TABLE_ALIGNMENT, WD_ROW_HEIGHT_RULE
 from docx.shared import Pt
-from bs4 import BeautifulSoup
-from typing import List, Dict, Union
+from functools import cached_property
+from typing import Dict, Union
 
 from docx_package.layout import Layout
 from docx_package.results import ResultsChapter
-from docx_package.dropdown_lists import DropDownLists
+from docx_package.input_form import InputForm
+from docx_package.figure_captions import FigureCaptions
+from docx_package.picture_index import PictureIndex
 
 
 class EffectivenessAnalysis:
@@ -47,38 +49,36 @@ class EffectivenessAnalysis:
 
     def __init__(self,
                  report_document: Document,
-                 text_input_document: Document,
-                 text_input_soup: BeautifulSoup,
-                 list_of_tables: List[str],
-                 picture_paths_list: List[str],
+                 input_form: InputForm,
+                 picture_index: PictureIndex,
+                 figure_captions: FigureCaptions,
                  parameters_dictionary: Dict[str, Union[str, int]]
                  ):
         """
         Args:
             report_document: .docx file where the report is written.
-            text_input_document: .docx file where all inputs are written.
-            text_input_soup: BeautifulSoup of the xml of the input .docx file.
-            list_of_tables: List of all table names.
-            picture_paths_list: List of the path of all input pictures.
+            input_form: Text input form where all inputs are written.
+            picture_index: Index of all input pictures.
+            figure_captions: Captions of the figures of the report.
             parameters_dictionary: Dictionary of all input parameters (key = parameter name, value = parameter value)
         """
 
         self.report = report_document
-        self.text_input = text_input_document
-        self.text_input_soup = text_input_soup
-        self.tables = list_of_tables
-        self.picture_paths = picture_paths_list
+        self.input_form = input_form
+        self.picture_index = picture_index
+        self.figure_captions = figure_captions
         self.parameters = parameters_dictionary
 
-    @ property
+    # the values computed from the input tables are cached the first time they are read,
+    # clear_cached_properties forgets them, e.g. after the tasks and problems table was changed
+    @ cached_property
     def task_table(self) -> Table:
         """
         Returns:
             Table of the input .docx file where the information about the effectiveness analysis are written.
         """
 
-        task_table_index = self.tables.index(self.TASK_TABLE)
-        return self.text_input.tables[task_table_index]
+        return self.input_form.table(self.TASK_TABLE)
 
     @ property
     def problem_table(self) -> Table:
@@ -87,10 +87,9 @@ class EffectivenessAnalysis:
             Table of the input .docx file where the description of the problems are written.
         """
 
-        problem_table_index = self.tables.index(self.PROBLEM_TABLE)
-        return self.text_input.tables[problem_table_index]
+        return self.input_form.table(self.PROBLEM_TABLE)
 
-    @ property
+    @ cached_property
     def tasks_number(self) -> int:
         """
         Returns:
@@ -98,24 +97,13 @@ class EffectivenessAnalysis:
             and the one that corresponds to the effectiveness analysis input table.
         """
 
-        tasks_number = 0
-
         # get the index of the last row that is filled which corresponds to the number of critical tasks
-        for i in range(1, len(self.task_table.rows)):
-            row_filled = False
-            for cell in self.task_table.rows[i].cells[1:]:
-                if cell.text.replace(' ', ''):
-                    row_filled = True
-            if row_filled:
-                tasks_number = i
+        tasks_number = max(self.input_form.described_rows(self.task_table, ignore_spaces=True), default=0)
 
         # choose the biggest number of critical tasks
-        if tasks_number > self.parameters[self.TASKS_NUMBER_KEY]:
-            return tasks_number
-        else:
-            return self.parameters[self.TASKS_NUMBER_KEY]
+        return max(tasks_number, self.parameters[self.TASKS_NUMBER_KEY])
 
-    @ property
+    @ cached_property
     def participants_number(self) -> int:
         """
         Returns:
@@ -123,76 +111,55 @@ class EffectivenessAnalysis:
             and the one that corresponds to the effectiveness analysis input table.
         """
 
-        participants_number = 0
-
         # get the index of the last column that is filled which corresponds to the number of participants
-        for j in range(1, len(self.task_table.columns)):
-            column_completed = False
-            for cell in self.task_table.columns[j].cells[1:]:
-                if cell.text.replace(' ', ''):
-                    column_completed = True
-            if column_completed:
-                participants_number = j
+        participants_number = max(self.input_form.described_columns(self.task_table, ignore_spaces=True), default=0)
 
         # choose the biggest number of participant
-        if participants_number > self.parameters[self.PARTICIPANTS_NUMBER_KEY]:
-            return participants_number
-        else:
-            return self.parameters[self.PARTICIPANTS_NUMBER_KEY]
+        return max(participants_number, self.parameters[self.PARTICIPANTS_NUMBER_KEY])
 
     def make_result_table(self):
         """
         Create a table for the visualization of the effectiveness analysis.
         """
 
-        # create a table for the results visualization
         rows_number = self.tasks_number + 1
         cols_number = self.participants_number + 1
-        result_table = self.report.add_table(rows_number, cols_number)
-        result_table.style = 'Table Grid'
-        result_table.alignment = WD_TABLE_ALIGNMENT.CENTER
-        result_table.autofit = False
+
+        # texts of the input table, read once row by row
+        input_texts = [[cell.text for cell in row.cells[:cols_number]] for row in self.task_table.rows[:rows_number]]
+
+        values = [['' for _ in range(cols_number)] for _ in range(rows_number)]
+        shading = [[None for _ in range(cols_number)] for _ in range(rows_number)]
+        font_sizes = [[None for _ in range(cols_number)] for _ in range(rows_number)]
 
         # write the information of the input table in the result table
         for i in range(rows_number):
             for j in range(cols_number):
-                cell = result_table.cell(i, j)
 
                 # skip the first row and first column
                 if i != 0 and j != 0:
-                    cell.text = self.task_table.cell(i, j).text
-                    cell.paragraphs[0].runs[0].font.bold = True
+                    values[i][j] = input_texts[i][j]
 
                 # first row
                 elif i == 0 and j != 0:
-                    cell.text = self.task_table.cell(i, j).text
-                    Layout.set_cell_shading(cell, self.LIGHT_GREY_10)     # color the cell in light_grey_10
-                    cell.paragraphs[0].runs[0].font.size = Pt(9)
-                    cell.paragraphs[0].runs[0].font.bold = True
+                    values[i][j] = input_texts[i][j]
+                    shading[i][j] = self.LIGHT_GREY_10     # color the cell in light_grey_10
+                    font_sizes[i][j] = Pt(9)
 
                 # first column
                 elif i != 0 and j == 0:
-                    try:
-                        cell.text = self.parameters['Critical task {} name'.format(i)]
-                        cell.paragraphs[0].runs[0].font.bold = True
-
                     # case where no critical task name were given
-                    except KeyError:
-                        pass
-                    Layout.set_cell_shading(cell, self.LIGHT_GREY_10)     # color the cell in light_grey_10
-
-                # bolds all text
-                if cell.text:
-                    cell.paragraphs[0].runs[0].font.bold = True
+                    values[i][j] = self.parameters.get('Critical task {} name'.format(i), '')
+                    shading[i][j] = self.LIGHT_GREY_10     # color the cell in light_grey_10
 
         # color the cell according to the type of problem
         for i in range(1, rows_number):
             for j in range(1, cols_number):
-                cell = result_table.cell(i, j)
+                text = values[i][j]
 
-                if cell.text.replace(' ', ''):     # check if the text string is not empty
+                if text.replace(' ', ''):     # check if the text string is not empty
                     try:
-                        problem_index = int(cell.text)
+                        problem_index = int(text)
                         problem_type = self.parameters['Problem {} type'.format(problem_index)]
 
                     # case where no problem type were given
@@ -201,15 +168,39 @@ class EffectivenessAnalysis:
                         problem_type = ''
 
                     if problem_type == 'Important problem':
-                        Layout.set_cell_shading(cell, self.ORANGE)
+                        shading[i][j] = self.ORANGE
 
                     if problem_type == 'Marginal problem':
-                        Layout.set_cell_shading(cell, self.YELLOW)
+                        shading[i][j] = self.YELLOW
 
                     if problem_type == 'Critical problem':
-                        Layout.set_cell_shading(cell, self.RED)
+                        shading[i][j] = self.RED
                 else:
-                    Layout.set_cell_shading(cell, self.GREEN)
+                    shading[i][j] = self.GREEN
+
+        # bolds all text and center all cells except the ones of the first column
+        bold = [[True] * cols_number for _ in range(rows_number)]
+        alignments = [[None] + [WD_ALIGN_PARAGRAPH.CENTER] * (cols_number - 1) for _ in range(rows_number)]
+
+        # width of the columns and height of the rows
+        widths = [2.4] + [(15.9 - 2.4) / max(cols_number - 1, 1)] * (cols_number - 1)
+        heights = [0.5] + [1.1] * (rows_number - 1)
+        height_rules = [WD_ROW_HEIGHT_RULE.EXACTLY] + [WD_ROW_HEIGHT_RULE.AT_LEAST] * (rows_number - 1)
+
+        # create a table for the results visualization
+        result_table = Layout.add_table(self.report,
+                                        values,
+                                        style='Table Grid',
+                                        alignment=WD_TABLE_ALIGNMENT.CENTER,
+                                        widths=widths,
+                                        heights=heights,
+                                        height_rules=height_rules,
+                                        shading=shading,
+                                        bold=bold,
+                                        font_sizes=font_sizes,
+                                        alignments=alignments,
+                                        vertical_alignment=WD_ALIGN_VERTICAL.CENTER
+                                        )
 
         # color the top left cell borders in white
         Layout.set_cell_border(result_table.cell(0, 0),
@@ -217,25 +208,6 @@ class EffectivenessAnalysis:
                                start={"color": "#FFFFFF"}
                                )
 
-        # set the vertical and horizontal alignment of all cells
-        for row in result_table.rows:
-            for cell in row.cells:
-                cell.vertical_alignment = WD_ALIGN_VERTICAL.CENTER
-        for i in range(len(result_table.rows)):
-            for j in range(1, len(result_table.columns)):
-                result_table.cell(i, j).paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.CENTER
-
-        # set the width of the columns
-        Layout.set_column_width(result_table.columns[0], 2.4)
-        for j in range(1, cols_number):
-            width = (15.9 - 2.4) / (cols_number - 1)
-            Layout.set_column_width(result_table.columns[j], width)
-
-        # set the height of the rows
-        Layout.set_row_height(result_table.rows[0], 0.5)
-        for i in range(1, rows_number):
-            Layout.set_row_height(result_table.rows[i], 1.1, rule=WD_ROW_HEIGHT_RULE.AT_LEAST)
-
     @ staticmethod
     def add_color_description(table: Table, cell_row: int, cell_column: int, color: str, description: str):
         """
@@ -310,12 +282,11 @@ class EffectivenessAnalysis:
         Write the whole chapter 'Effectiveness analysis', including the tables.
         """
 
-        decision_table_index = self.tables.index(self.DECISION_TABLE)
-        decision = DropDownLists.get_from_table(self.text_input_soup, decision_table_index)
+        decision = self.input_form.dropdown_values(self.DECISION_TABLE)
 
         if decision[0] == 'Yes':
-            effectiveness_analysis = ResultsChapter(self.report, self.text_input, self.text_input_soup, self.TITLE,
-                                                    self.tables, self.picture_paths, self.parameters)
+            effectiveness_analysis = ResultsChapter(self.report, self.input_form, self.TITLE,
+                                                    self.picture_index, self.figure_captions, self.parameters)
 
             self.report.add_paragraph(self.TITLE, self.TITLE_STYLE)
             self.make_result_table()
@@ -0,0 +1,291 @@
+from copy import deepcopy
+from docx.document import Document
+from docx.text.paragraph import Paragraph
+from docx.oxml import OxmlElement
+from docx.oxml.ns import qn
+from typing import List, Tuple
+
+from docx_package.figure_captions import FigureCaptions
+
+
+class Fields:
+    """
+    Class that resolves the fields of the report without Word, i.e. the list of figures and the table of content.
+    The figure numbers of the captions are already written when the captions are added,
+    and the list of figures is written from the captions that were registered then.
+
+    The results of the fields are written from the headings and the captions of the report when it is built,
+    so that the report is complete when it is saved. The page numbers are not known before Word lays out the pages,
+    so the entries of the table of content and of the list of figures are links to the headings and the captions,
+    and updating the fields in Word is only needed to add the page numbers.
+    """
+
+    # beginnings of the instructions of the fields that are resolved
+    TABLE_OF_CONTENT_INSTRUCTION = 'TOC \\o'
+    FIGURES_LIST_INSTRUCTION = 'TOC \\h \\z \\c "Figure"'
+
+    # heading styles that appear in the table of content, i.e. heading levels "1-2",
+    # with the built-in style of their entries
+    HEADING_ENTRY_STYLES = {'Heading 1': 'toc 1', 'Heading 2': 'toc 2'}
+
+    # built-in style of the entries of the list of figures
+    FIGURE_ENTRY_STYLE = 'table of figures'
+
+    def __init__(self, report_document: Document, figure_captions: FigureCaptions):
+        """
+        Args:
+            report_document: .docx file where the report is written.
+            figure_captions: Captions of the figures of the report.
+        """
+
+        self.report = report_document
+        self.figure_captions = figure_captions
+
+        # identifier of the next bookmark, after the ones that are already in the report
+        bookmark_ids = [int(bookmark.get(qn('w:id')))
+                        for bookmark in self.report.element.body.iter(qn('w:bookmarkStart'))]
+        self.next_bookmark_id = max(bookmark_ids, default=-1) + 1
+
+    @ staticmethod
+    def field_run(paragraph: Paragraph, instruction: str):
+        """
+        Args:
+            paragraph: Paragraph that might contain the field.
+            instruction: Beginning of the instruction of the field.
+
+        Returns:
+            XML run element <w:r> that contains the beginning, the instruction and the end of the field,
+            or None if the paragraph does not contain such a field that was not resolved yet.
+        """
+
+        for r in paragraph._p.iter(qn('w:r')):
+            instr_text = r.find(qn('w:instrText'))
+            if instr_text is not None and (instr_text.text or '').strip().startswith(instruction) \
+                    and r.find(qn('w:fldChar')) is not None:
+                return r
+
+        return None
+
+    @ staticmethod
+    def make_run(r_template, *children):
+        """
+        Args:
+            r_template: XML run element whose properties are copied.
+            *children: XML elements of the new run.
+
+        Returns:
+            New XML run element <w:r> with the properties of the template and the given children.
+        """
+
+        r = OxmlElement('w:r')
+        rPr = r_template.find(qn('w:rPr'))
+        if rPr is not None:
+            r.append(deepcopy(rPr))
+        for child in children:
+            r.append(child)
+
+        return r
+
+    @ classmethod
+    def make_text_run(cls, r_template, text: str):
+        """
+        Args:
+            r_template: XML run element whose properties are copied.
+            text: Text of the run.
+
+        Returns:
+            New XML run element <w:r> that contains the text.
+        """
+
+        t = OxmlElement('w:t')
+        t.set(qn('xml:space'), 'preserve')
+        t.text = text
+
+        return cls.make_run(r_template, t)
+
+    @ classmethod
+    def split_field(cls, field_r):
+        """
+        Replace a field written in a single run by a run for its beginning, one for its instruction,
+        one for the separation between the instruction and the result and one for its end,
+        and remove its previous result.
+
+        Args:
+            field_r: XML run element that contains the whole field.
+
+        Returns:
+            XML run element of the end of the field, the result is written before it.
+        """
+
+        instr_text = deepcopy(field_r.find(qn('w:instrText')))
+
+        begin = OxmlElement('w:fldChar')
+        begin.set(qn('w:fldCharType'), 'begin')
+        separate = OxmlElement('w:fldChar')
+        separate.set(qn('w:fldCharType'), 'separate')
+        end = OxmlElement('w:fldChar')
+        end.set(qn('w:fldCharType'), 'end')
+
+        runs = [cls.make_run(field_r, begin), cls.make_run(field_r, instr_text), cls.make_run(field_r, separate)]
+        for r in runs:
+            field_r.addprevious(r)
+
+        end_r = cls.make_run(field_r, end)
+        field_r.addprevious(end_r)
+        field_r.getparent().remove(field_r)
+
+        return end_r
+
+    def add_bookmark(self, paragraph: Paragraph) -> str:
+        """
+        Add a bookmark around the content of a paragraph, so that an entry of a list can link to it.
+
+        Args:
+            paragraph: Paragraph that is bookmarked, i.e. a heading or a caption.
+
+        Returns:
+            Name of the bookmark.
+        """
+
+        bookmark_id = str(self.next_bookmark_id)
+        name = '_Toc{:09d}'.format(self.next_bookmark_id)
+        self.next_bookmark_id += 1
+
+        start = OxmlElement('w:bookmarkStart')
+        start.set(qn('w:id'), bookmark_id)
+        start.set(qn('w:name'), name)
+        end = OxmlElement('w:bookmarkEnd')
+        end.set(qn('w:id'), bookmark_id)
+
+        p = paragraph._p
+        pPr = p.pPr
+        if pPr is not None:
+            pPr.addnext(start)
+        else:
+            p.insert(0, start)
+        p.append(end)
+
+        return name
+
+    def make_entry_paragraph(self, style_name: str):
+        """
+        Args:
+            style_name: Name of the built-in style of the entry, e.g. 'toc 1' or 'table of figures'.
+
+        Returns:
+            New XML paragraph element <w:p> of an entry of the table of content or of the list of figures,
+            with the style of the entry if it is defined in the report.
+        """
+
+        p = OxmlElement('w:p')
+        pPr = p.get_or_add_pPr()
+        if style_name in self.report.styles:
+            pPr.style = self.report.styles[style_name].style_id
+
+        return p
+
+    @ classmethod
+    def make_link(cls, r_template, bookmark: str, text: str):
+        """
+        Args:
+            r_template: XML run element whose properties are copied.
+            bookmark: Name of the bookmark the link points to.
+            text: Text of the link.
+
+        Returns:
+            New XML hyperlink element <w:hyperlink> to the bookmark.
+        """
+
+        hyperlink = OxmlElement('w:hyperlink')
+        hyperlink.set(qn('w:anchor'), bookmark)
+        hyperlink.set(qn('w:history'), '1')
+        hyperlink.append(cls.make_text_run(r_template, text))
+
+        return hyperlink
+
+    def write_list(self, field_paragraph: Paragraph, field_r, entries: List[Tuple[str, str, str]]):
+        """
+        Write the result of a field that lists paragraphs of the report, i.e. a table of content or a list of figures.
+
+        The first entry is written in the paragraph of the field and each other entry in a new paragraph after it.
+
+        Args:
+            field_paragraph: Paragraph of the field.
+            field_r: XML run element that contains the whole field.
+            entries: List of the style name, the bookmark name and the text of each entry.
+        """
+
+        end_r = self.split_field(field_r)
+
+        if not entries:
+            return
+
+        # first entry in the paragraph of the field
+        style_name, bookmark, text = entries[0]
+        p = field_paragraph._p
+        entry_p = self.make_entry_paragraph(style_name)
+        if p.pPr is not None:
+            p.remove(p.pPr)
+        p.insert(0, entry_p.pPr)
+        end_r.addprevious(self.make_link(field_r, bookmark, text))
+
+        # other entries in new paragraphs, the field ends at the end of the last one
+        previous_p = p
+        for style_name, bookmark, text in entries[1:]:
+            entry_p = self.make_entry_paragraph(style_name)
+            entry_p.append(self.make_link(field_r, bookmark, text))
+            previous_p.addnext(entry_p)
+            previous_p = entry_p
+
+        previous_p.append(end_r)
+
+    def resolve(self):
+        """
+        Write the table of content and the list of figures.
+        """
+
+        headings = []
+        table_of_content = None
+        figures_list = None
+
+        # find the fields and the headings in a single pass over the paragraphs of the report
+        for paragraph in self.report.paragraphs:
+            field_r = self.field_run(paragraph, self.TABLE_OF_CONTENT_INSTRUCTION)
+            if field_r is not None:
+                table_of_content = (paragraph, field_r)
+                continue
+
+            field_r = self.field_run(paragraph, self.FIGURES_LIST_INSTRUCTION)
+            if field_r is not None:
+                figures_list = (paragraph, field_r)
+                continue
+
+            style_name = self.HEADING_ENTRY_STYLES.get(paragraph.style.name)
+            if style_name is not None and paragraph.text:
+                headings.append((paragraph, style_name))
+
+        # the text of the captions contains their figure number, that was written when the captions were added
+        figure_entries = [(self.FIGURE_ENTRY_STYLE, self.add_bookmark(paragraph), paragraph.text)
+                          for paragraph in self.figure_captions.paragraphs]
+        heading_entries = [(style_name, self.add_bookmark(paragraph), paragraph.text)
+                           for paragraph, style_name in headings]
+
+        if table_of_content is not None:
+            self.write_list(*table_of_content, heading_entries)
+
+        if figures_list is not None:
+            self.write_list(*figures_list, figure_entries)
+
+    @ classmethod
+    def update(cls, report_document: Document, figure_captions: FigureCaptions):
+        """
+        Resolve the fields of the report, i.e. the list of figures and the table of content, without Word.
+
+        This must be called once after the whole report is written.
+
+        Args:
+            report_document: .docx file where the report is written.
+            figure_captions: Captions of the figures of the report.
+        """
+
+        cls(report_document, figure_captions).resolve()
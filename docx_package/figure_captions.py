@@ -0,0 +1,36 @@
+from docx.text.paragraph import Paragraph
+from typing import Dict, List
+
+
+class FigureCaptions:
+    """
+    Class that represents the captions of the figures of a report, numbered in the order they are added.
+
+    The report is written from its beginning to its end, so the figure number of a caption is the number of captions
+    that were added before it plus one. The list of figures is written from the captions registered here.
+    """
+
+    def __init__(self):
+        # text of the caption of each figure with the figure number as key
+        self.captions: Dict[int, str] = {}
+
+        # paragraph of the caption of each figure, in the order of the figure numbers
+        self.paragraphs: List[Paragraph] = []
+
+    def add(self, caption_paragraph: Paragraph, caption_text: str) -> int:
+        """
+        Register the caption of the next figure.
+
+        Args:
+            caption_paragraph: Paragraph of the caption in the report.
+            caption_text: Text of the caption without its label and figure number.
+
+        Returns:
+            Figure number of the caption.
+        """
+
+        figure_number = len(self.paragraphs) + 1
+        self.captions[figure_number] = caption_text
+        self.paragraphs.append(caption_paragraph)
+
+        return figure_number
@@ -0,0 +1,74 @@
+from typing import Dict, Tuple, Union
+from PIL import Image, UnidentifiedImageError
+
+
+class ImageMetadata:
+    """
+    Class that represents the metadata of an image file, as read from the header of the file.
+    """
+
+    # resolution of an image whose file does not give one, in dots per inch, as assumed by Word and python-docx
+    DEFAULT_DPI = (72, 72)
+
+    def __init__(self, image_format: str, width: int, height: int, dpi: Tuple[float, float]):
+        """
+        Args:
+            image_format: Format of the image, e.g. 'JPEG' or 'PNG'.
+            width: Width of the image in pixels.
+            height: Height of the image in pixels.
+            dpi: Horizontal and vertical resolution of the image in dots per inch.
+        """
+
+        self.format = image_format
+        self.width = width
+        self.height = height
+        self.dpi = dpi
+
+    @ classmethod
+    def probe(cls, image_path: str) -> 'ImageMetadata':
+        """
+        Read the metadata of an image from the header of its file, the pixels of the image are not decoded.
+
+        Args:
+            image_path: Path of the image file.
+
+        Returns:
+            Metadata of the image.
+
+        Raises:
+            UnidentifiedImageError: If the file is not an image.
+            OSError: If the file cannot be read.
+        """
+
+        # PIL only reads the header of the file when it is opened, the pixels are read when they are used
+        with Image.open(image_path) as image:
+            dpi = image.info.get('dpi') or cls.DEFAULT_DPI
+            return cls(image.format, image.width, image.height, (float(dpi[0]), float(dpi[1])))
+
+
+class ImageMetadataCache:
+    """
+    Class that represents a cache of the metadata of the image files, shared by everything that needs the format,
+    the size or the resolution of an input picture, so that the header of each file is only read once per run.
+    """
+
+    def __init__(self):
+        # metadata of each file with the path of the file as key, None if the file is not an image
+        self.metadata: Dict[str, Union[ImageMetadata, None]] = {}
+
+    def get(self, image_path: str) -> Union[ImageMetadata, None]:
+        """
+        Args:
+            image_path: Path of the image file.
+
+        Returns:
+            Metadata of the image, or None if the file is not an image or cannot be read.
+        """
+
+        if image_path not in self.metadata:
+            try:
+                self.metadata[image_path] = ImageMetadata.probe(image_path)
+            except (UnidentifiedImageError, OSError):
+                self.metadata[image_path] = None
+
+        return self.metadata[image_path]
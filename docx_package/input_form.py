@@ -0,0 +1,205 @@
+from docx import Document
+from docx.table import Table, _Cell
+from docx.text.paragraph import Paragraph
+from typing import List
+
+from docx_package.dropdown_lists import DropDownLists
+
+
+class InputForm:
+    """
+    Class that represents the text input form, i.e. the .docx file where all inputs are written.
+
+    The document is read once when the form is created: its tables, its headings and the values of the dropdown
+    lists of each table are indexed, so that the chapters find them by name instead of scanning the document.
+    """
+
+    # list of all tables in the order they appear in the text input document,
+    # this is used to get the index of a table in the document
+    TABLE_NAMES = [
+        'Study table',
+        'Title table',
+        'Approval table',
+        'Cover page caption table',
+        'Header table',
+        'Purpose text table',
+        'Purpose parameter table',
+        'Purpose caption table',
+        'Background text table',
+        'Background parameter table',
+        'Background caption table',
+        'Scope text table',
+        'Scope parameter table',
+        'Scope caption table',
+        'EU Regulation 2017/745 definitions table',
+        'IEC 62366-1 definitions table',
+        'FDA Guidance definitions table',
+        'Ethics statement text table',
+        'Ethics statement parameter table',
+        'Ethics statement caption table',
+        'Device specifications text table',
+        'Device specifications parameter table',
+        'Device specifications caption table',
+        'Goal text table',
+        'Goal parameter table',
+        'Goal caption table',
+        'Participants text table',
+        'Participants parameter table',
+        'Participants caption table',
+        'Use environment text table',
+        'Use environment parameter table',
+        'Use environment caption table',
+        'Use scenarios text table',
+        'Use scenarios parameter table',
+        'Use scenarios caption table',
+        'Setup text table',
+        'Setup parameter table',
+        'Setup caption table',
+        'Critical tasks description table',
+        'Effectiveness analysis decision table',
+        'Effectiveness analysis tasks and problems table',
+        'Effectiveness analysis problem type table',
+        'Effectiveness analysis text table',
+        'Effectiveness analysis parameter table',
+        'Effectiveness analysis caption table',
+        'Time on tasks decision table',
+        'Time on tasks plot type table',
+        'Time on tasks table',
+        'Time on tasks text table',
+        'Time on tasks parameter table',
+        'Time on tasks caption table',
+        'Dwell times and revisits decision table',
+        'Dwell times and revisits text table',
+        'Dwell times and revisits parameter table',
+        'Dwell times and revisits caption table',
+        'Average fixation decision table',
+        'Average fixation plot type table',
+        'Average fixation text table',
+        'Average fixation parameter table',
+        'Average fixation caption table',
+        'Transitions decision table',
+        'Transitions text table',
+        'Transitions parameter table',
+        'Transitions caption table',
+        'Conclusion text table',
+        'Conclusion parameter table',
+        'Conclusion caption table',
+        'Participants characteristics table'
+    ]
+
+    def __init__(self, text_input_path: str):
+        """
+        Args:
+            text_input_path: Path of the text input form.
+        """
+
+        self.path = text_input_path
+        self.document = Document(text_input_path)
+
+        # python-docx creates a new list of tables each time the tables of the document are accessed
+        self.tables = self.document.tables
+
+        # index of each table in the document, with the name of the table as key
+        self.table_indexes = {table_name: idx for idx, table_name in enumerate(self.TABLE_NAMES)}
+
+        # first heading paragraph of the document with each title, with the title as key
+        self.headings = {}
+        for paragraph in self.document.paragraphs:
+            if paragraph.text not in self.headings and 'Heading' in paragraph.style.name:
+                self.headings[paragraph.text] = paragraph
+
+        # values of the dropdown lists of each table, in the order of the tables in the document
+        self.dropdowns = DropDownLists.get_from_all_tables(self.document)
+
+        # number of times that all rows or columns of a table were read to find the described elements
+        self._table_scans = 0
+
+    @ property
+    def table_scans(self) -> int:
+        """
+        Returns:
+            Number of times that all rows or columns of a table were read to find the described elements,
+            this shows how many table scans are performed to write the report.
+        """
+
+        return self._table_scans
+
+    @ staticmethod
+    def is_described(cells: List[_Cell], ignore_spaces: bool = False) -> bool:
+        """
+        Args:
+            cells: Cells of a row or a column of a table without the header cell.
+            ignore_spaces (optional): True if a cell that only contains spaces is considered empty.
+
+        Returns:
+            True if one of the cells contains a text.
+        """
+
+        return any(cell.text.replace(' ', '') if ignore_spaces else cell.text for cell in cells)
+
+    def described_rows(self, table: Table, ignore_spaces: bool = False) -> List[int]:
+        """
+        Find the rows of a table that describe an element, e.g. a participant or a critical task.
+
+        Args:
+            table: Table of the text input document whose first row and first column are headers.
+            ignore_spaces (optional): True if a cell that only contains spaces is considered empty.
+
+        Returns:
+            Indexes of the rows that contain a text after their header cell, the header row is never described.
+        """
+
+        self._table_scans += 1
+
+        return [idx for idx, row in enumerate(table.rows[1:], 1) if self.is_described(row.cells[1:], ignore_spaces)]
+
+    def described_columns(self, table: Table, ignore_spaces: bool = False) -> List[int]:
+        """
+        Find the columns of a table that describe an element, e.g. a participant.
+
+        Args:
+            table: Table of the text input document whose first row and first column are headers.
+            ignore_spaces (optional): True if a cell that only contains spaces is considered empty.
+
+        Returns:
+            Indexes of the columns that contain a text after their header cell, the header column is never described.
+        """
+
+        self._table_scans += 1
+
+        # the columns of a table cannot be sliced like its rows
+        return [idx for idx, column in enumerate(table.columns)
+                if idx > 0 and self.is_described(column.cells[1:], ignore_spaces)]
+
+    def table(self, table_name: str) -> Table:
+        """
+        Args:
+            table_name: Name of the table as it appears in the tables list.
+
+        Returns:
+            Table of the text input document.
+        """
+
+        return self.tables[self.table_indexes[table_name]]
+
+    def dropdown_values(self, table_name: str) -> List[str]:
+        """
+        Args:
+            table_name: Name of the table as it appears in the tables list.
+
+        Returns:
+            List of values of all dropdown lists in the table.
+        """
+
+        return self.dropdowns[self.table_indexes[table_name]]
+
+    def heading(self, title: str) -> Paragraph:
+        """
+        Args:
+            title: Title of the chapter.
+
+        Returns:
+            Paragraph of the chapter heading in the text input document.
+        """
+
+        return self.headings[title]
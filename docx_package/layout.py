@@ -1,16 +1,18 @@
 from docx.document import Document
 from docx.section import Section
 from docx.text.paragraph import Paragraph
-from docx.table import _Row, _Column, _Cell
+from docx.table import Table, _Row, _Column, _Cell
 from docx.enum.base import EnumValue
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.enum.section import WD_ORIENT
-from docx.shared import Pt, Cm, RGBColor
-from docx.enum.table import WD_ROW_HEIGHT_RULE
+from docx.shared import Pt, Cm, RGBColor, Length
+from docx.enum.table import WD_ROW_HEIGHT_RULE, WD_ALIGN_VERTICAL
 from docx.enum.style import WD_STYLE_TYPE
 from docx.oxml.ns import nsdecls, qn
 from docx.oxml import parse_xml
 from docx.oxml.shared import OxmlElement
+from xml.sax.saxutils import escape
+from typing import List, Sequence, Union
 
 
 class Layout:
@@ -59,7 +61,8 @@ class Layout:
                      italic=False,
                      bold=False,
                      space_before=None,
-                     space_after=None
+                     space_after=None,
+                     left_indent=None
                      ):
         """
         Define the characteristics of a style in the report.
@@ -74,6 +77,8 @@ class Layout:
             bold (optional): Boolean to know if it should be bold.
             space_before (optional): Space before the paragraph. None if inherited from the style hierarchy.
             space_after (optional): Space after the paragraph. None if inherited from the style hierarchy.
+            left_indent (optional): Indentation of the paragraph from the left margin.
+                                    None if inherited from the style hierarchy.
         """
 
         # add a new style if it does not already exist
@@ -96,6 +101,7 @@ class Layout:
         style.font.bold = bold
         style.paragraph_format.space_before = space_before
         style.paragraph_format.space_after = space_after
+        style.paragraph_format.left_indent = left_indent
 
     @ classmethod
     def define_all_styles(cls, report_document: Document):
@@ -124,6 +130,13 @@ class Layout:
                             space_before=Pt(8), space_after=Pt(5))
         layout.define_style('Caption', 'Calibri', 9, layout.BLACK, WD_ALIGN_PARAGRAPH.CENTER, bold=True)
 
+        # built-in styles of the entries of the table of content and of the list of figures, as Word defines them
+        layout.define_style('toc 1', 'Calibri', 11, layout.BLACK, WD_ALIGN_PARAGRAPH.LEFT, space_after=Pt(5))
+        layout.define_style('toc 2', 'Calibri', 11, layout.BLACK, WD_ALIGN_PARAGRAPH.LEFT, space_after=Pt(5),
+                            left_indent=Pt(11))
+        layout.define_style('table of figures', 'Calibri', 11, layout.BLACK, WD_ALIGN_PARAGRAPH.LEFT,
+                            space_after=Pt(0))
+
     @ staticmethod
     def capitalize_first_letter(string: str) -> str:
         """
@@ -239,7 +252,11 @@ class Layout:
         tcBorders = tcPr.first_child_found_in("w:tcBorders")
         if tcBorders is None:
             tcBorders = OxmlElement('w:tcBorders')
-            tcPr.append(tcBorders)
+            tcPr.insert_element_before(tcBorders,
+                                       'w:shd', 'w:noWrap', 'w:tcMar', 'w:textDirection', 'w:tcFitText',
+                                       'w:vAlign', 'w:hideMark', 'w:headers', 'w:cellIns', 'w:cellDel',
+                                       'w:cellMerge', 'w:tcPrChange'
+                                       )
 
         # list over all available tags
         for edge in ('start', 'top', 'end', 'bottom', 'insideH', 'insideV'):
@@ -257,3 +274,146 @@ class Layout:
                 for key in ["sz", "val", "color", "space", "shadow"]:
                     if key in edge_data:
                         element.set(qn('w:{}'.format(key)), str(edge_data[key]))
+
+    @ staticmethod
+    def run_xml(text: str, bold: bool = False, font_size: Length = None) -> str:
+        """
+        Args:
+            text: Text of the run, tabs and line breaks are written as in python-docx.
+            bold (optional): True if the text is bold.
+            font_size (optional): Font size of the text, e.g. Pt(9). None if inherited from the style.
+
+        Returns:
+            XML of a run <w:r> that contains the text.
+        """
+
+        properties = ''
+        if bold:
+            properties += '<w:b/>'
+        if font_size is not None:
+            properties += '<w:sz w:val="{}"/>'.format(int(round(font_size.pt * 2)))
+        if properties:
+            properties = '<w:rPr>{}</w:rPr>'.format(properties)
+
+        content = []
+        for line_idx, line in enumerate(text.replace('\r', '\n').split('\n')):
+            if line_idx:
+                content.append('<w:br/>')
+            for part_idx, part in enumerate(line.split('\t')):
+                if part_idx:
+                    content.append('<w:tab/>')
+                if part:
+                    space = ' xml:space="preserve"' if part != part.strip() else ''
+                    content.append('<w:t{}>{}</w:t>'.format(space, escape(part)))
+
+        return '<w:r>{}{}</w:r>'.format(properties, ''.join(content))
+
+    @ classmethod
+    def add_table(cls,
+                  report_document: Document,
+                  values: Sequence[Sequence[str]],
+                  style: str = None,
+                  alignment: EnumValue = None,
+                  autofit: bool = False,
+                  widths: List[float] = None,
+                  heights: List[float] = None,
+                  height_rules: List[EnumValue] = None,
+                  shading: Sequence[Sequence[Union[str, None]]] = None,
+                  bold: Sequence[Sequence[bool]] = None,
+                  font_sizes: Sequence[Sequence[Union[Length, None]]] = None,
+                  alignments: Sequence[Sequence[Union[EnumValue, None]]] = None,
+                  vertical_alignment: EnumValue = None
+                  ) -> Table:
+        """
+        Add a table to the report with all its values and formatting at once.
+
+        The XML of all rows is written in one pass, instead of accessing each cell through python-docx
+        once for its text and once again for each formatting feature.
+        The formatting of the cells is given in matrices of the same size as the values,
+        with None (or False) in the cells that keep the default formatting.
+
+        Args:
+            report_document: .docx file where the report is written.
+            values: Matrix of the texts of all cells, an empty text leaves the cell empty.
+            style (optional): Name of the table style, e.g. 'Table Grid'.
+            alignment (optional): Alignment of the table in the page, e.g. WD_TABLE_ALIGNMENT.CENTER.
+            autofit (optional): True if Word adapts the width of the columns to their content.
+            widths (optional): List of the width of each column in cm.
+            heights (optional): List of the height of each row in cm.
+            height_rules (optional): List of the rule of the height of each row, WD_ROW_HEIGHT_RULE.EXACTLY if None.
+            shading (optional): Matrix of the hexadecimal representations of the colors of the cells.
+            bold (optional): Matrix of booleans to know if the text of the cells should be bold.
+            font_sizes (optional): Matrix of the font sizes of the cells, e.g. Pt(9).
+            alignments (optional): Matrix of the alignments of the paragraphs of the cells,
+                                   e.g. WD_ALIGN_PARAGRAPH.CENTER.
+            vertical_alignment (optional): Vertical alignment of all cells, e.g. WD_ALIGN_VERTICAL.CENTER.
+
+        Returns:
+            The table that was added to the report.
+        """
+
+        rows_number = len(values)
+        cols_number = len(values[0]) if rows_number else 0
+
+        table = report_document.add_table(0, cols_number)
+        table.style = style
+        table.alignment = alignment
+        table.autofit = autofit
+
+        # set the width of the grid of the table
+        if widths is not None:
+            for column, width in zip(table.columns, widths):
+                column.width = Cm(width)
+
+        vertical_alignment_xml = ''
+        if vertical_alignment is not None:
+            vertical_alignment_xml = '<w:vAlign w:val="{}"/>'.format(WD_ALIGN_VERTICAL.to_xml(vertical_alignment))
+
+        rows_xml = []
+        for i in range(rows_number):
+
+            # row properties
+            row_xml = ['<w:tr>']
+            if heights is not None:
+                rule = height_rules[i] if height_rules is not None else WD_ROW_HEIGHT_RULE.EXACTLY
+                row_xml.append('<w:trPr><w:trHeight w:val="{}" w:hRule="{}"/></w:trPr>'.format(
+                    Cm(heights[i]).twips, WD_ROW_HEIGHT_RULE.to_xml(rule)))
+
+            for j in range(cols_number):
+
+                # cell properties, in the order of the XML schema
+                cell_properties = ''
+                if widths is not None:
+                    cell_properties += '<w:tcW w:type="dxa" w:w="{}"/>'.format(Cm(widths[j]).twips)
+                if shading is not None and shading[i][j]:
+                    cell_properties += '<w:shd w:fill="{}"/>'.format(shading[i][j])
+                cell_properties += vertical_alignment_xml
+                if cell_properties:
+                    cell_properties = '<w:tcPr>{}</w:tcPr>'.format(cell_properties)
+
+                # paragraph properties
+                paragraph_properties = ''
+                if alignments is not None and alignments[i][j] is not None:
+                    paragraph_properties = '<w:pPr><w:jc w:val="{}"/></w:pPr>'.format(
+                        WD_ALIGN_PARAGRAPH.to_xml(alignments[i][j]))
+
+                # text of the cell
+                run = ''
+                text = values[i][j]
+                if text:
+                    run = cls.run_xml(str(text),
+                                      bold=bold is not None and bold[i][j],
+                                      font_size=font_sizes[i][j] if font_sizes is not None else None
+                                      )
+
+                row_xml.append('<w:tc>{}<w:p>{}{}</w:p></w:tc>'.format(cell_properties, paragraph_properties, run))
+
+            row_xml.append('</w:tr>')
+            rows_xml.append(''.join(row_xml))
+
+        # parse all rows at once and move them to the table
+        rows = parse_xml('<w:tbl {}>{}</w:tbl>'.format(nsdecls('w'), ''.join(rows_xml)))
+        for row in list(rows):
+            table._tbl.append(row)
+
+        return table
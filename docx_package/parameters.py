@@ -1,8 +1,7 @@
-from docx.document import Document
-from bs4 import BeautifulSoup
-from typing import List
+from docx.table import Table
+from typing import Dict, Union
 
-from docx_package.dropdown_lists import DropDownLists
+from docx_package.input_form import InputForm
 
 
 class Parameters:
@@ -26,21 +25,18 @@ class Parameters:
     TASKS_TABLE = 'Critical tasks description table'
     PROBLEMS_TABLE = 'Effectiveness analysis problem type table'
 
-    def __init__(self,
-                 text_input_document: Document,
-                 text_input_soup: BeautifulSoup,
-                 list_of_tables: List[str]
-                 ):
+    # key of the parameter that decides if a plot is created for each participant,
+    # it is chosen in the dropdown list of the 'Study table' and the plots are created if its value is 'Yes'
+    PARTICIPANT_PLOTS_KEY = 'Participant plots'
+    PARTICIPANT_PLOTS_TABLE = 'Study table'
+
+    def __init__(self, input_form: InputForm):
         """
         Args:
-            text_input_document: .docx file where all inputs are written.
-            text_input_soup: BeautifulSoup of the xml of the input .docx file.
-            list_of_tables: List of all table names.
+            input_form: Text input form where all inputs are written.
         """
 
-        self.text_input = text_input_document
-        self.text_input_soup = text_input_soup
-        self.tables = list_of_tables
+        self.input_form = input_form
 
         # dictionary where keys and values of all parameters will be stored
         self.dictionary = {}
@@ -53,8 +49,7 @@ class Parameters:
         """
 
         for table_name in self.STANDARD_PARAMETERS_TABLES:
-            table_index = self.tables.index(table_name)
-            table = self.text_input.tables[table_index]
+            table = self.input_form.table(table_name)
 
             for row in table.rows:
                 key = row.cells[0].text
@@ -70,15 +65,15 @@ class Parameters:
                     # read it from the number of described elements in the corresponding table
                     else:
                         if 'participants' in key:
-                            self.dictionary[key] = self.get_number(self.tables.index(self.CHARACTERISTICS_TABLE))
+                            self.dictionary[key] = self.get_number(self.input_form.table(self.CHARACTERISTICS_TABLE))
                         if 'tasks' in key:
-                            self.dictionary[key] = self.get_number(self.tables.index(self.TASKS_TABLE))
+                            self.dictionary[key] = self.get_number(self.input_form.table(self.TASKS_TABLE))
 
                 # case where the value is a string
                 else:
                     self.dictionary[key] = value_text
 
-    def get_number(self, table_index: int) -> int:
+    def get_number(self, table: Table) -> int:
         """
         Get the number of described elements in a table.
 
@@ -86,21 +81,17 @@ class Parameters:
         if they were not provided in the text input form.
 
         Args:
-            table_index: Index of the table where the elements, i.e. participants or critical tasks, are described.
+            table: Table where the elements, i.e. participants or critical tasks, are described.
 
         Returns:
             The number of described elements, i.e. number of participants or number of critical tasks.
         """
 
-        table = self.text_input.tables[table_index]
+        described_rows = set(self.input_form.described_rows(table))
 
         # return the index of a row when nothing was written in it
-        for idx, row in enumerate(table.rows[1:]):
-            row_described = False
-            for cell in row.cells[1:]:
-                if cell.text:
-                    row_described = True
-            if not row_described:
+        for idx in range(len(table.rows) - 1):
+            if idx + 1 not in described_rows:
                 return idx
 
     def get_from_tasks_table(self):
@@ -110,8 +101,7 @@ class Parameters:
         The critical tasks table differs from the standard table because it has 3 columns.
         """
 
-        tasks_table_index = self.tables.index(self.TASKS_TABLE)
-        tasks_table = self.text_input.tables[tasks_table_index]
+        tasks_table = self.input_form.table(self.TASKS_TABLE)
 
         for row in tasks_table.rows[1:]:
             type_key = row.cells[0].text + ' name'
@@ -131,9 +121,8 @@ class Parameters:
         The problems table differs from the standard table because it has 3 columns and contains dropdown lists.
         """
 
-        problems_table_index = self.tables.index(self.PROBLEMS_TABLE)
-        problems_table = self.text_input.tables[problems_table_index]
-        problem_types = DropDownLists.get_from_table(self.text_input_soup, problems_table_index)
+        problems_table = self.input_form.table(self.PROBLEMS_TABLE)
+        problem_types = self.input_form.dropdown_values(self.PROBLEMS_TABLE)
 
         # return the index of a row when nothing was written in it to get the number of problems
         problems_number = 0
@@ -187,21 +176,44 @@ class Parameters:
 
                 value += 1
 
+    def get_from_participant_plots_dropdown(self):
+        """
+        Read the decision to create a plot for each participant from the dropdown list of the study table
+        and store it in the dictionary.
+
+        The dropdown list is the only one of the study table, its value is 'Yes' or 'No'.
+        """
+
+        decision = self.input_form.dropdown_values(self.PARTICIPANT_PLOTS_TABLE)
+        self.dictionary[self.PARTICIPANT_PLOTS_KEY] = decision[0] if decision else 'No'
+
+    @ classmethod
+    def participant_plots(cls, parameters_dictionary: Dict[str, Union[str, int]]) -> bool:
+        """
+        Args:
+            parameters_dictionary: Dictionary of all input parameters (key = parameter name, value = parameter value).
+
+        Returns:
+            True if a plot must be created for each participant, False if only the plots of all participants
+            that are added to the report are created.
+        """
+
+        return parameters_dictionary.get(cls.PARTICIPANT_PLOTS_KEY) == 'Yes'
+
     @ classmethod
-    def get_all(cls, text_input_document, text_input_soup, list_of_tables):
+    def get_all(cls, input_form: InputForm) -> Dict[str, Union[str, int]]:
         """
         Args:
-            text_input_document: .docx file where all inputs are written.
-            text_input_soup: BeautifulSoup of the xml of the input .docx file.
-            list_of_tables: List of all table names.
+            input_form: Text input form where all inputs are written.
 
         Returns:
             Dictionary containing values and keys of all parameters.
         """
 
-        parameters = cls(text_input_document, text_input_soup, list_of_tables)
+        parameters = cls(input_form)
 
         parameters.get_from_standard_tables()
+        parameters.get_from_participant_plots_dropdown()
         parameters.get_from_tasks_table()
         parameters.get_from_problems_table()
 
@@ -2,9 +2,11 @@ from docx.document import Document
 from docx.table import Table, _Row
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.enum.table import WD_ALIGN_VERTICAL, WD_TABLE_ALIGNMENT
+from functools import cached_property
 from typing import List, Dict, Union, Tuple
 
 from docx_package.layout import Layout
+from docx_package.input_form import InputForm
 
 
 class ParticipantsCharacteristics:
@@ -30,21 +32,18 @@ class ParticipantsCharacteristics:
 
     def __init__(self,
                  report_document: Document,
-                 text_input_document: Document,
-                 list_of_tables: List[str],
+                 input_form: InputForm,
                  parameters_dictionary: Dict[str, Union[str, int]]
                  ):
         """
         Args:
             report_document: .docx file where the report is written.
-            text_input_document: .docx file where all inputs are written.
-            list_of_tables: List of all table names.
+            input_form: Text input form where all inputs are written.
             parameters_dictionary: Dictionary of all input parameters (key = parameter name, value = parameter value)
         """
 
         self.report = report_document
-        self.text_input = text_input_document
-        self.tables = list_of_tables
+        self.input_form = input_form
         self.parameters = parameters_dictionary
 
     @ property
@@ -54,10 +53,11 @@ class ParticipantsCharacteristics:
             Table of the input .docx file where the participants' characteristics are written.
         """
 
-        participants_table_index = self.tables.index(self.CHARACTERISTICS_TABLE)
-        return self.text_input.tables[participants_table_index]
+        return self.input_form.table(self.CHARACTERISTICS_TABLE)
 
-    @ property
+    # the described rows are cached the first time they are read,
+    # clear_cached_properties forgets them, e.g. after the input table was changed
+    @ cached_property
     def described_rows(self) -> Tuple[int, List[_Row]]:
         """
         Get the number of described elements in a table.
@@ -67,75 +67,51 @@ class ParticipantsCharacteristics:
              and a list of rows in which they are described.
         """
 
-        participants_number = 0
-        described_rows = []
-
-        # store the row in the list if it is described and increase the number of participants
-        for row in self.input_table.rows[1:]:
-            row_described = False
-            for cell in row.cells[1:]:
-                if cell.text:
-                    row_described = True
-            if row_described:
-                participants_number += 1
-                described_rows.append(row)
+        # rows in which a participant is described
+        input_rows = self.input_table.rows
+        described_rows = [input_rows[idx] for idx in self.input_form.described_rows(self.input_table)]
 
-        return participants_number, described_rows
+        return len(described_rows), described_rows
 
     def add_table(self):
         """
         Add a table for the document history.
         """
 
-        participants_number = self.described_rows[0]
-        described_rows = self.described_rows[1]
-
-        # create table and define its style
-        rows_number = participants_number + 1
-        cols_number = len(self.input_table.columns)
-        appendix_table = self.report.add_table(rows_number, cols_number)
-        appendix_table.style = 'Table Grid'
-        appendix_table.alignment = WD_TABLE_ALIGNMENT.CENTER
-        appendix_table.autofit = True
-
-        for i in range(rows_number):
-            for j in range(cols_number):
-
-                # fill the first row
-                if i == 0:
-                    appendix_table.cell(i, j).text = self.input_table.cell(i, j).text
+        participants_number, described_rows = self.described_rows
 
-                # fill the first columns with 'P1', 'P2', 'P3', etc... with the number corresponding to the participant
-                elif i != 0 and j == 0:
-                    appendix_table.cell(i, j).text = 'P{}'.format(i)
-
-                # fill all other cells with the entries given in the described rows
-                else:
-                    appendix_table.cell(i, j).text = described_rows[i-1].cells[j].text
+        # fill the first row with the one of the input table, the first column with 'P1', 'P2', 'P3', etc...
+        # with the number corresponding to the participant, and all other cells with the entries of the described rows
+        values = [[cell.text for cell in self.input_table.rows[0].cells]]
+        for i, row in enumerate(described_rows):
+            values.append(['P{}'.format(i + 1)] + [cell.text for cell in row.cells[1:]])
 
         # color the first row in light_grey_10 and set the font to bold
-        for cell in appendix_table.rows[0].cells:
-            Layout.set_cell_shading(cell, self.LIGHT_GREY_10)
-            cell.paragraphs[0].runs[0].font.bold = True
-
-        # set the vertical and horizontal alignment of all cells
-        for row in appendix_table.rows:
-            for cell in row.cells:
-                cell.vertical_alignment = WD_ALIGN_VERTICAL.CENTER
-        for i in range(rows_number):
-            for j in range(cols_number):
-                if i == 0 or j == 0:
-                    appendix_table.cell(i, j).paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.CENTER
-
-        # set the width of all columns
-        for idx, column in enumerate(appendix_table.columns):
-            Layout.set_column_width(column, self.TABLE_WIDTHS[idx])
+        rows_number = participants_number + 1
+        cols_number = len(values[0])
+        shading = [[self.LIGHT_GREY_10] * cols_number] + [[None] * cols_number] * participants_number
+        bold = [[True] * cols_number] + [[False] * cols_number] * participants_number
+
+        # center the cells of the first row and of the first column
+        alignments = [[WD_ALIGN_PARAGRAPH.CENTER if i == 0 or j == 0 else None for j in range(cols_number)]
+                      for i in range(rows_number)]
+
+        Layout.add_table(self.report,
+                         values,
+                         style='Table Grid',
+                         alignment=WD_TABLE_ALIGNMENT.CENTER,
+                         autofit=True,
+                         widths=self.TABLE_WIDTHS,
+                         shading=shading,
+                         bold=bold,
+                         alignments=alignments,
+                         vertical_alignment=WD_ALIGN_VERTICAL.CENTER
+                         )
 
     @ classmethod
     def write(cls,
               report_document: Document,
-              text_input_document: Document,
-              list_of_tables: List[str],
+              input_form: InputForm,
               parameters_dictionary: Dict[str, Union[str, int]]
               ):
         """
@@ -143,12 +119,11 @@ class ParticipantsCharacteristics:
 
         Args:
             report_document: .docx file where the report is written.
-            text_input_document: .docx file where all inputs are written.
-            list_of_tables: List of all table names.
+            input_form: Text input form where all inputs are written.
             parameters_dictionary: Dictionary of all input parameters (key = parameter name, value = parameter value)
         """
 
-        participant_appendix = cls(report_document, text_input_document, list_of_tables, parameters_dictionary)
+        participant_appendix = cls(report_document, input_form, parameters_dictionary)
 
         if participant_appendix.described_rows[0] != 0:
 
@@ -1,10 +1,13 @@
 from typing import List, Union
+from io import BytesIO
 from docx import Document
 from docx.oxml import OxmlElement
 from docx.oxml.ns import qn
 from docx.shared import Cm
 from os import listdir
-from PIL import Image, UnidentifiedImageError
+
+from docx_package.figure_captions import FigureCaptions
+from docx_package.picture_index import PictureIndex
 
 
 class Picture:
@@ -19,11 +22,14 @@ class Picture:
     # information for the caption
     CAPTION_LABEL = 'Figure '
     CAPTION_STYLE = 'Caption'
+    CAPTION_INSTRUCTION = 'SEQ Figure \\* ARABIC'
 
     def __init__(self,
                  report_document: Document,
-                 picture_paths: List[str],
+                 figure_captions: FigureCaptions,
+                 picture_index: Union[PictureIndex, None],
                  picture_name: str,
+                 picture_slot: Union[int, None],
                  caption_text: str,
                  picture_width: Union[Cm, None],
                  picture_height: Union[Cm, None],
@@ -33,8 +39,10 @@ class Picture:
         """
         Args:
             report_document: .docx file where the report is written.
-            picture_paths: List of paths of all input pictures.
-            picture_name: Name of the picture file without the extension.
+            figure_captions: Captions of the figures of the report.
+            picture_index: Index of all input pictures.
+            picture_name: Name of the picture file without the slot number and the extension.
+            picture_slot: Number of the picture for this name, None if there is a single picture.
             caption_text: Text of the picture caption.
             picture_width: Width of the picture as it appears in the report.
             picture_height: Height of the picture as it appears in the report.
@@ -43,8 +51,10 @@ class Picture:
         """
 
         self.report = report_document
-        self.picture_paths = picture_paths
+        self.figure_captions = figure_captions
+        self.picture_index = picture_index
         self.picture_name = picture_name
+        self.picture_slot = picture_slot
         self.caption = caption_text
         self.width = picture_width
         self.height = picture_height
@@ -77,60 +87,71 @@ class Picture:
             True if a picture was added, and False if not.
         """
 
-        # find the files that correspond to the picture file name
-        for index, picture_path in enumerate(self.picture_paths):
-            if self.picture_name in picture_path:
+        # find the image that corresponds to the picture name and slot, a picture is only added once
+        picture = self.picture_index.get(self.picture_name, self.picture_slot)
+        if picture is None or picture.used:
+            return False
+
+        # add a picture with the given size in the center of the side margin
+        picture_paragraph = self.report.add_paragraph(style='Picture')
+        picture_paragraph.add_run().add_picture(picture.embed_path, width=self.width, height=self.height)
 
-                try:
-                    # try to open the file to control that it is an image
-                    Image.open(picture_path)
+        # set space before the paragraph of the picture
+        picture_paragraph.paragraph_format.space_before = self.space_before
 
-                    # add a picture with the given size in the center of the side margin
-                    picture_paragraph = self.report.add_paragraph(style='Picture')
-                    picture_paragraph.add_run().add_picture(picture_path, width=self.width, height=self.height)
+        picture.used = True
 
-                    # set space before the paragraph of the picture
-                    picture_paragraph.paragraph_format.space_before = self.space_before
+        return True
 
-                    # delete the path from the list because this picture will not be added again
-                    self.picture_paths.pop(index)
+    def add_figure(self, figure: bytes):
+        """
+        Add a figure that was rendered in memory to the report, that is centered w.r.t. the margin.
 
-                    # terminate because a picture was added and return True
-                    return True
+        Args:
+            figure: Content of the .png file of the figure.
+        """
 
-                # do nothing if the file is not an image
-                except UnidentifiedImageError:
-                    pass
+        # add a picture with the given size in the center of the side margin
+        picture_paragraph = self.report.add_paragraph(style='Picture')
+        picture_paragraph.add_run().add_picture(BytesIO(figure), width=self.width, height=self.height)
 
-        # return False because no picture was added
-        return False
+        # set space before the paragraph of the picture
+        picture_paragraph.paragraph_format.space_before = self.space_before
 
     def add_caption(self):
         """
         Add a caption of the form: 'Figure <figure number>: <caption text>, e.g. 'Figure 3: A medical device.'
 
-        The caption will not appear in this form at the first time.
-        It has to be updated by pressing Ctrl + A, and then F9.
+        The figure number is written as the result of the field of the caption,
+        so that the caption is correct without updating the fields in Word.
         """
 
         # add the label of the caption
         caption_paragraph = self.report.add_paragraph(self.CAPTION_LABEL, style=self.CAPTION_STYLE)
 
-        # add XML elements and set their attributes so that the caption is considered as such and can be updated
-        run = caption_paragraph.add_run()
-        r_element = run._r
+        # number the figure after the figures that were already added to the report
+        figure_number = self.figure_captions.add(caption_paragraph, self.caption)
 
+        # add XML elements and set their attributes so that the caption is considered as such and can be updated,
+        # each part of the field is in its own run and the figure number is the result of the field
         fldChar = OxmlElement('w:fldChar')
         fldChar.set(qn('w:fldCharType'), 'begin')
-        r_element.append(fldChar)
+        caption_paragraph.add_run()._r.append(fldChar)
 
         instrText = OxmlElement('w:instrText')
-        instrText.text = 'SEQ Figure \\* ARABIC'
-        r_element.append(instrText)
+        instrText.set(qn('xml:space'), 'preserve')
+        instrText.text = self.CAPTION_INSTRUCTION
+        caption_paragraph.add_run()._r.append(instrText)
+
+        fldChar = OxmlElement('w:fldChar')
+        fldChar.set(qn('w:fldCharType'), 'separate')
+        caption_paragraph.add_run()._r.append(fldChar)
+
+        caption_paragraph.add_run(str(figure_number))
 
         fldChar = OxmlElement('w:fldChar')
         fldChar.set(qn('w:fldCharType'), 'end')
-        r_element.append(fldChar)
+        caption_paragraph.add_run()._r.append(fldChar)
 
         # add the text of the caption
         caption_paragraph.add_run(': {}'.format(self.caption))
@@ -141,23 +162,27 @@ class Picture:
     @ classmethod
     def add_picture_and_caption(cls,
                                 report_document: Document,
-                                picture_paths: List[str],
+                                figure_captions: FigureCaptions,
+                                picture_index: PictureIndex,
                                 picture_name: str,
                                 caption: str,
+                                slot=None,
                                 width=None,
                                 height=None,
                                 space_before=None,
                                 space_after=None
                                 ):
         """
-        Add a picture to the report if there is one that corresponds to the picture file name
+        Add a picture to the report if there is one that corresponds to the picture name and slot
         and a caption after the picture if one was added.
 
         Args:
             report_document: .docx file where the report is written.
-            picture_paths: List of paths of all input pictures.
-            picture_name: Name of the picture file without the extension.
+            figure_captions: Captions of the figures of the report.
+            picture_index: Index of all input pictures.
+            picture_name: Name of the picture file without the slot number and the extension.
             caption: Text of the picture caption.
+            slot (optional): Number of the picture for this name, None if there is a single picture.
             width (optional): Width of the picture as it appears in the report.
             height (optional): Height of the picture as it appears in the report.
             space_before (optional): Space before the paragraph of the picture.
@@ -166,18 +191,53 @@ class Picture:
                                     None if inherited from the style hierarchy.
         """
 
-        picture = cls(report_document, picture_paths, picture_name, caption, width, height, space_before, space_after)
+        picture = cls(report_document, figure_captions, picture_index, picture_name, slot, caption, width, height,
+                      space_before, space_after)
         picture_added = picture.add_picture()
         if picture_added:
             picture.add_caption()
 
+    @ classmethod
+    def add_figure_and_caption(cls,
+                               report_document: Document,
+                               figure_captions: FigureCaptions,
+                               figure: Union[bytes, None],
+                               caption: str,
+                               width=None,
+                               height=None,
+                               space_before=None,
+                               space_after=None
+                               ):
+        """
+        Add a figure that was rendered in memory, e.g. a plot, to the report if there is one
+        and a caption after the figure.
+
+        Args:
+            report_document: .docx file where the report is written.
+            figure_captions: Captions of the figures of the report.
+            figure: Content of the .png file of the figure, or None if no figure was rendered.
+            caption: Text of the figure caption.
+            width (optional): Width of the figure as it appears in the report.
+            height (optional): Height of the figure as it appears in the report.
+            space_before (optional): Space before the paragraph of the figure.
+                                     None if inherited from the style hierarchy.
+            space_after (optional): Space after the paragraph of the caption.
+                                    None if inherited from the style hierarchy.
+        """
+
+        if figure is not None:
+            picture = cls(report_document, figure_captions, None, '', None, caption, width, height, space_before, space_after)
+            picture.add_figure(figure)
+            picture.add_caption()
+
     @ staticmethod
     def add_figures_list(report_document):
         """
         Add a list of figures.
 
-        The list of figures will not appear at the first time.
-        It has to be updated by pressing Ctrl + A, and then F9.
+        The entries of the list of figures are written by Fields.update once the whole report is built,
+        and their page numbers are added when the fields are updated in Word, e.g. by pressing Ctrl + A, and then F9.
+        Updating the fields in Word also writes the list of figures if Fields.update was not called.
 
         Args:
             report_document: .docx file where the report is written.
@@ -205,7 +265,8 @@ class Picture:
         fldChar2 = OxmlElement('w:fldChar')
         fldChar2.set(qn('w:fldCharType'), 'separate')
         fldChar3 = OxmlElement('w:t')
-        fldChar3.text = 'Press "Ctrl + A" to select everything and then "F9" to update fields.'
+        # placeholder that is replaced by the entries of the list of figures when the fields are resolved
+        fldChar3.text = 'No list of figures yet: press "Ctrl + A" to select everything and then "F9" to update fields.'
         fldChar2.append(fldChar3)
         r.append(fldChar2)
 
@@ -214,24 +275,25 @@ class Picture:
         r.append(fldChar4)
 
     @ staticmethod
-    def error_message(picture_paths):
+    def error_message(picture_index: PictureIndex):
         """
         Print an error message that show the path of the pictures that were not added to the report
         and give some possible problems that might have occurred.
 
         Args:
-            picture_paths: List of paths of all remaining input pictures.
+            picture_index: Index of all input pictures.
         """
 
         print('These pictures were not added to the report:')
 
-        # print path of all pictures that were added
-        for picture_path in picture_paths:
+        # print path of all pictures that were not added
+        for picture_path in picture_index.unused_paths():
             print('   ', picture_path)
 
         print('\nPossible problems are: \n',
               '   1. It is not an image file. \n',
               '   2. More than 3 pictures were given for a chapter. \n',
-              '   3. The name of the file is unexpected.'
+              '   3. The name of the file is unexpected. \n',
+              '   4. Several files were given for the same picture.'
               )
         print('\n----------\n')
@@ -0,0 +1,120 @@
+import os
+import re
+from typing import Dict, List, Tuple, Union
+
+from docx_package.image_metadata import ImageMetadata, ImageMetadataCache
+from docx_package.picture_preprocessor import PicturePreprocessor
+
+
+class PictureFile:
+    """
+    Class that represents an input picture that was validated as an image, with its metadata.
+    """
+
+    def __init__(self, path: str, metadata: ImageMetadata):
+        """
+        Args:
+            path: Path of the input picture.
+            metadata: Format, size and resolution of the image.
+        """
+
+        self.path = path
+        self.metadata = metadata
+
+        # path of the file that is added to the report, i.e. the preprocessed picture if there is one
+        self.embed_path = path
+
+        # True when the picture was added to the report
+        self.used = False
+
+
+class PictureIndex:
+    """
+    Class that represents the index of the input pictures, with the picture name and the slot number as key.
+
+    The name of a picture file is the picture name followed by the slot number, e.g. 'Purpose2.jpg' is the second
+    picture of the 'Purpose' chapter, or only the picture name if there is a single picture, e.g. 'Cover_page.jpg'.
+    The index is built once from the paths of all input pictures and the header of each file is read once to control
+    that it is an image, so that a picture is found without scanning all paths and opening their files again.
+    """
+
+    # picture name and slot number in the name of a picture file without the extension
+    FILE_NAME_PATTERN = re.compile(r'(?P<name>.*?)(?P<slot>\d*)')
+
+    def __init__(self,
+                 picture_paths: List[str],
+                 preprocessor: Union[PicturePreprocessor, None] = None,
+                 metadata_cache: Union[ImageMetadataCache, None] = None
+                 ):
+        """
+        Args:
+            picture_paths: List of paths of all input pictures.
+            preprocessor (optional): Preprocessing of the pictures before they are added to the report,
+                                     the input pictures are added as they are if it is None.
+            metadata_cache (optional): Cache of the metadata of the images, shared with the preprocessing.
+                                       A new cache is used if it is None.
+        """
+
+        self.metadata_cache = metadata_cache if metadata_cache is not None else ImageMetadataCache()
+
+        # validated pictures with the picture name and the slot number as key
+        self.pictures: Dict[Tuple[str, Union[int, None]], PictureFile] = {}
+
+        # paths of the files that cannot be added, i.e. files that are not images and second files for the same slot
+        self.rejected_paths = []
+
+        # the paths are sorted so that the same file is chosen for a slot whatever the order of the directory listing
+        for picture_path in sorted(picture_paths):
+            key = self.key(os.path.splitext(os.path.basename(picture_path))[0])
+            if key in self.pictures:
+                self.rejected_paths.append(picture_path)
+                continue
+
+            metadata = self.metadata_cache.get(picture_path)
+            if metadata is not None:
+                self.pictures[key] = PictureFile(picture_path, metadata)
+            else:
+                self.rejected_paths.append(picture_path)
+
+        if preprocessor is not None:
+            pictures = list(self.pictures.values())
+            embed_paths = preprocessor.prepare([picture.path for picture in pictures])
+            for picture, embed_path in zip(pictures, embed_paths):
+                picture.embed_path = embed_path
+
+    @ classmethod
+    def key(cls, file_name: str) -> Tuple[str, Union[int, None]]:
+        """
+        Args:
+            file_name: Name of the picture file without the extension, e.g. 'Purpose2'.
+
+        Returns:
+            Picture name and slot number of the picture, e.g. ('Purpose', 2), the slot number is None if there is none.
+        """
+
+        match = cls.FILE_NAME_PATTERN.fullmatch(file_name)
+        slot = match.group('slot')
+
+        return match.group('name'), int(slot) if slot else None
+
+    def get(self, picture_name: str, slot: Union[int, None] = None) -> Union[PictureFile, None]:
+        """
+        Args:
+            picture_name: Name of the picture, e.g. 'Purpose' or 'Cover_page'.
+            slot (optional): Number of the picture for this name, None if there is a single picture.
+
+        Returns:
+            Picture for this name and slot, or None if there is no such image in the input pictures.
+        """
+
+        return self.pictures.get((picture_name, slot))
+
+    def unused_paths(self) -> List[str]:
+        """
+        Returns:
+            List of paths of the input pictures that were not added to the report.
+        """
+
+        unused_paths = [picture.path for picture in self.pictures.values() if not picture.used]
+
+        return sorted(unused_paths + self.rejected_paths)
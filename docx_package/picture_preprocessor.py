@@ -0,0 +1,157 @@
+import os
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+from typing import List, Union
+from docx.shared import Cm
+from PIL import Image, UnidentifiedImageError
+
+from docx_package.image_metadata import ImageMetadataCache
+
+
+class PicturePreprocessor:
+    """
+    Class that represents the preprocessing of the input pictures before they are added to the report.
+
+    The pictures are added with a width of at most 14 cm, so a picture that has more pixels than needed to print it
+    at this width is downsampled and recompressed. The preprocessed pictures are stored in a cache directory
+    named after the hash of the content of the input picture and of the preprocessing settings,
+    so that a picture is only preprocessed again when it changed.
+
+    The preprocessed pictures keep the name of the input picture, so that they are found by name as the input pictures.
+    Whether a picture must be preprocessed is decided from the header of its file, so that only the pictures that are
+    preprocessed are read entirely, and they are read once to be both hashed and decoded.
+    """
+
+    # path to the directory where the preprocessed pictures are stored
+    CACHE_DIRECTORY_PATH = 'Outputs/Cache/Pictures'
+
+    # version of the preprocessed pictures, it must be increased when the way the pictures are preprocessed changes
+    VERSION = 1
+
+    # largest width of an input picture in the report, i.e. the width of the cover page picture
+    MAX_WIDTH = Cm(14)
+
+    # resolution of the pictures when the report is printed, in dots per inch
+    PRINT_DPI = 300
+
+    # options used to recompress the pictures in each format, the pictures in other formats are not preprocessed
+    SAVE_OPTIONS = {
+        'JPEG': {'quality': 85, 'optimize': True},
+        'PNG': {'optimize': True}
+    }
+
+    # extension of the empty file written next to a preprocessed picture when the input picture is kept,
+    # because its preprocessed version is not smaller, so that it is not preprocessed again at the next run
+    KEEP_ORIGINAL_EXTENSION = '.original'
+
+    def __init__(self,
+                 workers: int = 1,
+                 cache_directory_path: str = CACHE_DIRECTORY_PATH,
+                 metadata_cache: Union[ImageMetadataCache, None] = None
+                 ):
+        """
+        Args:
+            workers (optional): Number of processes that preprocess the pictures concurrently.
+                                The pictures are preprocessed one after the other in the current process if it is 1.
+            cache_directory_path (optional): Path to the directory where the preprocessed pictures are stored.
+            metadata_cache (optional): Cache of the metadata of the images, shared with the picture index.
+                                       A new cache is used if it is None.
+        """
+
+        self.workers = workers
+        self.directory = cache_directory_path
+        self.metadata_cache = metadata_cache if metadata_cache is not None else ImageMetadataCache()
+
+        # largest width of the preprocessed pictures in pixels
+        self.max_pixel_width = round(self.MAX_WIDTH.inches * self.PRINT_DPI)
+
+    def cache_file_path(self, picture_path: str, content: bytes) -> str:
+        """
+        Args:
+            picture_path: Path of the input picture.
+            content: Content of the file of the input picture.
+
+        Returns:
+            Path of the preprocessed picture, in a directory named after the hash of the input picture.
+        """
+
+        key = hashlib.sha1('{}|{}|{}|'.format(self.VERSION, self.max_pixel_width, self.SAVE_OPTIONS).encode())
+        key.update(content)
+
+        return os.path.join(self.directory, key.hexdigest(), os.path.basename(picture_path))
+
+    def prepare_picture(self, picture_path: str) -> str:
+        """
+        Downsample and recompress a picture if it is bigger than needed to print it in the report.
+
+        Args:
+            picture_path: Path of the input picture.
+
+        Returns:
+            Path of the preprocessed picture, or the path of the input picture if it is not preprocessed,
+            e.g. if it is not an image, if it is small enough or if the cache directory cannot be written.
+        """
+
+        # the pictures that are not images, that are small enough or in another format are not read entirely
+        metadata = self.metadata_cache.get(picture_path)
+        if metadata is None or metadata.format not in self.SAVE_OPTIONS or metadata.width <= self.max_pixel_width:
+            return picture_path
+
+        save_options = self.SAVE_OPTIONS[metadata.format]
+
+        try:
+            # read the file once to compute its hash and, if it is not in the cache, to decode it
+            with open(picture_path, 'rb') as picture_file:
+                content = picture_file.read()
+
+            cache_file_path = self.cache_file_path(picture_path, content)
+            if os.path.exists(cache_file_path):
+                return cache_file_path
+            if os.path.exists(cache_file_path + self.KEEP_ORIGINAL_EXTENSION):
+                return picture_path
+
+            with Image.open(BytesIO(content)) as picture:
+                # keep the height/width ratio and the metadata of the picture, e.g. its orientation
+                height = max(round(picture.height * self.max_pixel_width / picture.width), 1)
+                exif = picture.info.get('exif', b'')
+                resized_picture = picture.resize((self.max_pixel_width, height), Image.LANCZOS)
+
+            os.makedirs(os.path.dirname(cache_file_path), exist_ok=True)
+
+            # write in a temporary file first so that an interrupted run does not leave a broken picture
+            temporary_path = '{}.{}.tmp'.format(cache_file_path, os.getpid())
+            resized_picture.save(temporary_path, metadata.format, exif=exif,
+                                 dpi=(self.PRINT_DPI, self.PRINT_DPI), **save_options)
+
+            # keep the input picture if the preprocessed one is not smaller, and remember it in the cache
+            if os.path.getsize(temporary_path) >= len(content):
+                os.remove(temporary_path)
+                open(cache_file_path + self.KEEP_ORIGINAL_EXTENSION, 'wb').close()
+                return picture_path
+
+            os.replace(temporary_path, cache_file_path)
+            return cache_file_path
+
+        # the picture is added as it is if it is not an image or if the preprocessing fails
+        except (UnidentifiedImageError, OSError, ValueError):
+            return picture_path
+
+    def prepare(self, picture_paths: List[str]) -> List[str]:
+        """
+        Preprocess all input pictures.
+
+        Args:
+            picture_paths: List of paths of all input pictures.
+
+        Returns:
+            List of paths of the pictures that are added to the report, in the order of the input pictures.
+        """
+
+        # preprocess the pictures one after the other or on a pool of processes,
+        # map returns the paths in the order of the input pictures in both cases
+        if self.workers > 1 and len(picture_paths) > 1:
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                return list(executor.map(self.prepare_picture, picture_paths))
+
+        return [self.prepare_picture(picture_path) for picture_path in picture_paths]
@@ -16,8 +16,9 @@ class TableOfContent:
         """
         Add a table of content.
 
-        The table of content will not appear at the first time.
-        It has to be updated by pressing Ctrl + A, and then F9.
+        The entries of the table of content are written by Fields.update once the whole report is built,
+        and their page numbers are added when the fields are updated in Word, e.g. by pressing Ctrl + A, and then F9.
+        Updating the fields in Word also writes the table of content if Fields.update was not called.
 
         Args:
             report_document: .docx file where the report is written.
@@ -45,7 +46,8 @@ class TableOfContent:
         fldChar2 = OxmlElement('w:fldChar')
         fldChar2.set(qn('w:fldCharType'), 'separate')
         fldChar3 = OxmlElement('w:t')
-        fldChar3.text = 'Press "Ctrl + A" to select everything and then "F9" to update fields.'
+        # placeholder that is replaced by the entries of the table of content when the fields are resolved
+        fldChar3.text = 'No table of content yet: press "Ctrl + A" to select everything and then "F9" to update fields.'
         fldChar2.append(fldChar3)
         r.append(fldChar2)
 
@@ -1,14 +1,17 @@
 from docx.document import Document
-from bs4 import BeautifulSoup
+from functools import cached_property
 from typing import List, Dict, Union
 import numpy as np
 import pandas as pd
 from docx.shared import Cm
 
-from docx_package.dropdown_lists import DropDownLists
+from docx_package.input_form import InputForm
+from docx_package.parameters import Parameters
 from docx_package.results import ResultsChapter
 from docx_package.picture import Picture
-from eye_tracking_package.plot import Plot
+from docx_package.figure_captions import FigureCaptions
+from docx_package.picture_index import PictureIndex
+from eye_tracking_package.plot_scheduler import PlotScheduler
 
 
 class TimeOnTasks:
@@ -46,35 +49,37 @@ class TimeOnTasks:
 
     def __init__(self,
                  report_document: Document,
-                 text_input_document: Document,
-                 text_input_soup: BeautifulSoup,
-                 list_of_tables: List[str],
-                 picture_paths_list: List[str],
+                 input_form: InputForm,
+                 picture_index: PictureIndex,
+                 figure_captions: FigureCaptions,
                  parameters_dictionary: Dict[str, Union[str, int]],
-                 tobii_data: pd.DataFrame
+                 tobii_data: pd.DataFrame,
+                 plot_scheduler: PlotScheduler = None
                  ):
         """
         Args:
             report_document: .docx file where the report is written.
-            text_input_document: .docx file where all inputs are written.
-            text_input_soup: BeautifulSoup of the xml of the input .docx file.
-            list_of_tables: List of all table names.
-            picture_paths_list: List of the path of all input pictures.
+            input_form: Text input form where all inputs are written.
+            picture_index: Index of all input pictures.
+            figure_captions: Captions of the figures of the report.
             parameters_dictionary: Dictionary of all input parameters (key = parameter name, value = parameter value).
             tobii_data: Data frame that contains the given Tobii data.
+            plot_scheduler (optional): Scheduler that renders the plots of the chapter.
+                                       The plots are rendered directly if it is None.
         """
 
         self.report = report_document
-        self.text_input = text_input_document
-        self.text_input_soup = text_input_soup
-        self.picture_paths = picture_paths_list
+        self.input_form = input_form
+        self.picture_index = picture_index
+        self.figure_captions = figure_captions
         self.parameters = parameters_dictionary
-        self.tables = list_of_tables
-        input_table_index = self.tables.index(self.TIME_ON_TASK_TABLE)
-        self.input_table = text_input_document.tables[input_table_index]
+        self.input_table = input_form.table(self.TIME_ON_TASK_TABLE)
         self.tobii_data = tobii_data
+        self.plot_scheduler = plot_scheduler if plot_scheduler is not None else PlotScheduler()
 
-    @ property
+    # the values computed from the input table and the Tobii data are cached the first time they are read,
+    # clear_cached_properties forgets them, e.g. after one of them was changed
+    @ cached_property
     def tasks_number(self) -> int:
         """
         Returns:
@@ -83,17 +88,10 @@ class TimeOnTasks:
             and the one given in the Tobii data.
         """
 
-        table_tasks_number = 0
         tobii_tasks_number = 0
 
         # get the index of the last row that is filled which corresponds to the number of critical tasks
-        for i in range(1, len(self.input_table.rows)):
-            row_filled = False
-            for cell in self.input_table.rows[i].cells[1:]:
-                if cell.text:
-                    row_filled = True
-            if row_filled:
-                table_tasks_number = i
+        table_tasks_number = max(self.input_form.described_rows(self.input_table), default=0)
 
         # get the number of critical tasks described in the Tobii data
         tobii_tasks = self.tobii_data[self.EVENT_LABEL].tolist()
@@ -106,7 +104,7 @@ class TimeOnTasks:
                     table_tasks_number,
                     self.parameters[self.TASKS_NUMBER_KEY]])
 
-    @ property
+    @ cached_property
     def participants_number(self) -> int:
         """
         Returns:
@@ -115,17 +113,10 @@ class TimeOnTasks:
             and the one given in the Tobii data.
         """
 
-        table_participants_number = 0
         tobii_participants_number = 0
 
         # get the index of the last column that is filled which corresponds to the number of participants
-        for j in range(1, len(self.input_table.columns)):
-            column_completed = False
-            for cell in self.input_table.columns[j].cells[1:]:
-                if cell.text:
-                    column_completed = True
-            if column_completed:
-                table_participants_number = j
+        table_participants_number = max(self.input_form.described_columns(self.input_table), default=0)
 
         # get the number of participants described in the Tobii data
         tobii_participants = self.tobii_data.index.values.tolist()
@@ -138,7 +129,7 @@ class TimeOnTasks:
                     table_participants_number,
                     self.parameters[self.PARTICIPANTS_NUMBER_KEY]])
 
-    @ property
+    @ cached_property
     def tasks(self) -> List[str]:
         """
         Returns:
@@ -156,15 +147,14 @@ class TimeOnTasks:
 
         return tasks
 
-    @ property
+    @ cached_property
     def participants(self) -> List[str]:
         """
         Returns:
             List of participants, i.e. [Participant 1, Participant 2, ...].
         """
 
-        participants = ['Participant{}'.format(i) for i in range(1, self.participants_number + 1)]
-        return participants
+        return ['Participant{}'.format(i) for i in range(1, self.participants_number + 1)]
 
     @ property
     def times_from_table(self) -> pd.DataFrame:
@@ -193,7 +183,42 @@ class TimeOnTasks:
 
         return times_df
 
-    def times_from_tables_and_tobii(self):
+    def times_from_tobii(self) -> pd.DataFrame:
+        """
+        Compute the completion times of all participants and tasks from the Tobii events at once.
+
+        The events of a task are read in pairs, i.e. a start and an end, so that a task can be attempted several times.
+        The completion time is the sum of the durations of all attempts, an attempt without end is ignored.
+
+        Returns:
+            Data frame of tasks completion times with participants as index and task events, e.g. 'Task1', as columns,
+            with NaN when no attempt was recorded for a participant and a task.
+        """
+
+        participants = self.tobii_data.index.to_numpy()
+        events = self.tobii_data[self.EVENT_LABEL].to_numpy()
+        seconds = self.tobii_data[self.SECONDS_LABEL].to_numpy(dtype=np.float64)
+
+        if len(seconds) == 0:
+            return pd.DataFrame(dtype=np.float64)
+
+        # position of each event among the events of the same participant and task,
+        # the even positions are the starts and the odd positions are the ends of the attempts
+        events_df = pd.DataFrame({'participant': participants, 'event': events})
+        groups = events_df.groupby(['participant', 'event'], sort=False)
+        position = groups.cumcount().to_numpy()
+        group_codes = groups.ngroup().to_numpy()
+        events_number = np.bincount(group_codes)[group_codes]
+
+        # keep the complete attempts and add the end times and subtract the start times
+        complete = position < events_number - events_number % 2
+        signed_seconds = np.where(position % 2 == 1, seconds, -seconds)
+
+        times = pd.Series(signed_seconds[complete]).groupby([participants[complete], events[complete]]).sum()
+
+        return times.unstack()
+
+    def times_from_tables_and_tobii(self) -> pd.DataFrame:
         """
         Complete the data frame of tasks completion times with the input given through Tobii.
 
@@ -204,18 +229,16 @@ class TimeOnTasks:
         # data frame of tasks completion times with the input given through the text input form
         times_df = self.times_from_table
 
-        for participant in self.participants:
-            participants_data = self.tobii_data[self.tobii_data.index == participant]
-            for idx, task in enumerate(self.tasks):
-                tasks_data = participants_data[participants_data[self.EVENT_LABEL] == 'Task{}'.format(idx+1)]
+        # completion times given through Tobii in the same order as the input times
+        task_events = ['Task{}'.format(idx+1) for idx in range(len(self.tasks))]
+        tobii_times = self.times_from_tobii().reindex(index=self.participants, columns=task_events)
+        tobii_times = tobii_times.to_numpy(dtype=np.float64)
 
-                # replace the time in the data frame or do nothing when no time was given through Tobii
-                try:
-                    seconds = tasks_data[self.SECONDS_LABEL].to_numpy()
-                    time = seconds[1] - seconds[0]
-                    times_df.loc[participant].at[task] = time
-                except IndexError:
-                    pass
+        # replace the times of the input table by the ones given through Tobii when they are given
+        times = times_df.to_numpy(copy=True)
+        given_through_tobii = ~np.isnan(tobii_times)
+        times[given_through_tobii] = tobii_times[given_through_tobii]
+        times_df = pd.DataFrame(times, index=times_df.index, columns=times_df.columns)
 
         # delete all rows and columns that are full of missing values
         times_df = times_df.dropna(axis=0, how='all')
@@ -231,55 +254,74 @@ class TimeOnTasks:
             i.e. 'Bar plot' or 'Box plot'.
         """
 
-        plot_type_list = DropDownLists.get_from_table(self.text_input_soup,
-                                                       self.tables.index(self.PLOT_TYPE_TABLE)
-                                                       )
+        plot_type_list = self.input_form.dropdown_values(self.PLOT_TYPE_TABLE)
         return plot_type_list[0]
 
+    @ property
+    def embedded_figures(self) -> List[str]:
+        """
+        Returns:
+            List of paths of the figures that are added to the report, i.e. the plot of the chosen plot type.
+        """
+
+        if self.plot_type == 'Bar plot':
+            return [self.BAR_PLOT_FIGURE_PATH]
+        if self.plot_type == 'Box plot':
+            return [self.BOX_PLOT_FIGURE_PATH]
+        return []
+
     def make_plots(self):
         """
         Create plots with the time on tasks values.
 
-        One bar plot for each participant is created.
-        One bar plot showing a confidence interval of 95% and one box plot with the data of
-        all participants are created.
+        One bar plot for each participant is created if it is asked in the text input form.
+        One bar plot showing a confidence interval of 95% or one box plot with the data of
+        all participants is created, depending on the plot that is added to the report.
         """
 
         task_times_df = self.times_from_tables_and_tobii()
 
-        # create a bar plot for each participant
-        for idx, participant in enumerate(self.participants):
+        # create a bar plot for each participant if the plots of the participants are asked
+        participants = self.participants if Parameters.participant_plots(self.parameters) else []
+        for idx, participant in enumerate(participants):
 
             try:
                 participant_times = task_times_df.loc[participant].to_numpy()
                 participant_times_df = pd.DataFrame(data=[participant_times],
                                                     columns=task_times_df.columns)
 
-                Plot.make_barplot(data_frame=participant_times_df,
-                                  figure_save_path=self.PARTICIPANT_FIGURE_PATH.format(idx+1),
-                                  title='Time on task: participant {}'.format(idx+1),
-                                  ylabel='Completion time [s]',
-                                  xlabel='Critical task'
-                                  )
+                self.plot_scheduler.submit('barplot',
+                                           data_frame=participant_times_df,
+                                           figure_save_path=self.PARTICIPANT_FIGURE_PATH.format(idx+1),
+                                           title='Time on task: participant {}'.format(idx+1),
+                                           ylabel='Completion time [s]',
+                                           xlabel='Critical task'
+                                           )
 
             # pass when no data is available for a participant
             except KeyError:
                 pass
 
-        # create a bar plot and a box plot with the data of all participants or do nothing if no data is provided
+        # create the bar plot or the box plot with the data of all participants that is added to the report
+        # or do nothing if no data is provided
+        embedded_figures = self.embedded_figures
         try:
-            Plot.make_barplot(data_frame=task_times_df,
-                              figure_save_path=self.BAR_PLOT_FIGURE_PATH,
-                              title='Time on task',
-                              ylabel='Completion time [s]',
-                              xlabel='Critical task'
-                              )
-            Plot.make_boxplot(data_frame=task_times_df,
-                              figure_save_path=self.BOX_PLOT_FIGURE_PATH,
-                              title='Time on task',
-                              ylabel='Completion time [s]',
-                              xlabel='Critical task'
-                              )
+            if self.BAR_PLOT_FIGURE_PATH in embedded_figures:
+                self.plot_scheduler.submit('barplot',
+                                           data_frame=task_times_df,
+                                           figure_save_path=self.BAR_PLOT_FIGURE_PATH,
+                                           title='Time on task',
+                                           ylabel='Completion time [s]',
+                                           xlabel='Critical task'
+                                           )
+            if self.BOX_PLOT_FIGURE_PATH in embedded_figures:
+                self.plot_scheduler.submit('boxplot',
+                                           data_frame=task_times_df,
+                                           figure_save_path=self.BOX_PLOT_FIGURE_PATH,
+                                           title='Time on task',
+                                           ylabel='Completion time [s]',
+                                           xlabel='Critical task'
+                                           )
         except ValueError:
             pass
 
@@ -288,34 +330,33 @@ class TimeOnTasks:
         Write the whole chapter 'Time on tasks', including the chosen plot.
         """
 
-        decision_table_index = self.tables.index(self.DECISION_TABLE)
-        decision = DropDownLists.get_from_table(self.text_input_soup, decision_table_index)
+        decision = self.input_form.dropdown_values(self.DECISION_TABLE)
 
         if decision[0] == 'Yes':
             self.make_plots()
 
-            time_on_tasks = ResultsChapter(self.report, self.text_input, self.text_input_soup, self.TITLE,
-                                           self.tables, self.picture_paths, self.parameters)
+            time_on_tasks = ResultsChapter(self.report, self.input_form, self.TITLE,
+                                           self.picture_index, self.figure_captions, self.parameters)
 
             self.report.add_paragraph(self.TITLE, self.TITLE_STYLE)
 
             # add bar plot or box plot depending on the choice of plot type or do nothing if no data is provided
             try:
                 if self.plot_type == 'Bar plot':
-                    Picture.add_picture_and_caption(self.report,
-                                                    [self.BAR_PLOT_FIGURE_PATH],
-                                                    self.BAR_PLOT_FIGURE_PATH,
-                                                    self.BAR_PLOT_CAPTION,
-                                                    width=Cm(12)
-                                                    )
+                    Picture.add_figure_and_caption(self.report,
+                                                   self.figure_captions,
+                                                   self.plot_scheduler.wait(self.BAR_PLOT_FIGURE_PATH),
+                                                   self.BAR_PLOT_CAPTION,
+                                                   width=Cm(12)
+                                                   )
                 if self.plot_type == 'Box plot':
-                    Picture.add_picture_and_caption(self.report,
-                                                    [self.BOX_PLOT_FIGURE_PATH],
-                                                    self.BOX_PLOT_FIGURE_PATH,
-                                                    self.BOX_PLOT_CAPTION,
-                                                    width=Cm(12)
-                                                    )
-            except FileNotFoundError:
+                    Picture.add_figure_and_caption(self.report,
+                                                   self.figure_captions,
+                                                   self.plot_scheduler.wait(self.BOX_PLOT_FIGURE_PATH),
+                                                   self.BOX_PLOT_CAPTION,
+                                                   width=Cm(12)
+                                                   )
+            except ValueError:
                 pass
 
             self.report.add_paragraph(self.DISCUSSION_TITLE, self.DISCUSSION_STYLE)
@@ -1,14 +1,16 @@
 from docx.document import Document
-from bs4 import BeautifulSoup
 from typing import List, Dict, Union
 import pandas as pd
 from docx.shared import Cm
 
 from docx_package.picture import Picture
 from docx_package.results import ResultsChapter
-from docx_package.dropdown_lists import DropDownLists
-from eye_tracking_package.eye_tracking import EyeTracking
-from eye_tracking_package.plot import Plot
+from docx_package.input_form import InputForm
+from docx_package.parameters import Parameters
+from docx_package.figure_captions import FigureCaptions
+from docx_package.picture_index import PictureIndex
+from eye_tracking_package.participant_metrics import ParticipantMetrics
+from eye_tracking_package.plot_scheduler import PlotScheduler
 
 
 class Transitions:
@@ -34,71 +36,74 @@ class Transitions:
 
     def __init__(self,
                  report_document: Document,
-                 text_input_document: Document,
-                 text_input_soup: BeautifulSoup,
-                 list_of_tables: List[str],
-                 picture_paths_list: List[str],
+                 input_form: InputForm,
+                 picture_index: PictureIndex,
+                 figure_captions: FigureCaptions,
                  parameters_dictionary: Dict[str, Union[str, int]],
-                 list_of_dataframes: List[pd.DataFrame]
+                 list_of_metrics: List[ParticipantMetrics],
+                 plot_scheduler: PlotScheduler = None
                  ):
         """
         Args:
             report_document: .docx file where the report is written.
-            text_input_document: .docx file where all inputs are written.
-            text_input_soup: BeautifulSoup of the xml of the input .docx file.
-            list_of_tables: List of all table names.
-            picture_paths_list: List of the path of all input pictures.
+            input_form: Text input form where all inputs are written.
+            picture_index: Index of all input pictures.
+            figure_captions: Captions of the figures of the report.
             parameters_dictionary: Dictionary of all input parameters (key = parameter name, value = parameter value)
-            list_of_dataframes: List of data frames containing the cGOM data of each participant
+            list_of_metrics: List of the metrics of the cGOM data of each participant
+            plot_scheduler (optional): Scheduler that renders the plots of the chapter.
+                                       The plots are rendered directly if it is None.
         """
 
         self.report = report_document
-        self.text_input = text_input_document
-        self.text_input_soup = text_input_soup
-        self.tables = list_of_tables
-        self.picture_paths = picture_paths_list
+        self.input_form = input_form
+        self.picture_index = picture_index
+        self.figure_captions = figure_captions
         self.parameters = parameters_dictionary
-        self.cGOM_dataframes = list_of_dataframes
+        self.participants_metrics = list_of_metrics
+        self.plot_scheduler = plot_scheduler if plot_scheduler is not None else PlotScheduler()
 
     def makes_plot(self):
         """
         Create heat maps to visualize the transitions percentage between the AOIs.
 
-        One heat map for each participant is created.
+        One heat map for each participant is created if it is asked in the text input form.
         One heat map with the data of all participants are created.
         """
 
-        # main data frame that will contain the data from the data frames from all participants
-        all_transitions = pd.DataFrame()
+        # list of the data frames with the number of transitions of each participant
+        participants_transitions = []
 
-        # create a data frame with the number of transitions for each participant and append it to the main data frame
-        for idx, dataframe in enumerate(self.cGOM_dataframes):
-            aois = EyeTracking.areas_of_interest(dataframe)
-            participant_transitions = EyeTracking.transitions(aois, dataframe)
-            all_transitions = all_transitions.append(participant_transitions)
+        # get the data frame with the number of transitions for each participant and add it to the list
+        participant_plots = Parameters.participant_plots(self.parameters)
+        for idx, metrics in enumerate(self.participants_metrics):
+            participant_transitions = metrics.transitions
+            participants_transitions.append(participant_transitions)
 
             # calculate the ratios and create a heat map that shows the transition percentage
-            transitions_number = participant_transitions.to_numpy().sum()
-            participant_transitions = participant_transitions.div(transitions_number)
-            Plot.make_heatmap(data_frame=participant_transitions,
-                              figure_save_path=self.PARTICIPANT_FIGURE_PATH.format(str(idx + 1)),
-                              title='Transitions: participant {}'.format(str(idx + 1)),
-                              xlabel='AOI destination (to)',
-                              ylabel='AOI source (from)'
-                              )
-
-        # create a data frame with the total amount of transitions for each AOI and append it
-        # to a data frame that will contain all transitions from all participants
+            # if the plots of the participants are asked
+            if participant_plots:
+                transitions_number = participant_transitions.to_numpy().sum()
+                participant_transitions = participant_transitions.div(transitions_number)
+                self.plot_scheduler.submit('heatmap',
+                                           data_frame=participant_transitions,
+                                           figure_save_path=self.PARTICIPANT_FIGURE_PATH.format(str(idx + 1)),
+                                           title='Transitions: participant {}'.format(str(idx + 1)),
+                                           xlabel='AOI destination (to)',
+                                           ylabel='AOI source (from)'
+                                           )
+
+        # main data frame that contains the data from the data frames from all participants,
+        # the data frames of the participants are concatenated at once
+        if participants_transitions:
+            all_transitions = pd.concat(participants_transitions, sort=False)
+        else:
+            all_transitions = pd.DataFrame()
+
+        # create a data frame with the total amount of transitions from each AOI for all participants,
+        # summed for all AOIs in one pass and ordered as the columns
         all_aois = all_transitions.columns.tolist()
-        transitions_stat = pd.DataFrame()
-        for idx, aoi in enumerate(all_aois):
-            data_of_aoi = all_transitions[all_transitions.index == aoi]
-            transitions_sum = data_of_aoi.sum().to_numpy()
-            transitions_mean_df = pd.DataFrame(index=[aoi],
-                                               columns=all_aois,
-                                               data=[transitions_sum]
-                                               )
-            transitions_stat = transitions_stat.append(transitions_mean_df)
+        transitions_stat = all_transitions.groupby(level=0, sort=False).sum().reindex(all_aois)
 
         # calculate the ratios
         transitions_number = transitions_stat.to_numpy().sum()
@@ -106,37 +111,37 @@ class Transitions:
 
         # create a heat map that shows the transition percentage or do nothing if no cGOM data is provided
         if not transitions_stat.empty:
-            Plot.make_heatmap(data_frame=transitions_stat,
-                              figure_save_path=self.HEAT_MAP_FIGURE_PATH,
-                              title='Transitions',
-                              xlabel='AOI destination (to)',
-                              ylabel='AOI source (from)'
-                              )
+            self.plot_scheduler.submit('heatmap',
+                                       data_frame=transitions_stat,
+                                       figure_save_path=self.HEAT_MAP_FIGURE_PATH,
+                                       title='Transitions',
+                                       xlabel='AOI destination (to)',
+                                       ylabel='AOI source (from)'
+                                       )
 
     def write_chapter(self):
         """
         Write the whole chapter 'Transitions', including plot.
         """
 
-        decision_table_index = self.tables.index(self.DECISION_TABLE)
-        decision = DropDownLists.get_from_table(self.text_input_soup, decision_table_index)
+        decision = self.input_form.dropdown_values(self.DECISION_TABLE)
 
         if decision[0] == 'Yes':
             self.makes_plot()
 
-            transitions = ResultsChapter(self.report, self.text_input, self.text_input_soup, self.TITLE,
-                                         self.tables, self.picture_paths, self.parameters)
+            transitions = ResultsChapter(self.report, self.input_form, self.TITLE,
+                                         self.picture_index, self.figure_captions, self.parameters)
 
             self.report.add_paragraph(self.TITLE, self.TITLE_STYLE)
 
             try:
-                Picture.add_picture_and_caption(self.report,
-                                                [self.HEAT_MAP_FIGURE_PATH],
-                                                self.HEAT_MAP_FIGURE_PATH,
-                                                self.CAPTION,
-                                                width=Cm(12)
-                                                )
-            except FileNotFoundError:      # do nothing if no cGOM data is provided
+                Picture.add_figure_and_caption(self.report,
+                                               self.figure_captions,
+                                               self.plot_scheduler.wait(self.HEAT_MAP_FIGURE_PATH),
+                                               self.CAPTION,
+                                               width=Cm(12)
+                                               )
+            except ValueError:      # do nothing if no cGOM data is provided
                 pass
 
             self.report.add_paragraph(self.DISCUSSION_TITLE, self.DISCUSSION_STYLE)
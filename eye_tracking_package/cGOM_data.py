@@ -1,9 +1,11 @@
 from os import listdir
-from itertools import islice
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
 import pandas as pd
 from typing import List
 
+from eye_tracking_package.data_cache import DataCache
+
 
 class cGOM:
     """
@@ -14,12 +16,13 @@ class cGOM:
 
     # path to the cGOM directory and cGOM .txt files
     cGOM_DIRECTORY_PATH = 'Inputs/cGOM_data'
-    cGOM_FILES_PATH = 'Inputs/cGOM_data/Participant{}.txt'
+    cGOM_FILES_PATH = 'Inputs/cGOM_data/{}'
 
     # names of the columns of the cGOM .txt files
     START_TIME = 'Start time'
     END_TIME = 'End time'
     FIXATION_TIME = 'Fixation time'
+    LABEL = 'Label'
 
     def __init__(self):
         pass
@@ -37,80 +40,111 @@ class cGOM:
             end time of a fixation, and duration of a fixation.
         """
 
-        start_times_list = []
-        end_times_list = []
-        labels_list = []
-
-        # reads the file and stores the value in the corresponding lists
-        with open(txt_file_path, 'r') as file:
-            for line in islice(file, 1, None):
-                start_times_list.append(float(line.split()[0]))
-                end_times_list.append(float(line.split()[1]))
-                labels_list.append(line.split()[2])
-        file.close()
-
-        # creates numpy arrays from lists
-        start_times_vector = np.array(start_times_list)
-        end_times_vector = np.array(end_times_list)
-        fixation_times_vector = end_times_vector - start_times_vector
-
-        # creates pandas data frame
-        dataframe = pd.DataFrame(index=labels_list, columns=[self.START_TIME, self.END_TIME, self.FIXATION_TIME])
-        dataframe[self.START_TIME] = start_times_list
-        dataframe[self.END_TIME] = end_times_list
-        dataframe[self.FIXATION_TIME] = fixation_times_vector
+        # read the whole whitespace-separated file at once with the C parser of pandas,
+        # the header of the file is replaced by the names of the columns
+        try:
+            data = pd.read_csv(txt_file_path,
+                               sep=r'\s+',
+                               header=0,
+                               names=[self.START_TIME, self.END_TIME, self.LABEL],
+                               usecols=[0, 1, 2],
+                               dtype={self.START_TIME: np.float64, self.END_TIME: np.float64, self.LABEL: 'category'},
+                               engine='c'
+                               )
+
+        # create an empty data frame if the file is empty
+        except pd.errors.EmptyDataError:
+            return pd.DataFrame(columns=[self.START_TIME, self.END_TIME, self.FIXATION_TIME])
 
         # rename BG in Background
-        dataframe = dataframe.rename(index={'BG': 'Background'})
+        labels = data[self.LABEL]
+        if 'BG' in labels.cat.categories:
+            if 'Background' in labels.cat.categories:
+                labels = labels.astype(object).replace('BG', 'Background').astype('category')
+            else:
+                labels = labels.cat.rename_categories({'BG': 'Background'})
+
+        # creates pandas data frame with the labels as a plain unnamed index of strings,
+        # the categories are only used to parse and rename the labels
+        dataframe = pd.DataFrame(index=pd.Index(labels.to_numpy(dtype=object), dtype=object),
+                                 data={self.START_TIME: data[self.START_TIME].to_numpy(),
+                                       self.END_TIME: data[self.END_TIME].to_numpy()}
+                                 )
+        dataframe[self.FIXATION_TIME] = dataframe[self.END_TIME] - dataframe[self.START_TIME]
 
         return dataframe
 
-    @ classmethod
-    def make_dataframes_list(cls) -> List[pd.DataFrame]:
+    def load_dataframe(self, txt_file_path: str) -> pd.DataFrame:
         """
-        Creates a data frame from the cGOM data of each participant and returns a list of the data frames.
+        Args:
+            txt_file_path: Path of the .txt file that contains the data.
+
+        Returns:
+            Data frame with the data of the cGOM .txt file, loaded from the data cache
+            if the file did not change since it was last parsed.
+        """
+
+        return DataCache().load(txt_file_path, self.make_dataframe)
 
+    @ classmethod
+    def participant_files(cls) -> List[str]:
+        """
         Notes:
             The files containing the data must be named Participant<Number>.txt, e.g. 'Participant3.txt',
             and stored in the Inputs/cGOM_data directory.
 
         Returns:
-            List of data frames that contain the cGOM data of each participant.
+            List of paths of the cGOM .txt files ordered by participant number.
         """
 
-        cGOM = cls()
-
-        # list of all files stored in the directory 'Inputs/Data'
-        files = listdir(cGOM.cGOM_DIRECTORY_PATH)
-
-        biggest_number = 1
+        # list of all files stored in the directory 'Inputs/cGOM_data'
+        files = listdir(cls.cGOM_DIRECTORY_PATH)
 
-        # look for all files that are named in the form 'Participant<Number>.txt' and get the biggest value of <Number>
+        # look for all files that are named in the form 'Participant<Number>.txt' and store them with their number
+        participants_files = []
         for file in files:
             if file.startswith('Participant') and file.endswith('.txt'):
                 try:
                     number = int(file.replace('Participant', '').replace('.txt', ''))
-                    if number > biggest_number:
-                        biggest_number = int(number)
+                    participants_files.append((number, file))
                 except ValueError:
                     pass
 
-        # path to the .txt files
-        files_path = cGOM.cGOM_FILES_PATH
+        return [cls.cGOM_FILES_PATH.format(file) for number, file in sorted(participants_files)]
 
-        dataframes_list = []
+    @ classmethod
+    def make_dataframes_list(cls, workers: int = 1, use_cache: bool = True) -> List[pd.DataFrame]:
+        """
+        Creates a data frame from the cGOM data of each participant and returns a list of the data frames.
+
+        Notes:
+            The files containing the data must be named Participant<Number>.txt, e.g. 'Participant3.txt',
+            and stored in the Inputs/cGOM_data directory.
+
+        Args:
+            workers (optional): Number of processes that read the files concurrently.
+                                The files are read one after the other in the current process if it is 1.
+            use_cache (optional): True if the data frames are loaded from the data cache when the files did not change.
+
+        Returns:
+            List of data frames that contain the cGOM data of each participant, ordered by participant number.
+        """
+
+        cGOM = cls()
 
-        for i in range(biggest_number + 1):
-            txt_file_path = files_path.format(str(i))
+        # paths to the .txt files found in the directory
+        files_paths = cGOM.participant_files()
 
-            # store the data frames in the list and skip the empty ones
-            try:
-                dataframe = cGOM.make_dataframe(txt_file_path)
-                if not dataframe.empty:
-                    dataframes_list.append(dataframe)
+        # function that creates a data frame from a file, either through the data cache or by always parsing it
+        load = cGOM.load_dataframe if use_cache else cGOM.make_dataframe
 
-            # pass if the file is not provided
-            except FileNotFoundError:
-                pass
+        # read the files one after the other or on a pool of processes,
+        # map returns the data frames in the order of the paths in both cases
+        if workers > 1 and len(files_paths) > 1:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                dataframes = list(executor.map(load, files_paths))
+        else:
+            dataframes = [load(txt_file_path) for txt_file_path in files_paths]
 
-        return dataframes_list
+        # skip the empty data frames
+        return [dataframe for dataframe in dataframes if not dataframe.empty]
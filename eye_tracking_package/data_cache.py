@@ -0,0 +1,135 @@
+import os
+import pickle
+import hashlib
+from typing import Callable
+import pandas as pd
+
+
+class DataCache:
+    """
+    Class that represents an on-disk cache of the data frames parsed from the input data files.
+
+    Each data frame is stored in a binary file together with the size, the modification time
+    and the content hash of the file it was parsed from. It is loaded instead of parsing the file again
+    as long as the file has not changed.
+    """
+
+    # path to the directory where the cached data frames are stored
+    CACHE_DIRECTORY_PATH = 'Outputs/Cache/Data'
+
+    # version of the cached data, it must be increased when the way the data files are parsed changes
+    VERSION = 3
+
+    # size of the blocks in which a file is read to compute its content hash
+    BLOCK_SIZE = 1024 * 1024
+
+    def __init__(self, cache_directory_path: str = CACHE_DIRECTORY_PATH):
+        """
+        Args:
+            cache_directory_path (optional): Path to the directory where the cached data frames are stored.
+        """
+
+        self.directory = cache_directory_path
+
+    def cache_file_path(self, file_path: str, parser_name: str) -> str:
+        """
+        Args:
+            file_path: Path of the data file.
+            parser_name: Name of the function that parses the data file.
+
+        Returns:
+            Path of the binary file where the data frame parsed from the data file is stored.
+        """
+
+        key = '{}|{}|{}'.format(os.path.abspath(file_path), parser_name, self.VERSION)
+        return os.path.join(self.directory, hashlib.sha1(key.encode()).hexdigest() + '.pkl')
+
+    def content_hash(self, file_path: str) -> str:
+        """
+        Args:
+            file_path: Path of the data file.
+
+        Returns:
+            Hexadecimal representation of the hash of the content of the file.
+        """
+
+        content_hash = hashlib.blake2b()
+        with open(file_path, 'rb') as file:
+            for block in iter(lambda: file.read(self.BLOCK_SIZE), b''):
+                content_hash.update(block)
+
+        return content_hash.hexdigest()
+
+    def load(self, file_path: str, parser: Callable[[str], pd.DataFrame]) -> pd.DataFrame:
+        """
+        Load the data frame of a data file from the cache or parse the file and store its data frame in the cache.
+
+        The cached data frame is used if the size and the modification time of the file did not change,
+        or if they changed but the content of the file is still the same.
+
+        Args:
+            file_path: Path of the data file.
+            parser: Function that creates a data frame from the path of the data file.
+
+        Returns:
+            Data frame with the data of the file.
+        """
+
+        # size and modification time of the file, this raises FileNotFoundError if the file does not exist
+        file_stat = os.stat(file_path)
+
+        cache_file_path = self.cache_file_path(file_path, getattr(parser, '__qualname__', repr(parser)))
+
+        # read the cached entry if there is one
+        try:
+            with open(cache_file_path, 'rb') as cache_file:
+                entry = pickle.load(cache_file)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            entry = None
+
+        if entry is not None:
+            # the file did not change since the data frame was stored
+            if entry['size'] == file_stat.st_size and entry['mtime'] == file_stat.st_mtime_ns:
+                return entry['dataframe']
+
+            # the file was touched but its content is still the same
+            content_hash = self.content_hash(file_path)
+            if entry['hash'] == content_hash:
+                entry['size'] = file_stat.st_size
+                entry['mtime'] = file_stat.st_mtime_ns
+                self.store(cache_file_path, entry)
+                return entry['dataframe']
+        else:
+            content_hash = self.content_hash(file_path)
+
+        # parse the file and store its data frame in the cache
+        dataframe = parser(file_path)
+        self.store(cache_file_path, {'size': file_stat.st_size,
+                                     'mtime': file_stat.st_mtime_ns,
+                                     'hash': content_hash,
+                                     'dataframe': dataframe
+                                     })
+
+        return dataframe
+
+    def store(self, cache_file_path: str, entry: dict):
+        """
+        Write an entry in the cache or do nothing if the cache directory cannot be written.
+
+        Args:
+            cache_file_path: Path of the binary file of the entry.
+            entry: Dictionary with the size, the modification time and the content hash of the data file
+                   and the data frame parsed from it.
+        """
+
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+
+            # write in a temporary file first so that an interrupted run does not leave a broken entry
+            temporary_path = '{}.{}.tmp'.format(cache_file_path, os.getpid())
+            with open(temporary_path, 'wb') as cache_file:
+                pickle.dump(entry, cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temporary_path, cache_file_path)
+
+        except OSError:
+            pass
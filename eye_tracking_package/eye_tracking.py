@@ -16,6 +16,13 @@ class EyeTracking:
     END_TIME = 'End time'
     FIXATION_TIME = 'Fixation time'
 
+    # names of the columns of the dwell times data frames
+    DWELL_TIMES = 'Dwell times'
+    SUM = 'Sum'
+    MEAN = 'Mean'
+    MAX = 'Max'
+    MIN = 'Min'
+
     def __init__(self):
         pass
 
@@ -26,17 +33,27 @@ class EyeTracking:
             dataframe: Data frame that have AOIs as index.
 
         Returns:
-            List of AOIs given in a data frame.
+            List of AOIs given in a data frame, in the order they first appear.
+        """
+
+        # unique keeps the order in which the labels first appear
+        return dataframe.index.unique().tolist()
+
+    @ staticmethod
+    def aoi_codes(aois: List[str], dataframe: pd.DataFrame) -> np.ndarray:
         """
+        Encode the AOI of each row of a data frame as an integer, so that the statistics of all AOIs
+        can be computed in one pass over the data frame instead of one pass per AOI.
 
-        # read all indexes of a data frame and append it to a list if it is already in
-        aois = []
-        labels_list = dataframe.index.values.tolist()
-        for label in labels_list:
-            if label not in aois:
-                aois.append(label)
+        Args:
+            aois: List of AOIs.
+            dataframe: Data frame that have AOIs as index.
 
-        return aois
+        Returns:
+            Array with the position in the list of AOIs of the AOI of each row, or -1 if the AOI is not in the list.
+        """
+
+        return pd.Index(aois).get_indexer(dataframe.index.values)
 
     @ classmethod
     def fixations(cls, aois: List[str], dataframe: pd.DataFrame) -> pd.DataFrame:
@@ -51,15 +68,18 @@ class EyeTracking:
 
         eye_tracking = cls()
 
-        # main fixations data frame
-        fixations_df = pd.DataFrame()
+        # fixations of the AOIs of the list, grouped by AOI in the order of the list
+        # and in the order they appear within an AOI
+        aoi_codes = eye_tracking.aoi_codes(aois, dataframe)
+        fixation_times = dataframe[eye_tracking.FIXATION_TIME].to_numpy(dtype=float)
+        known_aois = np.flatnonzero(aoi_codes >= 0)
+        order = known_aois[np.argsort(aoi_codes[known_aois], kind='stable')]
+
+        # write each fixation on its own row in the column of its AOI, the other entries are empty
+        fixations_matrix = np.full((len(order), len(aois)), np.nan)
+        fixations_matrix[np.arange(len(order)), aoi_codes[order]] = fixation_times[order]
 
-        # create a data frame for each AOI with all its fixations and append it to the main data frame
-        for idx, aoi in enumerate(aois):
-            data_of_aoi = dataframe[dataframe.index == aoi]
-            fixations_vector = data_of_aoi[eye_tracking.FIXATION_TIME].to_numpy()
-            aoi_fixations = pd.DataFrame(columns=[aoi], data=fixations_vector)
-            fixations_df = fixations_df.append(aoi_fixations, ignore_index=True)
+        fixations_df = pd.DataFrame(data=fixations_matrix, columns=aois)
 
         return fixations_df
 
@@ -85,90 +105,85 @@ class EyeTracking:
 
         eye_tracking = cls()
 
-        # main data frame that contains all the dwell times
-        dwell_times_df = pd.DataFrame()
-
-        # values for the first fixation
-        previous_aoi = dataframe.index[0]
-        previous_start = dataframe.iloc[0][eye_tracking.START_TIME]
-        previous_end = dataframe.iloc[0][eye_tracking.END_TIME]
-
-        for row in dataframe.iterrows():
-
-            # values of the current fixation
-            aoi = row[0]
-            start_time = row[1][eye_tracking.START_TIME]
-            end_time = row[1][eye_tracking.END_TIME]
-
-            # if the AOI has not changed, the dwell time is not finish
-            # thus, the start time remains the same but the end time changes to the one of the current fixation
-            if aoi == previous_aoi:
-                previous_end = end_time
-
-            # if the AOI has changed, the dwell time is finish
-            if aoi != previous_aoi:
-                # create a data frame for the dwell time and append it to the main data frame
-                dwell_time_df = pd.DataFrame(data=previous_end - previous_start,
-                                             index=[previous_aoi],
-                                             columns=['Dwell times']
-                                             )
-                dwell_times_df = dwell_times_df.append(dwell_time_df)
-
-                # both start and end time change to the one of the current fixation
-                previous_start = start_time
-                previous_end = end_time
-
-            # change to the next fixation
-            previous_aoi = aoi
-
-        # append the sum of all fixations, i.e. the dwell time, of each AOI to the main vector
-        for idx, aoi in enumerate(aois):
-            data_of_aoi = dwell_times_df[dwell_times_df.index == aoi]
-
-            # make statistics for the dwell times of this AOI
-            time_sum = data_of_aoi['Dwell times'].sum()
-            time_mean = data_of_aoi['Dwell times'].mean()
-            time_max = data_of_aoi['Dwell times'].max()
-            time_min = data_of_aoi['Dwell times'].min()
-
-            # create data frames with the statistics and append them to the main data frame
-            sum_df = pd.DataFrame(data=time_sum, index=[aoi], columns=['Sum'])
-            mean_df = pd.DataFrame(data=time_mean, index=[aoi], columns=['Mean'])
-            max_df = pd.DataFrame(data=time_max, index=[aoi], columns=['Max'])
-            min_df = pd.DataFrame(data=time_min, index=[aoi], columns=['Min'])
-            dwell_times_df = dwell_times_df.append(sum_df)
-            dwell_times_df = dwell_times_df.append(mean_df)
-            dwell_times_df = dwell_times_df.append(max_df)
-            dwell_times_df = dwell_times_df.append(min_df)
-
-        return dwell_times_df
+        # encode the AOIs of the fixations as integers to find the runs of consecutive fixations on the same AOI
+        labels = dataframe.index.values
+        aoi_codes = pd.factorize(labels)[0]
+        start_times = dataframe[eye_tracking.START_TIME].to_numpy(dtype=float)
+        end_times = dataframe[eye_tracking.END_TIME].to_numpy(dtype=float)
+
+        # a dwell time is finished when the AOI changes, i.e. at the index of the first fixation of the next run
+        changes = np.flatnonzero(np.diff(aoi_codes)) + 1
+
+        # the first fixation of each finished run gives the start time and the last one gives the end time,
+        # the run that is still going on at the end of the recording is not counted as a dwell time
+        run_starts = np.concatenate(([0], changes))[:-1]
+        run_ends = changes - 1
+        dwell_times_vector = end_times[run_ends] - start_times[run_starts]
+
+        # data frame that contains all the dwell times with the AOIs as index
+        dwell_times_df = pd.DataFrame(data=dwell_times_vector,
+                                      index=labels[run_starts],
+                                      columns=[eye_tracking.DWELL_TIMES]
+                                      )
+
+        # make statistics for the dwell times of each AOI in one pass over the dwell times
+        dwell_times_codes = eye_tracking.aoi_codes(aois, dataframe)[run_starts]
+        known_aois = dwell_times_codes >= 0
+        statistics = pd.Series(dwell_times_vector[known_aois]).groupby(dwell_times_codes[known_aois]).agg(
+            ['sum', 'mean', 'max', 'min']
+        )
+        statistics = statistics.reindex(range(len(aois)))
+        statistics['sum'] = statistics['sum'].fillna(0)
+
+        # write the statistics of each AOI on four rows, i.e. one row per statistic,
+        # that only have an entry in the column of the corresponding statistic
+        statistics_labels = [eye_tracking.SUM, eye_tracking.MEAN, eye_tracking.MAX, eye_tracking.MIN]
+        statistics_matrix = np.full((4 * len(aois), 4), np.nan)
+        statistics_matrix[np.arange(4 * len(aois)), np.tile(np.arange(4), len(aois))] = statistics.to_numpy().ravel()
+        statistics_df = pd.DataFrame(data=statistics_matrix,
+                                     index=np.repeat(np.array(aois, dtype=object), 4),
+                                     columns=statistics_labels
+                                     )
+
+        return pd.concat([dwell_times_df, statistics_df], sort=False)
 
     @ staticmethod
-    def transitions(aois: List[str], dataframe: pd.DataFrame) -> pd.DataFrame:
+    def transitions(aois: List[str], dataframe: pd.DataFrame, sparse: bool = False) -> pd.DataFrame:
         """
         Args:
             aois: List of AOIs.
             dataframe: Data frame that have AOIs as index.
+            sparse (optional): True if the entries of the data frame are stored as sparse columns,
+                               which is useful when there are many AOIs and few transitions between them.
 
         Returns:
             Data frame that have AOIs as indexes and columns and the number of transitions
             from an AOI to another as entries.
         """
 
-        # create a data frame with the AOIs as columns and indexes and zeros as entries
+        # encode the AOIs that were looked (fixations), in the order they appeared, as their position in the AOIs list
+        aois_number = len(aois)
+        fixations_codes = EyeTracking.aoi_codes(aois, dataframe)
+
+        # one transition from the last fixation AOI (index) to the actual fixation AOI (column)
+        # for each pair of consecutive fixations, encoded as the position of the entry in the flattened table
+        last_fixations_codes = fixations_codes[:-1]
+        actual_fixations_codes = fixations_codes[1:]
+        known_aois = (last_fixations_codes >= 0) & (actual_fixations_codes >= 0)
+        transitions_codes = last_fixations_codes[known_aois] * aois_number + actual_fixations_codes[known_aois]
+
+        # count the transitions of every pair of AOIs at once
+        transitions_matrix = np.bincount(transitions_codes, minlength=aois_number * aois_number)
+        transitions_matrix = transitions_matrix.reshape((aois_number, aois_number)).astype(float)
+
+        # create a data frame with the AOIs as columns and indexes and the number of transitions as entries
         transitions_table = pd.DataFrame(index=aois,
                                          columns=aois,
-                                         data=np.zeros((len(aois), len(aois)))
+                                         data=transitions_matrix
                                          )
 
-        # list of all AOIs that were looked (fixations) in the order they appeared
-        all_fixations_aoi = dataframe.index.values.tolist()
-
-        # add one transition from the last fixation AOI (index) to the actual fixation AOI (column)
-        last_fixation_aoi = all_fixations_aoi[0]
-        for fixation_aoi in all_fixations_aoi[1:]:
-            transitions_table.loc[last_fixation_aoi].at[fixation_aoi] += 1
-            last_fixation_aoi = fixation_aoi
+        if sparse:
+            transitions_table = transitions_table.astype(pd.SparseDtype(float, 0.0))
 
         return transitions_table
 
@@ -177,7 +192,7 @@ class EyeTracking:
         """
         Args:
             aois: List of AOIs.
-            dataframe: Data frame that have a column 'Fixation time'.
+            dataframe: Data frame that have AOIs as index.
 
         Returns:
             List of the number of revisits for each AOI.
@@ -185,13 +200,8 @@ class EyeTracking:
 
         eye_tracking = cls()
 
-        # main revisits list
-        revisits_list = []
-
-        # append the number of fixations - 1, i.e. the number of revisits, of each AOI to the main list
-        for idx, aoi in enumerate(aois):
-            data_of_aoi = dataframe[dataframe.index == aoi]
-            revisits = len(data_of_aoi[eye_tracking.FIXATION_TIME]) - 1
-            revisits_list.append(revisits)
+        # count the fixations of every AOI at once, the number of revisits is the number of fixations - 1
+        aoi_codes = eye_tracking.aoi_codes(aois, dataframe)
+        fixations_counts = np.bincount(aoi_codes[aoi_codes >= 0], minlength=len(aois))
 
-        return revisits_list
+        return (fixations_counts - 1).tolist()
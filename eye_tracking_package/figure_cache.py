@@ -0,0 +1,231 @@
+import os
+import hashlib
+from typing import Dict, List, Tuple, Union
+import numpy as np
+import pandas as pd
+import matplotlib
+import seaborn as sns
+
+from eye_tracking_package.plot import Plot
+
+
+class FigureCache:
+    """
+    Class that represents an on-disk cache of the figures of the plots.
+
+    Each figure is stored as a .png file named after the hash of the type of its plot and of all the arguments
+    of the plot, i.e. the data, the labels and the title, and of the versions, the style and the parameters
+    of the plotting libraries.
+    A figure is read from the cache instead of being rendered again as long as the plot did not change.
+    The least recently used figures are deleted when the cache is bigger than its maximum size.
+    """
+
+    # path to the directory where the cached figures are stored
+    CACHE_DIRECTORY_PATH = 'Outputs/Cache/Figures'
+
+    # version of the cached figures, it must be increased when the style of the plots changes
+    VERSION = 1
+
+    # maximum size of all cached figures in bytes
+    MAX_SIZE = 200 * 1024 * 1024
+
+    # parameters of matplotlib that change the figures and are not set by the style of seaborn
+    RC_PARAMETERS = ['figure.figsize', 'figure.dpi', 'figure.autolayout', 'savefig.dpi', 'savefig.pad_inches']
+
+    def __init__(self, cache_directory_path: str = CACHE_DIRECTORY_PATH, max_size: int = MAX_SIZE):
+        """
+        Args:
+            cache_directory_path (optional): Path to the directory where the cached figures are stored.
+            max_size (optional): Maximum size of all cached figures in bytes.
+        """
+
+        self.directory = cache_directory_path
+        self.max_size = max_size
+
+        # size of all cached figures in bytes, it is read from the cache directory at the first store
+        # and then kept up to date, so that the cache directory is only listed again to evict figures
+        self.size = None
+
+    def key(self, plot_type: str, plot_arguments: Dict) -> str:
+        """
+        Args:
+            plot_type: Type of the plot, i.e. 'barplot', 'boxplot', 'heatmap' or 'pieplot'.
+            plot_arguments: Keyword arguments of the corresponding Plot.make_<plot type> method.
+
+        Returns:
+            Hexadecimal representation of the hash of the plot, the path where the figure is saved is not part of it.
+        """
+
+        key = hashlib.sha1()
+        key.update('{}|{}|{}|{}'.format(self.VERSION, matplotlib.__version__, sns.__version__, plot_type).encode())
+
+        # the figures also depend on the style that Plot applies and on the other parameters of matplotlib
+        self.update_key(key, sns.axes_style(Plot.STYLE))
+        self.update_key(key, sns.plotting_context(Plot.CONTEXT))
+        self.update_key(key, sns.color_palette(Plot.PALETTE))
+        self.update_key(key, {name: matplotlib.rcParams[name] for name in self.RC_PARAMETERS})
+
+        for name in sorted(plot_arguments):
+            if name == 'figure_save_path':
+                continue
+
+            key.update('|{}='.format(name).encode())
+            self.update_key(key, plot_arguments[name])
+
+        return key.hexdigest()
+
+    def update_key(self, key, value):
+        """
+        Add a value to the hash of a plot, the whole content of the value is hashed and not only its representation,
+        which is shortened with '...' for the big data frames, series and lists.
+
+        Args:
+            key: Hash of the plot.
+            value: Argument of the plot, or style or parameters of the plotting libraries.
+        """
+
+        # data frames are hashed with their values, index, columns and types
+        if isinstance(value, pd.DataFrame):
+            key.update(pd.util.hash_pandas_object(value, index=True).to_numpy().tobytes())
+            key.update(repr((value.columns.tolist(), value.dtypes.astype(str).tolist())).encode())
+
+        # series are hashed with their values, index, name and type
+        elif isinstance(value, pd.Series):
+            key.update(pd.util.hash_pandas_object(value, index=True).to_numpy().tobytes())
+            key.update(repr((value.name, str(value.dtype))).encode())
+
+        # arrays are hashed with their values, shape and type
+        elif isinstance(value, np.ndarray):
+            key.update(np.ascontiguousarray(value).tobytes())
+            key.update(repr((value.shape, str(value.dtype))).encode())
+
+        # lists and tuples are hashed element by element, and dictionaries item by item in the order of their keys
+        elif isinstance(value, (list, tuple)):
+            key.update('{}[{}]('.format(type(value).__name__, len(value)).encode())
+            for element in value:
+                self.update_key(key, element)
+                key.update(b',')
+            key.update(b')')
+
+        elif isinstance(value, dict):
+            key.update('dict[{}]('.format(len(value)).encode())
+            for name in sorted(value, key=repr):
+                key.update('{!r}:'.format(name).encode())
+                self.update_key(key, value[name])
+                key.update(b',')
+            key.update(b')')
+
+        else:
+            key.update(repr(value).encode())
+
+    def cache_file_path(self, key: str) -> str:
+        """
+        Args:
+            key: Hash of the plot.
+
+        Returns:
+            Path of the cached .png file of the plot.
+        """
+
+        return os.path.join(self.directory, key + '.png')
+
+    def load(self, key: str) -> Union[bytes, None]:
+        """
+        Args:
+            key: Hash of the plot.
+
+        Returns:
+            Content of the cached .png file of the plot, or None if the figure must be rendered.
+        """
+
+        cache_file_path = self.cache_file_path(key)
+
+        try:
+            with open(cache_file_path, 'rb') as cache_file:
+                figure = cache_file.read()
+        except OSError:
+            return None
+
+        # mark the figure as recently used, this is skipped if the cache directory is read-only
+        try:
+            os.utime(cache_file_path)
+        except OSError:
+            pass
+
+        return figure
+
+    def cached_figures(self) -> List[Tuple[float, int, str]]:
+        """
+        Returns:
+            List of the cached figures with their last use time, their size in bytes and their path.
+        """
+
+        figures = []
+        for file in os.listdir(self.directory):
+            if file.endswith('.png'):
+                path = os.path.join(self.directory, file)
+                try:
+                    file_stat = os.stat(path)
+                    figures.append((file_stat.st_mtime, file_stat.st_size, path))
+                except OSError:
+                    pass
+
+        return figures
+
+    def store(self, key: str, figure: bytes):
+        """
+        Write a rendered figure in the cache and delete the least recently used figures if the cache is too big,
+        or do nothing if the cache directory cannot be written.
+
+        Args:
+            key: Hash of the plot.
+            figure: Content of the .png file of the figure.
+        """
+
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+
+            # write in a temporary file first so that an interrupted run does not leave a broken figure
+            cache_file_path = self.cache_file_path(key)
+            temporary_path = '{}.{}.tmp'.format(cache_file_path, os.getpid())
+            with open(temporary_path, 'wb') as cache_file:
+                cache_file.write(figure)
+
+            # the figure might replace the same figure stored by another run
+            try:
+                replaced_size = os.path.getsize(cache_file_path)
+            except OSError:
+                replaced_size = 0
+            os.replace(temporary_path, cache_file_path)
+
+            if self.size is None:
+                self.size = sum(size for mtime, size, path in self.cached_figures())
+            else:
+                self.size += len(figure) - replaced_size
+
+            if self.size > self.max_size:
+                self.evict()
+
+        except OSError:
+            pass
+
+    def evict(self):
+        """
+        Delete the least recently used figures until the size of the cache is smaller than its maximum size.
+        """
+
+        # cached figures with their last use time and size, they are listed again
+        # because the figures stored by other runs are not counted in the size of the cache
+        figures = self.cached_figures()
+
+        total_size = sum(size for mtime, size, path in figures)
+        for mtime, size, path in sorted(figures):
+            if total_size <= self.max_size:
+                break
+            try:
+                os.remove(path)
+                total_size -= size
+            except OSError:
+                pass
+
+        self.size = total_size
@@ -0,0 +1,101 @@
+from typing import List
+import pandas as pd
+
+from eye_tracking_package.eye_tracking import EyeTracking
+
+
+class ParticipantMetrics:
+    """
+    Class that represents the eye tracking metrics of the cGOM data of one participant.
+
+    Each metric is computed from the cGOM data frame the first time it is needed and then kept,
+    so that the chapters AverageFixation, DwellTimesAndRevisits and Transitions share the same results.
+    """
+
+    def __init__(self, dataframe: pd.DataFrame):
+        """
+        Args:
+            dataframe: Data frame that contains the cGOM data of the participant.
+        """
+
+        self.dataframe = dataframe
+
+        # metrics that are computed the first time they are needed
+        self._aois = None
+        self._fixations = None
+        self._dwell_times = None
+        self._transitions = None
+        self._revisits = None
+
+    @ property
+    def aois(self) -> List[str]:
+        """
+        Returns:
+            List of AOIs of the participant, in the order they first appear.
+        """
+
+        if self._aois is None:
+            self._aois = EyeTracking.areas_of_interest(self.dataframe)
+
+        return self._aois
+
+    @ property
+    def fixations(self) -> pd.DataFrame:
+        """
+        Returns:
+            Data frame that contains all fixations for each AOI with the AOIs as columns.
+        """
+
+        if self._fixations is None:
+            self._fixations = EyeTracking.fixations(self.aois, self.dataframe)
+
+        return self._fixations
+
+    @ property
+    def dwell_times(self) -> pd.DataFrame:
+        """
+        Returns:
+            Data frame with all dwell times and the statistics for each AOI.
+        """
+
+        if self._dwell_times is None:
+            self._dwell_times = EyeTracking.dwell_times(self.aois, self.dataframe)
+
+        return self._dwell_times
+
+    @ property
+    def transitions(self) -> pd.DataFrame:
+        """
+        Returns:
+            Data frame that have AOIs as indexes and columns and the number of transitions
+            from an AOI to another as entries.
+        """
+
+        if self._transitions is None:
+            self._transitions = EyeTracking.transitions(self.aois, self.dataframe)
+
+        return self._transitions
+
+    @ property
+    def revisits(self) -> List[int]:
+        """
+        Returns:
+            List of the number of revisits for each AOI.
+        """
+
+        if self._revisits is None:
+            self._revisits = EyeTracking.revisits(self.aois, self.dataframe)
+
+        return self._revisits
+
+    @ classmethod
+    def make_metrics_list(cls, list_of_dataframes: List[pd.DataFrame]) -> List['ParticipantMetrics']:
+        """
+        Args:
+            list_of_dataframes: List of data frames containing the cGOM data of each participant.
+
+        Returns:
+            List of the metrics of each participant, in the order of the data frames.
+        """
+
+        return [cls(dataframe) for dataframe in list_of_dataframes]
@@ -1,27 +1,105 @@
+from io import BytesIO
 import numpy as np
 import seaborn as sns
 import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 
 
 class Plot:
-    """Class that represents and creates the different plots needed for the visualization of the data."""
+    """
+    Class that represents and creates the different plots needed for the visualization of the data.
+
+    Each plot is drawn on its own figure, which is always closed after it is saved.
+    """
+
+    # True if the figures are only saved and never shown in a window, e.g. for server and batch use
+    HEADLESS = False
+
+    # context, style and color palette of seaborn applied to every figure
+    CONTEXT = 'notebook'
+    STYLE = 'whitegrid'
+    PALETTE = 'deep'
+
+    @ classmethod
+    def set_headless(cls, headless: bool = True):
+        """
+        Suppress or restore the windows of the figures, the figures are closed after they are saved in both cases.
+
+        Args:
+            headless (optional): True if the figures must not be shown in a window.
+        """
+
+        cls.HEADLESS = headless
+
+    @ classmethod
+    def set_style(cls):
+        """
+        Apply the same style to every figure, so that a figure does not depend on the figures rendered before it.
+        """
+
+        sns.set(context=cls.CONTEXT, style=cls.STYLE, palette=cls.PALETTE)
 
     @ staticmethod
-    def make_barplot(data_frame, figure_save_path, title=None, xlabel=None, ylabel=None):
+    def use_batch_backend():
+        """
+        Render the figures with the non-interactive Agg backend, which never opens a window,
+        so that many figures can be rendered one after the other, e.g. for a report.
+        """
+
+        plt.switch_backend('Agg')
+
+    @ classmethod
+    def finish(cls, figure: Figure, figure_save_path: str = None) -> bytes:
+        """
+        Render a figure in memory, save it if a path is given, show it in a window unless in headless mode,
+        and close it.
+
+        Args:
+            figure: Figure of the plot.
+            figure_save_path (optional): Path where the figure of the plot will be saved.
+                                         The figure is only rendered in memory if it is None.
+
+        Returns:
+            Content of the .png file of the figure.
+        """
+
+        buffer = BytesIO()
+        figure.savefig(buffer, format='png', bbox_inches='tight')
+        figure_bytes = buffer.getvalue()
+
+        if figure_save_path is not None:
+            with open(figure_save_path, 'wb') as figure_file:
+                figure_file.write(figure_bytes)
+
+        if not cls.HEADLESS:
+            plt.show(block=False)
+
+        # the figure is closed in every mode so that pyplot does not keep a reference to it
+        plt.close(figure)
+
+        return figure_bytes
+
+    @ classmethod
+    def make_barplot(cls, data_frame, figure_save_path, title=None, xlabel=None, ylabel=None):
         """
         Create a barplot out of a data frame and save its figure.
 
         Args:
             data_frame: Data frame containing the data from which the plot will be made.
-            figure_save_path: Path where the figure of the plot will be saved.
+            figure_save_path: Path where the figure of the plot will be saved, or None if it is not saved.
             title (optional): Plot title written on the figure.
             xlabel (optional): Label of the x-axis.
             ylabel (optional): Label of the y-axis.
+
+        Returns:
+            Content of the .png file of the figure.
         """
 
-        sns.set(style='whitegrid')
+        cls.set_style()
 
+        figure, axes = plt.subplots()
         plot = sns.barplot(data=data_frame,
+                           ax=axes,
                            capsize=0.1,  # length of the caps at the endpoint of the confidence interval bar
                            errwidth=1.5,  # width of the confidence interval bar
                            ci=95,  # size of the confidence interval
@@ -35,31 +113,33 @@ class Plot:
         if title:
             plot.set_title(title)
         if xlabel:
-            plt.xlabel(xlabel)
+            plot.set_xlabel(xlabel)
         if ylabel:
-            plt.ylabel(ylabel)
+            plot.set_ylabel(ylabel)
 
-        figure = plot.get_figure()
-        figure.savefig(figure_save_path, bbox_inches='tight')
+        return cls.finish(figure, figure_save_path)
 
-        plt.show(block=False)
-
-    @ staticmethod
-    def make_boxplot(data_frame, figure_save_path, title=None, xlabel=None, ylabel=None):
+    @ classmethod
+    def make_boxplot(cls, data_frame, figure_save_path, title=None, xlabel=None, ylabel=None):
         """
         Create a box plot out of a data frame and save its figure.
 
         Args:
             data_frame: Data frame containing the data from which the plot will be made.
-            figure_save_path: Path where the figure of the plot will be saved.
+            figure_save_path: Path where the figure of the plot will be saved, or None if it is not saved.
             title (optional): Plot title written on the figure.
             xlabel (optional): Label of the x-axis.
             ylabel (optional): Label of the y-axis.
+
+        Returns:
+            Content of the .png file of the figure.
         """
 
-        sns.set(style='whitegrid')
+        cls.set_style()
 
+        figure, axes = plt.subplots()
         plot = sns.boxplot(data=data_frame,
+                           ax=axes,
                            palette='PuBu'  # colors of the boxes
                            )
 
@@ -70,29 +150,33 @@ class Plot:
         if title:
             plot.set_title(title)
         if xlabel:
-            plt.xlabel(xlabel)
+            plot.set_xlabel(xlabel)
         if ylabel:
-            plt.ylabel(ylabel)
-
-        figure = plot.get_figure()
-        figure.savefig(figure_save_path, bbox_inches='tight')
+            plot.set_ylabel(ylabel)
 
-        plt.show(block=False)
+        return cls.finish(figure, figure_save_path)
 
-    @ staticmethod
-    def make_heatmap(data_frame, figure_save_path, title=None, xlabel=None, ylabel=None):
+    @ classmethod
+    def make_heatmap(cls, data_frame, figure_save_path, title=None, xlabel=None, ylabel=None):
         """
         Create a heat map out of a data frame and save its figure.
 
         Args:
             data_frame: Data frame containing the data from which the plot will be made.
-            figure_save_path: Path where the figure of the plot will be saved.
+            figure_save_path: Path where the figure of the plot will be saved, or None if it is not saved.
             title (optional): Plot title written on the figure.
             xlabel (optional): Label of the x-axis.
             ylabel (optional): Label of the y-axis.
+
+        Returns:
+            Content of the .png file of the figure.
         """
 
+        cls.set_style()
+
+        figure, axes = plt.subplots()
         plot = sns.heatmap(data=data_frame,
+                           ax=axes,
                            vmin=0, vmax=1,  # max and min value
                            annot=True,  # annotate each cell
                            linewidths=.5,  # width of the line between each cell
@@ -105,27 +189,29 @@ class Plot:
         if title:
             plot.set_title(title)
         if xlabel:
-            plt.xlabel(xlabel)
+            plot.set_xlabel(xlabel)
         if ylabel:
-            plt.ylabel(ylabel)
+            plot.set_ylabel(ylabel)
 
-        figure = plot.get_figure()
-        figure.savefig(figure_save_path, bbox_inches='tight')
+        return cls.finish(figure, figure_save_path)
 
-        plt.show(block=False)
-
-    @ staticmethod
-    def make_pieplot(data_vector, labels_list, figure_save_path, title=None):
+    @ classmethod
+    def make_pieplot(cls, data_vector, labels_list, figure_save_path, title=None):
         """
         Create a pie plot out of a vector and a list of labels and save its figure.
 
         Args:
             data_vector: Vector containing the data from which the plot will be made.
             labels_list: List containing the labels that corresponds to the data.
-            figure_save_path: Path where the figure of the plot will be saved.
+            figure_save_path: Path where the figure of the plot will be saved, or None if it is not saved.
             title (optional): Plot title written on the figure.
+
+        Returns:
+            Content of the .png file of the figure.
         """
 
+        cls.set_style()
+
         # set the offset of each wedge
         explode = np.full(len(data_vector), 0.001)
 
@@ -136,25 +222,24 @@ class Plot:
                   ]
 
         # add a pie plot
-        patches, texts = plt.pie(x=data_vector,
-                                 startangle=0,  # start angle of the first wedge
-                                 explode=explode,  # offset of the wedges
-                                 colors=colors  # colors of the wedges
-                                 )
+        figure, axes = plt.subplots()
+        patches, texts = axes.pie(x=data_vector,
+                                  startangle=0,  # start angle of the first wedge
+                                  explode=explode,  # offset of the wedges
+                                  colors=colors  # colors of the wedges
+                                  )
 
         # add a list of the labels with their corresponding percentage
         percent = data_vector / data_vector.sum()
         labels = ['{0} - {1:.1%}'.format(i, j) for i, j in zip(labels_list, percent)]
-        plt.legend(patches,
-                   labels,
-                   loc='center left',
-                   bbox_to_anchor=(1, 0.5)
-                   )
+        axes.legend(patches,
+                    labels,
+                    loc='center left',
+                    bbox_to_anchor=(1, 0.5)
+                    )
 
         # write the title of the plot
         if title:
-            plt.title(title)
-
-        plt.savefig(figure_save_path, bbox_inches='tight')
+            axes.set_title(title)
 
-        plt.show(block=False)
+        return cls.finish(figure, figure_save_path)
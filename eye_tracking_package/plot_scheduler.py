@@ -0,0 +1,177 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Union
+
+from eye_tracking_package.plot import Plot
+from eye_tracking_package.figure_cache import FigureCache
+
+
+def use_headless_plots():
+    """
+    Render the figures with the non-interactive Agg backend and close each figure as soon as it is saved.
+
+    This is called once in each process of the pool before it renders a figure.
+    """
+
+    Plot.use_batch_backend()
+    Plot.set_headless()
+
+
+def render(plot_type: str,
+           plot_arguments: Dict,
+           export: bool = True,
+           figure_cache: FigureCache = None,
+           key: str = None
+           ) -> bytes:
+    """
+    Render one plot job and store its figure in the figure cache.
+
+    Args:
+        plot_type: Type of the plot, i.e. 'barplot', 'boxplot', 'heatmap' or 'pieplot'.
+        plot_arguments: Keyword arguments of the corresponding Plot.make_<plot type> method.
+        export (optional): True if the figure is saved at its path, False if it is only rendered in memory.
+        figure_cache (optional): Cache of the figures, the figure is not stored if it is None.
+        key (optional): Hash of the plot in the figure cache.
+
+    Returns:
+        Content of the .png file of the figure.
+    """
+
+    plot_arguments = dict(plot_arguments)
+    if not export:
+        plot_arguments['figure_save_path'] = None
+
+    figure = getattr(Plot, 'make_{}'.format(plot_type))(**plot_arguments)
+
+    if figure_cache is not None:
+        figure_cache.store(key, figure)
+
+    return figure
+
+
+class PlotScheduler:
+    """
+    Class that represents a scheduler that renders the plot figures of the report on a pool of processes.
+
+    A plot job is given by the type of the plot, the output path of its figure and the arguments of
+    the corresponding Plot.make_<plot type> method. The chapters submit all their plots at once and only wait
+    for the figures they add to the report, the other figures are rendered in the background.
+
+    The figures are rendered in memory and given to the chapters as the content of their .png file.
+    Saving them at their path in the 'Outputs' directory is optional.
+    """
+
+    PLOT_TYPES = ['barplot', 'boxplot', 'heatmap', 'pieplot']
+
+    def __init__(self, workers: int = 1, use_cache: bool = True, export: bool = True):
+        """
+        Args:
+            workers (optional): Number of processes that render the figures concurrently.
+                                The figures are rendered one after the other in the current process if it is 1.
+            use_cache (optional): True if the figures are read from the figure cache when the plots did not change.
+            export (optional): True if the figures are also saved at their path,
+                               False if they are only rendered in memory, e.g. on a read-only file system.
+        """
+
+        self.workers = workers
+        self.export = export
+        self.executor = None
+        self.figure_cache = FigureCache() if use_cache else None
+
+        # figures that are being rendered, with the path of the figure as key
+        self.pending_figures = {}
+
+        # hashes in the figure cache of the figures that are being rendered, with the path of the figure as key,
+        # the figures rendered by the pool are stored in the cache by this process that keeps the size of the cache
+        self.pending_keys = {}
+
+        # content of the .png files of the figures that are rendered, with the path of the figure as key
+        self.figures = {}
+
+    def submit(self, plot_type: str, figure_save_path: str, **plot_arguments):
+        """
+        Add a plot job to the scheduler.
+
+        Args:
+            plot_type: Type of the plot, i.e. 'barplot', 'boxplot', 'heatmap' or 'pieplot'.
+            figure_save_path: Path where the figure of the plot will be saved, it also identifies the figure.
+            **plot_arguments: Other keyword arguments of the corresponding Plot.make_<plot type> method.
+        """
+
+        if plot_type not in self.PLOT_TYPES:
+            raise ValueError('Unknown plot type: {}'.format(plot_type))
+
+        # a figure that is written again must be finished first
+        if figure_save_path in self.pending_figures:
+            self.wait(figure_save_path)
+
+        plot_arguments['figure_save_path'] = figure_save_path
+
+        # read the figure from the cache if the same plot was already rendered
+        key = None
+        if self.figure_cache is not None:
+            key = self.figure_cache.key(plot_type, plot_arguments)
+            figure = self.figure_cache.load(key)
+            if figure is not None:
+                if self.export:
+                    with open(figure_save_path, 'wb') as figure_file:
+                        figure_file.write(figure)
+                self.figures[figure_save_path] = figure
+                return
+
+        # render the figure directly in the current process
+        if self.workers <= 1:
+            self.figures[figure_save_path] = render(plot_type, plot_arguments, self.export, self.figure_cache, key)
+            return
+
+        # start the pool at the first job
+        if self.executor is None:
+            self.executor = ProcessPoolExecutor(max_workers=self.workers, initializer=use_headless_plots)
+
+        self.pending_figures[figure_save_path] = self.executor.submit(render, plot_type, plot_arguments, self.export)
+        self.pending_keys[figure_save_path] = key
+
+    def wait(self, figure_save_path: str) -> Union[bytes, None]:
+        """
+        Wait until a figure is rendered.
+
+        Args:
+            figure_save_path: Path of the figure.
+
+        Returns:
+            Content of the .png file of the figure, or None if no job was submitted for it.
+
+        Raises:
+            Any error that occurred while rendering the figure, e.g. ValueError if the data of the plot is empty.
+        """
+
+        future = self.pending_figures.pop(figure_save_path, None)
+        key = self.pending_keys.pop(figure_save_path, None)
+        if future is not None:
+            self.figures[figure_save_path] = future.result()
+            if self.figure_cache is not None:
+                self.figure_cache.store(key, self.figures[figure_save_path])
+
+        return self.figures.get(figure_save_path)
+
+    def close(self) -> List[str]:
+        """
+        Wait until all figures are rendered and shut down the pool of processes.
+
+        Returns:
+            List of paths of the figures that could not be rendered.
+        """
+
+        failed_figures = []
+        for figure_save_path in list(self.pending_figures):
+            try:
+                self.wait(figure_save_path)
+            except Exception:
+                failed_figures.append(figure_save_path)
+
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+
+        self.figures = {}
+
+        return failed_figures
@@ -1,7 +1,10 @@
 from typing import Dict, Union
+import numpy as np
 import pandas as pd
 from os import listdir
 
+from eye_tracking_package.data_cache import DataCache
+
 
 class TobiiData:
     """
@@ -16,6 +19,9 @@ class TobiiData:
     EVENT_LABEL = 'Event'
     SECONDS_LABEL = 'Seconds'
 
+    # number of rows of the .tsv files that are read at once
+    CHUNK_SIZE = 100000
+
     def __init__(self, parameters_dictionary: Dict[str, Union[str, int]]):
         """
         Args:
@@ -34,30 +40,57 @@ class TobiiData:
             and the times in the 'Seconds' column.
         """
 
-        # create a data frame from the .tsv file
-        tobii_df = pd.read_csv(tsv_file_path, sep='\t')
+        # read only the relevant columns of the .tsv file in chunks of rows,
+        # so that the memory used does not depend on the size of the Tobii export
+        chunks = pd.read_csv(tsv_file_path,
+                             sep='\t',
+                             usecols=[self.TIMESTAMPS_LABEL, self.EVENT_LABEL, self.PARTICIPANTS_LABEL],
+                             dtype={self.TIMESTAMPS_LABEL: np.float64,
+                                    self.EVENT_LABEL: object,
+                                    self.PARTICIPANTS_LABEL: object},
+                             chunksize=self.CHUNK_SIZE
+                             )
+
+        # keep only the rows of each chunk that describe a task
+        tasks_chunks = []
+        for chunk in chunks:
+            chunk = chunk.dropna()
+            tasks_chunks.append(chunk[chunk[self.EVENT_LABEL].str.contains('Task')])
 
         # create a data frame with the relevant columns, i.e. 'Recording timestamp', 'Event',
         # and 'Participant name' as index
-        timestamps = tobii_df[self.TIMESTAMPS_LABEL]
-        events = tobii_df[self.EVENT_LABEL]
-        participants = tobii_df[self.PARTICIPANTS_LABEL]
-        tasks_times_df = pd.concat([timestamps, events, participants], axis=1)
+        columns = [self.TIMESTAMPS_LABEL, self.EVENT_LABEL, self.PARTICIPANTS_LABEL]
+        if tasks_chunks:
+            tasks_times_df = pd.concat(tasks_chunks)[columns]
+        else:
+            tasks_times_df = pd.DataFrame(columns=columns)
         tasks_times_df.set_index(self.PARTICIPANTS_LABEL, inplace=True)
 
-        # delete all irrelevant rows and keep only the ones that describes a task
-        tasks_times_df = tasks_times_df.dropna()
-        tasks_times_df = tasks_times_df[tasks_times_df[self.EVENT_LABEL].str.contains('Task')]
-
         # convert the timestamp, that are in microseconds, in seconds and create a new column
-        microseconds = tasks_times_df[self.TIMESTAMPS_LABEL].to_numpy()
+        microseconds = tasks_times_df[self.TIMESTAMPS_LABEL].to_numpy(dtype=np.float64)
         seconds = microseconds / 1000000
         tasks_times_df[self.SECONDS_LABEL] = seconds
 
         return tasks_times_df
 
+    def load_dataframe(self, tsv_file_path: str) -> pd.DataFrame:
+        """
+        Args:
+            tsv_file_path: Path to the .tsv file that contains the Tobii data.
+
+        Returns:
+            Data frame which has the participants as index, the tasks in the 'Event' column
+            and the times in the 'Seconds' column, loaded from the data cache
+            if the file did not change since it was last parsed.
+        """
+
+        return DataCache().load(tsv_file_path, self.make_dataframe)
+
     @ classmethod
-    def make_main_dataframe(cls, parameters_dictionary: Dict[str, Union[str, int]]) -> pd.DataFrame:
+    def make_main_dataframe(cls,
+                            parameters_dictionary: Dict[str, Union[str, int]],
+                            use_cache: bool = True
+                            ) -> pd.DataFrame:
         """
         Create a data frame that contains the relevant data from Tobii, i.e. 'Participant name', 'Event' of the tasks,
         and times in 'Seconds'.
@@ -67,6 +100,7 @@ class TobiiData:
 
         Args:
             parameters_dictionary: Dictionary of all input parameters (key = parameter name, value = parameter value).
+            use_cache (optional): True if the data frames are loaded from the data cache when the files did not change.
 
         Returns:
             Data frame which has the participants as index, the tasks in the 'Event' column
@@ -75,31 +109,40 @@ class TobiiData:
 
         tobii = cls(parameters_dictionary)
 
+        # function that creates a data frame from a file, either through the data cache or by always parsing it
+        load = tobii.load_dataframe if use_cache else tobii.make_dataframe
+
         # list of all files stored in the directory 'Inputs/Data'
         files = listdir('Inputs/Tobii_data')
 
         # create directly a data frame with .tsv files of all participants if there is one
         if 'All_participants.tsv' in files:
-            tobii_df = tobii.make_dataframe('Inputs/Tobii_data/All_participants.tsv')
+            tobii_df = load('Inputs/Tobii_data/All_participants.tsv')
 
         # create a data frame with the .tsv files provided for the different participants
         else:
-            # main data frame that will contain the data of all participants
-            tobii_df = pd.DataFrame()
+            # list of the data frames with the Tobii data of each participant
+            participants_dfs = []
 
             # create a data frame with the Tobii data of each participants
-            # and append it to the main data frame
+            # and add it to the list
             for i in range(16):
                 try:
-                    participant_df = tobii.make_dataframe('Inputs/Tobii_data/Participant{}.tsv'.format(i))
+                    participant_df = load('Inputs/Tobii_data/Participant{}.tsv'.format(i))
                     indexes = ['Participant{}'.format(i)] * len(participant_df)
                     participant_df.index = indexes
-                    tobii_df = tobii_df.append(participant_df)
+                    participants_dfs.append(participant_df)
 
                 # do nothing if no file is provided for a participant
                 except FileNotFoundError:
                     pass
 
+            # main data frame that contains the data of all participants, concatenated at once
+            if participants_dfs:
+                tobii_df = pd.concat(participants_dfs, sort=False)
+            else:
+                tobii_df = pd.DataFrame()
+
         # create an empty with the relevant columns if no .tsv file was provided
         if tobii_df.empty:
             tobii_df = pd.DataFrame(columns=[tobii.EVENT_LABEL, tobii.SECONDS_LABEL])
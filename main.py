@@ -1,10 +1,18 @@
 from docx import Document
 from docx.enum.section import WD_SECTION
 import os
-import win32com.client
+import argparse
 import inspect
 import time
 
+# Word is only used in the optional last step that adds the page numbers to the table of content
+# and to the list of figures, all fields are resolved when the report is written,
+# pypiwin32 is an optional requirement that is only needed for this step
+try:
+    import win32com.client
+except ImportError:
+    win32com = None
+
 from docx_package.layout import Layout
 from docx_package.chapter import Chapter
 from docx_package.effectiveness_analysis import EffectivenessAnalysis
@@ -18,13 +26,21 @@ from docx_package.average_fixation import AverageFixation
 from docx_package.transitions import Transitions
 from docx_package.parameters import Parameters
 from docx_package.picture import Picture
+from docx_package.image_metadata import ImageMetadataCache
+from docx_package.picture_index import PictureIndex
+from docx_package.picture_preprocessor import PicturePreprocessor
 from docx_package.document_history import DocumentHistory
 from docx_package.participants_characteristics import ParticipantsCharacteristics
-from docx_package.dropdown_lists import DropDownLists
+from docx_package.input_form import InputForm
 from docx_package.use_scenarios import UseScenarios
+from docx_package.fields import Fields
+from docx_package.figure_captions import FigureCaptions
 
 from eye_tracking_package.cGOM_data import cGOM
 from eye_tracking_package.tobii_data import TobiiData
+from eye_tracking_package.participant_metrics import ParticipantMetrics
+from eye_tracking_package.plot import Plot
+from eye_tracking_package.plot_scheduler import PlotScheduler
 
 
 def update(report_file):
@@ -47,13 +63,31 @@ def update(report_file):
     word.Quit()
 
 
-def main():
+def main(update_with_word: bool = False, verbose: bool = False):
+    """
+    Write the report.
+
+    Args:
+        update_with_word (optional): True if the fields of the report are updated through Word at the end,
+                                     to add the page numbers to the table of content and to the list of figures.
+        verbose (optional): True if debugging information is printed, e.g. the number of table scans.
+    """
 
     main_start = time.time()
 
     # file name of the report
     report_file = 'Report.docx'
 
+    # number of processes used to read the input data and render the plots
+    workers = os.cpu_count()
+
+    # the plots are only saved to be added to the report, they are not shown in windows
+    Plot.use_batch_backend()
+    Plot.set_headless()
+
+    # scheduler that renders the plots of the chapters on a pool of processes
+    plot_scheduler = PlotScheduler(workers)
+
     # create the report document
     report = Document()
 
@@ -61,94 +95,28 @@ def main():
     text_input_path = 'Inputs/Text_input_form.docx'
     definitions_path = 'Inputs/Terms_definitions.docx'
 
-    # load text input files with python-docx
-    text_input = Document(text_input_path)
+    # load the text input form, indexed by table names and headings, and the definitions with python-docx
+    input_form = InputForm(text_input_path)
     definitions = Document(definitions_path)
 
-    # path to the pictures that must be added to the report
-    picture_paths = Picture.get_picture_paths()
-
-    # soup of the text input form document
-    text_input_soup = DropDownLists.get_soup(text_input_path)
-
-    # list of all tables in the order they appear in the text input document,
-    # this is used to get the index of a table in the document
-    tables = [
-        'Study table',
-        'Title table',
-        'Approval table',
-        'Cover page caption table',
-        'Header table',
-        'Purpose text table',
-        'Purpose parameter table',
-        'Purpose caption table',
-        'Background text table',
-        'Background parameter table',
-        'Background caption table',
-        'Scope text table',
-        'Scope parameter table',
-        'Scope caption table',
-        'EU Regulation 2017/745 definitions table',
-        'IEC 62366-1 definitions table',
-        'FDA Guidance definitions table',
-        'Ethics statement text table',
-        'Ethics statement parameter table',
-        'Ethics statement caption table',
-        'Device specifications text table',
-        'Device specifications parameter table',
-        'Device specifications caption table',
-        'Goal text table',
-        'Goal parameter table',
-        'Goal caption table',
-        'Participants text table',
-        'Participants parameter table',
-        'Participants caption table',
-        'Use environment text table',
-        'Use environment parameter table',
-        'Use environment caption table',
-        'Use scenarios text table',
-        'Use scenarios parameter table',
-        'Use scenarios caption table',
-        'Setup text table',
-        'Setup parameter table',
-        'Setup caption table',
-        'Critical tasks description table',
-        'Effectiveness analysis decision table',
-        'Effectiveness analysis tasks and problems table',
-        'Effectiveness analysis problem type table',
-        'Effectiveness analysis text table',
-        'Effectiveness analysis parameter table',
-        'Effectiveness analysis caption table',
-        'Time on tasks decision table',
-        'Time on tasks plot type table',
-        'Time on tasks table',
-        'Time on tasks text table',
-        'Time on tasks parameter table',
-        'Time on tasks caption table',
-        'Dwell times and revisits decision table',
-        'Dwell times and revisits text table',
-        'Dwell times and revisits parameter table',
-        'Dwell times and revisits caption table',
-        'Average fixation decision table',
-        'Average fixation plot type table',
-        'Average fixation text table',
-        'Average fixation parameter table',
-        'Average fixation caption table',
-        'Transitions decision table',
-        'Transitions text table',
-        'Transitions parameter table',
-        'Transitions caption table',
-        'Conclusion text table',
-        'Conclusion parameter table',
-        'Conclusion caption table',
-        'Participants characteristics table'
-    ]
+    # index of the pictures that must be added to the report, downsampled to the resolution they are printed at,
+    # the header of each picture is read once and its metadata is shared by the index and the preprocessing
+    image_metadata = ImageMetadataCache()
+    picture_index = PictureIndex(Picture.get_picture_paths(),
+                                 PicturePreprocessor(workers, metadata_cache=image_metadata),
+                                 image_metadata)
+
+    # captions of the figures of the report, numbered in the order they are added
+    figure_captions = FigureCaptions()
 
     # parameters needed to write the report
-    parameters = Parameters.get_all(text_input, text_input_soup, tables)
+    parameters = Parameters.get_all(input_form)
 
     # list of data frames that contain the cGOM data
-    cGOM_dataframes = cGOM.make_dataframes_list()
+    cGOM_dataframes = cGOM.make_dataframes_list(workers)
+
+    # metrics of the cGOM data of each participant, shared by the eye tracking chapters
+    participants_metrics = ParticipantMetrics.make_metrics_list(cGOM_dataframes)
 
     # data frame that contain the Tobii data
     tobii_data = TobiiData.make_main_dataframe(parameters)
@@ -162,7 +130,7 @@ def main():
     Layout.define_page_format(section1)
 
     cover_page_start = time.time()
-    cover_page = CoverPage(report, text_input, tables, picture_paths, parameters)
+    cover_page = CoverPage(report, input_form, picture_index, figure_captions, parameters)
     cover_page.create()
 
     '''
@@ -187,73 +155,73 @@ def main():
     header = Header(section2, parameters)
     header.write()
 
-    purpose = Chapter(report, text_input, text_input_soup, 'Purpose', tables, picture_paths, parameters)
+    purpose = Chapter(report, input_form, 'Purpose', picture_index, figure_captions, parameters)
     purpose.write_chapter()
 
-    background = Chapter(report, text_input, text_input_soup, 'Background', tables, picture_paths, parameters)
+    background = Chapter(report, input_form, 'Background', picture_index, figure_captions, parameters)
     background.write_chapter()
 
-    scope = Chapter(report, text_input, text_input_soup, 'Scope', tables, picture_paths, parameters)
+    scope = Chapter(report, input_form, 'Scope', picture_index, figure_captions, parameters)
     scope.write_chapter()
 
-    Definitions.write_all_definitions(report, text_input, text_input_soup, definitions, tables)
+    Definitions.write_all_definitions(report, input_form, definitions)
 
-    ethics = Chapter(report, text_input, text_input_soup, 'Ethics statement', tables, picture_paths, parameters)
+    ethics = Chapter(report, input_form, 'Ethics statement', picture_index, figure_captions, parameters)
     ethics.write_chapter()
 
-    device = Chapter(report, text_input, text_input_soup, 'Device specifications', tables, picture_paths, parameters)
+    device = Chapter(report, input_form, 'Device specifications', picture_index, figure_captions, parameters)
     device.write_chapter()
 
     report.add_paragraph('Test procedure', 'Heading 1')
 
-    goal = Chapter(report, text_input, text_input_soup, 'Goal', tables, picture_paths, parameters)
+    goal = Chapter(report, input_form, 'Goal', picture_index, figure_captions, parameters)
     goal.write_chapter()
 
-    participants = Chapter(report, text_input, text_input_soup, 'Participants', tables, picture_paths, parameters)
+    participants = Chapter(report, input_form, 'Participants', picture_index, figure_captions, parameters)
     participants.write_chapter()
 
-    environment = Chapter(report, text_input, text_input_soup, 'Use environment', tables, picture_paths, parameters)
+    environment = Chapter(report, input_form, 'Use environment', picture_index, figure_captions, parameters)
     environment.write_chapter()
 
-    scenarios = UseScenarios(report, text_input, text_input_soup, 'Use scenarios', tables, picture_paths, parameters)
+    scenarios = UseScenarios(report, input_form, 'Use scenarios', picture_index, figure_captions, parameters)
     scenarios.write_chapter()
 
-    setup = Chapter(report, text_input, text_input_soup, 'Setup', tables, picture_paths, parameters)
+    setup = Chapter(report, input_form, 'Setup', picture_index, figure_captions, parameters)
     setup.write_chapter()
 
     report.add_paragraph('Results', 'Heading 1')
 
     start1 = time.time()
-    effectiveness_analysis = EffectivenessAnalysis(report, text_input, text_input_soup, tables, picture_paths, parameters)
+    effectiveness_analysis = EffectivenessAnalysis(report, input_form, picture_index, figure_captions, parameters)
     effectiveness_analysis.write_chapter()
     end1 = time.time()
     print('Effectiveness analysis: ', end1-start1)
 
     start2 = time.time()
-    time_on_tasks = TimeOnTasks(report, text_input, text_input_soup, tables, picture_paths, parameters, tobii_data)
+    time_on_tasks = TimeOnTasks(report, input_form, picture_index, figure_captions, parameters, tobii_data, plot_scheduler)
     time_on_tasks.write_chapter()
     end2 = time.time()
     print('Time on tasks: ', end2-start2)
 
     start3 = time.time()
-    dwell_times_and_revisits = DwellTimesAndRevisits(report, text_input, text_input_soup, tables, picture_paths, parameters, cGOM_dataframes)
+    dwell_times_and_revisits = DwellTimesAndRevisits(report, input_form, picture_index, figure_captions, parameters, participants_metrics, plot_scheduler)
     dwell_times_and_revisits.write_chapter()
     end3 = time.time()
     print('Dwell times: ', end3-start3)
     
     start4 = time.time()
-    average_fixation = AverageFixation(report, text_input, text_input_soup, tables, picture_paths, parameters, cGOM_dataframes)
+    average_fixation = AverageFixation(report, input_form, picture_index, figure_captions, parameters, participants_metrics, plot_scheduler)
     average_fixation.write_chapter()
     end4 = time.time()
     print('Average fixation: ', end4-start4)
 
     start5 = time.time()
-    transitions = Transitions(report, text_input, text_input_soup, tables, picture_paths, parameters, cGOM_dataframes)
+    transitions = Transitions(report, input_form, picture_index, figure_captions, parameters, participants_metrics, plot_scheduler)
     transitions.write_chapter()
     end5 = time.time()
     print('Transitions: ', end5-start5)
 
-    conclusion = Chapter(report, text_input, text_input_soup, 'Conclusion', tables, picture_paths, parameters)
+    conclusion = Chapter(report, input_form, 'Conclusion', picture_index, figure_captions, parameters)
     conclusion.write_chapter()
 
     DocumentHistory.write(report)
@@ -264,7 +232,7 @@ def main():
 
     report.add_paragraph('Appendix', 'Heading 1')
 
-    Definitions.write_references(report, text_input, text_input_soup, definitions, tables)
+    Definitions.write_references(report, input_form, definitions)
 
     report.add_page_break()
 
@@ -272,26 +240,51 @@ def main():
 
     report.add_page_break()
 
-    ParticipantsCharacteristics.write(report, text_input, tables, parameters)
+    ParticipantsCharacteristics.write(report, input_form, parameters)
+
+    # write the table of content and the list of figures
+    Fields.update(report, figure_captions)
 
     # save the report
     report.save(report_file)
 
-    # error message for the image files that were not added to the report
-    '''Picture.error_message(picture_paths)'''
+    if verbose:
+        print('Table scans: ', input_form.table_scans)
+
+    # wait for the plots that are not added to the report, e.g. the plots of each participant
+    failed_figures = plot_scheduler.close()
+    if failed_figures:
+        print('These figures could not be created:')
+        for figure_path in failed_figures:
+            print('   ', figure_path)
 
-    start6 = time.time()
-    # update the table of content
-    update(report_file)
-    end6 = time.time()
-    print('Update: ', end6 - start6)
+    # error message for the image files that were not added to the report
+    '''Picture.error_message(picture_index)'''
+
+    # update the table of content and the list of figures through Word to add their page numbers
+    if update_with_word:
+        if win32com is None:
+            print('The fields cannot be updated through Word because pypiwin32 is not installed.')
+        else:
+            start6 = time.time()
+            update(report_file)
+            end6 = time.time()
+            print('Update: ', end6 - start6)
 
     # open the report with the default application for .docx (Word)
-    os.startfile(report_file)
+    if hasattr(os, 'startfile'):
+        os.startfile(report_file)
 
     end = time.time()
     print(end - main_start)
 
 
 if __name__ == '__main__':
-    main()
+    parser = argparse.ArgumentParser(description='Generate the usability testing report.')
+    parser.add_argument('--update-with-word', action='store_true',
+                        help='update the fields of the report through Word to add the page numbers '
+                             'to the table of content and to the list of figures (requires pypiwin32)')
+    parser.add_argument('--verbose', action='store_true',
+                        help='print debugging information, e.g. the number of times the input tables are scanned')
+    arguments = parser.parse_args()
+    main(arguments.update_with_word, arguments.verbose)